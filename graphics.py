@@ -91,6 +91,10 @@ class PetGraphics:
         self.tail_wag_phase = 0
         self.particle_phase = 0.0
 
+        # Persistent shadow item, moved instead of recreated each frame
+        self._shadow_item: Optional[int] = None
+        self._last_shadow_y: Optional[int] = None
+
         # Effect items
         self.effects: list[int] = []
 
@@ -129,8 +133,8 @@ class PetGraphics:
         self._update_colors()
 
     def clear(self) -> None:
-        """Clear all drawn items from canvas."""
-        self.canvas.delete("all")
+        """Clear all drawn items from canvas (the shadow is kept and reused)."""
+        self.canvas.delete("!shadow")
         self.body_items.clear()
         self.eye_items.clear()
         self.mouth_item = None
@@ -1042,9 +1046,11 @@ class PetGraphics:
         # Glowing white/blue eyes - pulse effect, centered
         glow_pulse = 2 + math.sin(phase * 3) * 2
         eye_y = cy - s * 0.12
+        glow_top, glow_bottom = eye_y - 6 - glow_pulse, eye_y + 6 + glow_pulse
+        glow_half_w = 8 + glow_pulse
         for offset in [-s * 0.18, s * 0.18]:
             # Glow effect
-            self.canvas.create_oval(cx + offset - 8 - glow_pulse, eye_y - 6 - glow_pulse, cx + offset + 8 + glow_pulse, eye_y + 6 + glow_pulse, fill=white, outline="")
+            self.canvas.create_oval(cx + offset - glow_half_w, glow_top, cx + offset + glow_half_w, glow_bottom, fill=white, outline="")
             if not sleeping:
                 # Eye core
                 self.canvas.create_oval(cx + offset - 5, eye_y - 4, cx + offset + 5, eye_y + 4, fill="#87CEEB", outline="")
@@ -1132,16 +1138,17 @@ class PetGraphics:
         """Draw glowing mystic eyes."""
         eye_y = cy
         eye_spacing = s * 0.18
+        body = self.body_color
         for offset in [-eye_spacing, eye_spacing]:
             # Glow
             self.canvas.create_oval(cx + offset - 7, eye_y - 7, cx + offset + 7, eye_y + 7, fill=glow_color, outline="")
             if sleeping:
-                self.canvas.create_arc(cx + offset - 5, eye_y - 2, cx + offset + 5, eye_y + 4, start=0, extent=-180, style=tk.ARC, outline=self.body_color, width=2)
+                self.canvas.create_arc(cx + offset - 5, eye_y - 2, cx + offset + 5, eye_y + 4, start=0, extent=-180, style=tk.ARC, outline=body, width=2)
             elif happy:
-                self.canvas.create_arc(cx + offset - 5, eye_y - 4, cx + offset + 5, eye_y + 6, start=0, extent=180, style=tk.ARC, outline=self.body_color, width=2)
+                self.canvas.create_arc(cx + offset - 5, eye_y - 4, cx + offset + 5, eye_y + 6, start=0, extent=180, style=tk.ARC, outline=body, width=2)
             else:
                 self.canvas.create_oval(cx + offset - 5, eye_y - 5, cx + offset + 5, eye_y + 5, fill="white", outline="")
-                self.canvas.create_oval(cx + offset - 2, eye_y - 2, cx + offset + 2, eye_y + 2, fill=self.body_color, outline="")
+                self.canvas.create_oval(cx + offset - 2, eye_y - 2, cx + offset + 2, eye_y + 2, fill=body, outline="")
 
     def _draw_dragon_eyes(self, cx, cy, s, sleeping=False, happy=False, sad=False):
         """Draw dragon eyes with golden irises and slit pupils."""
@@ -1184,11 +1191,18 @@ class PetGraphics:
     # ==================== EFFECT HELPER METHODS ====================
 
     def _draw_shadow(self):
-        """Draw shadow beneath pet."""
-        shadow_y = self.center_y + self.body_size + 10 - self.bounce_offset * 0.5
+        """Draw shadow beneath pet, skipping the Tk call if it hasn't moved."""
+        shadow_y = int(self.center_y + self.body_size + 10 - self.bounce_offset * 0.5)
+        if shadow_y == self._last_shadow_y and self._shadow_item is not None:
+            return
         shadow_width = self.body_size * 0.8
         shadow_height = 8
-        self.canvas.create_oval(self.center_x - shadow_width, shadow_y - shadow_height, self.center_x + shadow_width, shadow_y + shadow_height, fill="#D4D4D4", outline="")
+        coords = (self.center_x - shadow_width, shadow_y - shadow_height, self.center_x + shadow_width, shadow_y + shadow_height)
+        if self._shadow_item is None:
+            self._shadow_item = self.canvas.create_oval(*coords, fill="#D4D4D4", outline="", tags="shadow")
+        else:
+            self.canvas.coords(self._shadow_item, *coords)
+        self._last_shadow_y = shadow_y
 
     def _draw_hearts(self):
         """Draw floating hearts around pet."""
@@ -54,7 +54,10 @@ from graphics.evolution_sprites import (
     EvolutionSpriteRenderer,
     EvolutionStage,
     FormAppearance,
+    FeatureFlag,
+    FormId,
     FORM_APPEARANCES,
+    FORM_IDS,
     get_stage_scale,
 )
 
@@ -63,6 +66,7 @@ from graphics.effects import (
     draw_glow,
     draw_pulsing_glow,
     draw_shadow,
+    draw_shadow_default,
     draw_thought_bubble,
     draw_stat_icon,
     draw_stat_bar,
@@ -73,6 +77,7 @@ from graphics.effects import (
     draw_sweat_drops,
     draw_music_notes,
     draw_food_crumbs,
+    draw_confetti,
     StatType,
     EffectState,
     Effects,
@@ -108,12 +113,16 @@ __all__ = [
     "EvolutionSpriteRenderer",
     "EvolutionStage",
     "FormAppearance",
+    "FeatureFlag",
+    "FormId",
     "FORM_APPEARANCES",
+    "FORM_IDS",
     "get_stage_scale",
     # Effects
     "draw_glow",
     "draw_pulsing_glow",
     "draw_shadow",
+    "draw_shadow_default",
     "draw_thought_bubble",
     "draw_stat_icon",
     "draw_stat_bar",
@@ -124,6 +133,7 @@ __all__ = [
     "draw_sweat_drops",
     "draw_music_notes",
     "draw_food_crumbs",
+    "draw_confetti",
     "StatType",
     "EffectState",
     "Effects",
@@ -11,11 +11,13 @@ Provides visual effects for enhancing the blob sprites:
 
 from __future__ import annotations
 
+import functools
 import math
 import tkinter as tk
-from dataclasses import dataclass
+import tkinter.font as tkfont
+from array import array
 from enum import Enum, auto
-from typing import List, Optional, Tuple
+from typing import Dict, Hashable, List, Optional, Tuple
 
 from graphics.sprites import lighten_color, darken_color
 
@@ -41,6 +43,21 @@ except ImportError:
         HAPPINESS_BAR = "#FFF3B0"
         ENERGY_BAR = "#A2D2FF"
 
+# Optional: PIL lets particle effects be composited into a single image
+try:
+    from PIL import Image, ImageDraw, ImageFont, ImageTk
+except ImportError:
+    Image = None
+
+# Optional: NumPy vectorizes position math for large particle counts
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Particle count from which the NumPy path beats a plain Python loop
+_NUMPY_MIN_COUNT = 10
+
 
 class StatType(Enum):
     """Types of stats that can be displayed."""
@@ -67,6 +84,132 @@ STAT_COLORS = {
 }
 
 
+@functools.lru_cache(maxsize=256)
+def _glow_layer_color(color: str, layer: int) -> str:
+    """Get the (cached) fill color for a glow layer (1 = innermost)."""
+    return lighten_color(color, 0.1 + (layer - 1) * 0.2)
+
+
+# Warm the cache for the palette colors glows are normally drawn in
+for _color in (
+    Colors.SOFT_PINK, Colors.SOFT_BLUE, Colors.SOFT_PURPLE,
+    Colors.SOFT_GREEN, Colors.SOFT_YELLOW, Colors.SOFT_ORANGE,
+):
+    for _layer in range(1, 6):
+        _glow_layer_color(_color, _layer)
+del _color, _layer
+
+
+_TAU = 2.0 * math.pi
+
+# Canvas tags: every effect item carries EFFECT_TAG plus a per-type tag
+# (e.g. "floob_effect_hearts"); items Effects keeps alive across frames
+# also carry PERSISTENT_EFFECT_TAG.
+EFFECT_TAG = "floob_effect"
+PERSISTENT_EFFECT_TAG = "floob_effect_persistent"
+
+_TAGS: Dict[str, Tuple[str, ...]] = {
+    kind: (EFFECT_TAG, f"{EFFECT_TAG}_{kind}")
+    for kind in (
+        "glow", "shadow", "bubble", "stat", "burst", "stars", "particles",
+        "hearts", "zzz", "sparkles", "sweat", "music", "crumbs", "confetti",
+    )
+}
+
+# Named Tk fonts, keyed by (Tk interpreter, font tuple)
+_tk_fonts: Dict[Tuple[object, tuple], tkfont.Font] = {}
+
+# Font tuples used by the effect text items
+_EFFECT_FONTS = (
+    ("Arial", 9),
+    ("Arial", 10),
+    ("Arial", 12),
+    ("Arial", 14),
+    ("Arial", 8, "bold"),
+    ("Arial", 10, "bold"),
+    ("Arial", 12, "bold"),
+    ("Segoe UI Emoji", 9),
+    ("Segoe UI Emoji", 12),
+)
+
+
+def _get_font(canvas: tk.Canvas, spec: tuple):
+    """
+    Get a cached named Tk font for a font tuple like ("Arial", 10, "bold").
+
+    Passing a named font spares Tk from parsing the font description on
+    every create_text call. Canvas stand-ins without a Tk interpreter
+    (such as _ParticleRecorder) get the tuple back unchanged.
+    """
+    interp = getattr(canvas, "tk", None)
+    if interp is None:
+        return spec
+    key = (interp, spec)
+    font = _tk_fonts.get(key)
+    if font is None:
+        font = tkfont.Font(
+            root=canvas,
+            family=spec[0],
+            size=spec[1],
+            weight=spec[2] if len(spec) > 2 else "normal",
+        )
+        _tk_fonts[key] = font
+    return font
+
+
+@functools.lru_cache(maxsize=32)
+def _angle_table(spacing: float, count: int) -> Tuple[Tuple[float, float], ...]:
+    """
+    Get (cos, sin) pairs for the angles ``i * spacing``, i in range(count).
+
+    Particle loops add a per-frame phase to these fixed offsets, which the
+    angle-sum identities turn into a single sin/cos per frame.
+    """
+    return tuple((math.cos(i * spacing), math.sin(i * spacing)) for i in range(count))
+
+
+def _unit_circle(count: int) -> Tuple[Tuple[float, float], ...]:
+    """Get unit vectors for ``count`` evenly spaced angles."""
+    return _angle_table(_TAU / count, count)
+
+
+# "#RRGGBB" strings for every gray level, indexed by level (0-255)
+_GRAY_HEX = tuple(f"#{i:02x}{i:02x}{i:02x}" for i in range(256))
+
+
+# Thought bubble (fill, text, border) colors per opacity bucket
+_BUBBLE_OPACITY_STEPS = 20
+_bubble_colors: Dict[int, Tuple[str, str, str]] = {}
+
+
+def _get_bubble_colors(opacity: float) -> Tuple[str, str, str]:
+    """
+    Get thought bubble colors for an opacity, quantized to 0.05 steps.
+
+    Args:
+        opacity: Bubble opacity (0.0-1.0).
+
+    Returns:
+        Tuple of (fill, text, border) hex colors.
+    """
+    bucket = round(max(0.0, min(1.0, opacity)) * _BUBBLE_OPACITY_STEPS)
+    colors = _bubble_colors.get(bucket)
+    if colors is None:
+        opacity = bucket / _BUBBLE_OPACITY_STEPS
+        colors = (
+            _GRAY_HEX[int(255 * (1 - opacity) + 245 * opacity)],
+            _GRAY_HEX[int(255 * (1 - opacity) + 64 * opacity)],
+            _GRAY_HEX[int(255 * (1 - opacity) + 200 * opacity)],
+        )
+        _bubble_colors[bucket] = colors
+    return colors
+
+
+for _bucket in range(_BUBBLE_OPACITY_STEPS + 1):
+    _get_bubble_colors(_bucket / _BUBBLE_OPACITY_STEPS)
+del _bucket
+
+
 def draw_glow(
     canvas: tk.Canvas,
     x: float,
@@ -75,12 +218,14 @@ def draw_glow(
     color: str,
     intensity: float = 1.0,
     layers: int = 3,
+    reuse: Optional[List[int]] = None,
+    recolor: bool = True,
 ) -> List[int]:
     """
     Draw a soft glow effect.
 
-    Creates multiple layered ovals with decreasing opacity
-    to simulate a glowing effect.
+    Approximates layered glow ovals of decreasing opacity with at most
+    two stippled ovals: the outermost layer and the innermost one.
 
     Args:
         canvas: Tkinter canvas to draw on.
@@ -90,22 +235,44 @@ def draw_glow(
         color: Glow color in hex format.
         intensity: Glow intensity (0.0-1.0).
         layers: Number of glow layers.
+        reuse: Items from a previous call to move instead of recreating.
+        recolor: Whether reused items need their fill updated.
 
     Returns:
-        List of canvas item IDs created.
+        List of canvas item IDs created (or reused).
     """
+    # (layer, stipple) pairs, drawn outermost first
+    if layers > 1:
+        glow_layers = ((layers, "gray50"), (1, "gray25"))
+    else:
+        glow_layers = ((1, ""),)
+
+    if reuse is not None and len(reuse) == len(glow_layers):
+        for glow_id, (i, _) in zip(reuse, glow_layers):
+            layer_radius = radius * (1 + (i - 1) * 0.3)
+            canvas.coords(
+                glow_id,
+                x - layer_radius, y - layer_radius,
+                x + layer_radius, y + layer_radius,
+            )
+            if recolor:
+                canvas.itemconfigure(glow_id, fill=_glow_layer_color(color, i))
+        return reuse
+
     items = []
 
-    for i in range(layers, 0, -1):
-        # Each layer is larger but more transparent
+    for i, stipple in glow_layers:
+        # Outer layer is larger and more transparent
         layer_radius = radius * (1 + (i - 1) * 0.3)
-        layer_color = lighten_color(color, 0.1 + (i - 1) * 0.2)
+        layer_color = _glow_layer_color(color, i)
 
         glow_id = canvas.create_oval(
             x - layer_radius, y - layer_radius,
             x + layer_radius, y + layer_radius,
             fill=layer_color,
             outline="",
+            stipple=stipple,
+            tags=_TAGS["glow"],
         )
         items.append(glow_id)
 
@@ -120,6 +287,8 @@ def draw_pulsing_glow(
     color: str,
     phase: float,
     pulse_amount: float = 0.15,
+    reuse: Optional[List[int]] = None,
+    recolor: bool = True,
 ) -> List[int]:
     """
     Draw a pulsing glow effect.
@@ -132,15 +301,17 @@ def draw_pulsing_glow(
         color: Glow color in hex format.
         phase: Animation phase (0.0-2*pi for full cycle).
         pulse_amount: How much the glow pulses (0.0-1.0).
+        reuse: Items from a previous call to move instead of recreating.
+        recolor: Whether reused items need their fill updated.
 
     Returns:
-        List of canvas item IDs created.
+        List of canvas item IDs created (or reused).
     """
     # Calculate pulsing radius
     pulse = 1.0 + math.sin(phase) * pulse_amount
     radius = base_radius * pulse
 
-    return draw_glow(canvas, x, y, radius, color)
+    return draw_glow(canvas, x, y, radius, color, reuse=reuse, recolor=recolor)
 
 
 def draw_shadow(
@@ -167,24 +338,64 @@ def draw_shadow(
     """
     items = []
 
+    # Integer coordinates keep the Tcl command strings short
+    x, y = int(x), int(y)
+    half_width = int(width) >> 1
     if height == 0.0:
-        height = width * 0.3
+        half_height = int(width * 0.15)
+    else:
+        half_height = int(height) >> 1
 
     # Shadow color based on opacity
-    gray_value = int(200 - opacity * 80)
-    shadow_color = f"#{gray_value:02x}{gray_value:02x}{gray_value:02x}"
+    shadow_color = _GRAY_HEX[int(200 - opacity * 80)]
 
     shadow_id = canvas.create_oval(
-        x - width * 0.5, y - height * 0.5,
-        x + width * 0.5, y + height * 0.5,
+        x - half_width, y - half_height,
+        x + half_width, y + half_height,
         fill=shadow_color,
         outline="",
+        tags=_TAGS["shadow"],
     )
     items.append(shadow_id)
 
     return items
 
 
+def draw_shadow_default(
+    canvas: tk.Canvas,
+    x: float,
+    y: float,
+    width: float,
+    opacity: float = 0.2,
+) -> List[int]:
+    """
+    Draw an oval shadow with the default height (width * 0.3).
+
+    Specialized form of draw_shadow for the common case.
+
+    Args:
+        canvas: Tkinter canvas to draw on.
+        x: Center X coordinate of shadow.
+        y: Center Y coordinate of shadow.
+        width: Width of the shadow.
+        opacity: Shadow opacity (affects color darkness).
+
+    Returns:
+        List of canvas item IDs created.
+    """
+    x, y = int(x), int(y)
+    half_width = int(width) >> 1
+    half_height = int(width * 0.15)
+
+    return [canvas.create_oval(
+        x - half_width, y - half_height,
+        x + half_width, y + half_height,
+        fill=_GRAY_HEX[int(200 - opacity * 80)],
+        outline="",
+        tags=_TAGS["shadow"],
+    )]
+
+
 def draw_thought_bubble(
     canvas: tk.Canvas,
     x: float,
@@ -215,31 +426,31 @@ def draw_thought_bubble(
 
     # Adjust colors for opacity
     if opacity < 1.0:
-        gray_val = int(255 * (1 - opacity) + 245 * opacity)
-        fill_color = f"#{gray_val:02x}{gray_val:02x}{gray_val:02x}"
-        text_gray = int(255 * (1 - opacity) + 64 * opacity)
-        text_color = f"#{text_gray:02x}{text_gray:02x}{text_gray:02x}"
-        border_gray = int(255 * (1 - opacity) + 200 * opacity)
-        border_color = f"#{border_gray:02x}{border_gray:02x}{border_gray:02x}"
+        fill_color, text_color, border_color = _get_bubble_colors(opacity)
     else:
         fill_color = Colors.UI_BACKGROUND
         text_color = Colors.UI_TEXT
         border_color = Colors.UI_BORDER
 
+    # Integer coordinates keep the Tcl command strings short
+    x, y = int(x), int(y)
+    width, height = int(width), int(height)
+
     # Main bubble (rounded rectangle via oval)
     bubble_id = canvas.create_oval(
-        x - width * 0.5, y - height * 0.5,
-        x + width * 0.5, y + height * 0.5,
+        x - (width >> 1), y - (height >> 1),
+        x + (width >> 1), y + (height >> 1),
         fill=fill_color,
         outline=border_color,
         width=1,
+        tags=_TAGS["bubble"],
     )
     items.append(bubble_id)
 
     # Thought bubble dots (leading to pet)
     dot_positions = [
-        (x - width * 0.4, y + height * 0.6),
-        (x - width * 0.55, y + height * 0.85),
+        (x - width * 2 // 5, y + height * 3 // 5),
+        (x - width * 11 // 20, y + height * 17 // 20),
     ]
     for i, (dx, dy) in enumerate(dot_positions):
         size = 5 - i * 2
@@ -248,43 +459,38 @@ def draw_thought_bubble(
             dx + size, dy + size,
             fill=fill_color,
             outline=border_color,
+            tags=_TAGS["bubble"],
         )
         items.append(dot_id)
 
-    # Text content
+    # Text content: icon and text share one centered item (Segoe UI Emoji
+    # falls back to a regular font for the Latin glyphs)
     if icon:
-        # Icon + text layout
-        icon_id = canvas.create_text(
-            x - width * 0.25, y,
-            text=icon,
-            font=("Segoe UI Emoji", 12),
-            fill=text_color,
-        )
-        items.append(icon_id)
-
-        text_id = canvas.create_text(
-            x + width * 0.1, y,
-            text=text,
-            font=("Arial", 8),
-            fill=text_color,
-            anchor="w",
-            width=int(width * 0.5),
-        )
-        items.append(text_id)
+        label = f"{icon} {text}"
+        font = _get_font(canvas, ("Segoe UI Emoji", 9))
     else:
-        # Text only (centered)
-        text_id = canvas.create_text(
-            x, y,
-            text=text,
-            font=("Arial", 9),
-            fill=text_color,
-            width=int(width * 0.85),
-        )
-        items.append(text_id)
+        label = text
+        font = _get_font(canvas, ("Arial", 9))
+
+    text_id = canvas.create_text(
+        x, y,
+        text=label,
+        font=font,
+        fill=text_color,
+        width=width * 17 // 20,
+        tags=_TAGS["bubble"],
+    )
+    items.append(text_id)
 
     return items
 
 
+@functools.lru_cache(maxsize=16)
+def _stat_icon_font(size: float) -> Tuple[str, int]:
+    """Get the icon font tuple for a stat icon size."""
+    return ("Segoe UI Emoji", int(size * 0.6))
+
+
 def draw_stat_icon(
     canvas: tk.Canvas,
     x: float,
@@ -293,6 +499,7 @@ def draw_stat_icon(
     value: float,
     size: float = 20.0,
     show_bar: bool = True,
+    keep_fill: bool = False,
 ) -> List[int]:
     """
     Draw a small stat indicator icon with optional bar.
@@ -305,53 +512,83 @@ def draw_stat_icon(
         value: Current stat value (0-100).
         size: Icon size.
         show_bar: Whether to show a progress bar.
+        keep_fill: Create the fill bar even when empty, so it can be
+            resized later with coords().
 
     Returns:
         List of canvas item IDs created.
     """
     items = []
 
-    icon = STAT_ICONS.get(stat_type, "\u2022")
-    color = STAT_COLORS.get(stat_type, Colors.SOFT_GRAY)
+    # Integer coordinates keep the Tcl command strings short
+    x, y = int(x), int(y)
+
+    # StatType is closed and both tables cover every member
+    icon = STAT_ICONS[stat_type]
+    color = STAT_COLORS[stat_type]
 
     # Draw icon
     icon_id = canvas.create_text(
         x, y,
         text=icon,
-        font=("Segoe UI Emoji", int(size * 0.6)),
+        font=_get_font(canvas, _stat_icon_font(size)),
         fill=color,
+        tags=_TAGS["stat"],
     )
     items.append(icon_id)
 
     if show_bar:
         # Draw mini progress bar below icon
-        bar_width = size * 1.2
-        bar_height = size * 0.2
-        bar_y = y + size * 0.5
+        bar_half_width = int(size * 0.6)
+        bar_half_height = int(size * 0.1)
+        bar_y = y + (int(size) >> 1)
 
         # Background bar
         bg_id = canvas.create_rectangle(
-            x - bar_width * 0.5, bar_y - bar_height * 0.5,
-            x + bar_width * 0.5, bar_y + bar_height * 0.5,
+            x - bar_half_width, bar_y - bar_half_height,
+            x + bar_half_width, bar_y + bar_half_height,
             fill=Colors.SOFT_GRAY,
             outline="",
+            tags=_TAGS["stat"],
         )
         items.append(bg_id)
 
         # Fill bar
-        fill_width = bar_width * (value / 100.0)
-        if fill_width > 0:
+        if value > 0 or keep_fill:
             fill_id = canvas.create_rectangle(
-                x - bar_width * 0.5, bar_y - bar_height * 0.5,
-                x - bar_width * 0.5 + fill_width, bar_y + bar_height * 0.5,
+                *_stat_icon_fill_coords(x, y, size, value),
                 fill=color,
                 outline="",
+                tags=_TAGS["stat"],
             )
             items.append(fill_id)
 
     return items
 
 
+def _stat_icon_fill_coords(
+    x: float,
+    y: float,
+    size: float,
+    value: float,
+) -> Tuple[float, float, float, float]:
+    """Get the (integer) fill rectangle of a stat icon's mini bar."""
+    x, y = int(x), int(y)
+    bar_half_width = int(size * 0.6)
+    bar_half_height = int(size * 0.1)
+    bar_y = y + (int(size) >> 1)
+    left = x - bar_half_width
+    return (
+        left, bar_y - bar_half_height,
+        left + int(2 * bar_half_width * value / 100.0), bar_y + bar_half_height,
+    )
+
+
+def _percent_fraction(value: float) -> float:
+    """Clamp a 0-100 stat value and scale it to 0.0-1.0."""
+    return 0.0 if value < 0 else (1.0 if value > 100 else value * 0.01)
+
+
 def draw_stat_bar(
     canvas: tk.Canvas,
     x: float,
@@ -380,23 +617,29 @@ def draw_stat_bar(
     """
     items = []
 
+    # Integer coordinates keep the Tcl command strings short
+    x, y = int(x), int(y)
+    width, height = int(width), int(height)
+
     # Background
     bg_id = canvas.create_rectangle(
         x, y,
         x + width, y + height,
         fill=Colors.SOFT_GRAY,
         outline=Colors.UI_BORDER if show_outline else "",
+        tags=_TAGS["stat"],
     )
     items.append(bg_id)
 
     # Fill
-    fill_width = width * (max(0, min(100, value)) / 100.0)
+    fill_width = int(width * _percent_fraction(value))
     if fill_width > 0:
         fill_id = canvas.create_rectangle(
             x, y,
             x + fill_width, y + height,
             fill=color,
             outline="",
+            tags=_TAGS["stat"],
         )
         items.append(fill_id)
 
@@ -410,6 +653,8 @@ def draw_level_up_burst(
     radius: float,
     phase: float,
     color: str = Colors.SOFT_YELLOW,
+    reuse: Optional[List[int]] = None,
+    recolor: bool = True,
 ) -> List[int]:
     """
     Draw a level-up burst effect (expanding ring with sparkles).
@@ -421,10 +666,30 @@ def draw_level_up_burst(
         radius: Current radius of the burst.
         phase: Animation phase.
         color: Burst color.
+        reuse: Items from a previous call to move instead of recreating.
+        recolor: Whether reused items need their color updated.
 
     Returns:
-        List of canvas item IDs created.
+        List of canvas item IDs created (or reused).
     """
+    num_sparkles = 8
+
+    if reuse is not None and len(reuse) == num_sparkles + 1:
+        ring_id = reuse[0]
+        canvas.coords(ring_id, x - radius, y - radius, x + radius, y + radius)
+        if recolor:
+            canvas.itemconfigure(ring_id, outline=color)
+        cp, sp = math.cos(phase), math.sin(phase)
+        for spark_id, (ux, uy) in zip(reuse[1:], _unit_circle(num_sparkles)):
+            canvas.coords(
+                spark_id,
+                x + (ux * cp - uy * sp) * radius,
+                y + (uy * cp + ux * sp) * radius,
+            )
+            if recolor:
+                canvas.itemconfigure(spark_id, fill=color)
+        return reuse
+
     items = []
 
     # Expanding ring
@@ -434,21 +699,22 @@ def draw_level_up_burst(
         fill="",
         outline=color,
         width=3,
+        tags=_TAGS["burst"],
     )
     items.append(ring_id)
 
-    # Sparkles around ring
-    num_sparkles = 8
-    for i in range(num_sparkles):
-        angle = (i / num_sparkles) * 2 * math.pi + phase
-        spark_x = x + math.cos(angle) * radius
-        spark_y = y + math.sin(angle) * radius
+    # Sparkles around ring (unit vectors rotated by phase)
+    cp, sp = math.cos(phase), math.sin(phase)
+    for ux, uy in _unit_circle(num_sparkles):
+        spark_x = x + (ux * cp - uy * sp) * radius
+        spark_y = y + (uy * cp + ux * sp) * radius
 
         spark_id = canvas.create_text(
             spark_x, spark_y,
             text="\u2734",
-            font=("Arial", 10),
+            font=_get_font(canvas, ("Arial", 10)),
             fill=color,
+            tags=_TAGS["burst"],
         )
         items.append(spark_id)
 
@@ -480,18 +746,22 @@ def draw_hearts(
     items = []
 
     heart_color = Colors.SOFT_PINK
+    cp, sp = math.cos(phase), math.sin(phase)
+    offsets = _angle_table(1.5, count)
 
     for i in range(count):
-        # Offset each heart
-        offset_x = math.sin(phase + i * 1.5) * spread * 0.3
+        # Offset each heart: sin(phase + i * 1.5)
+        ci, si = offsets[i]
+        offset_x = (sp * ci + cp * si) * spread * 0.3
         offset_y = -spread * 0.5 - (phase * 10 + i * 15) % 40
 
         heart_id = canvas.create_text(
             x + offset_x + (i - count // 2) * 20,
             y + offset_y,
             text="\u2665",
-            font=("Arial", 14),
+            font=_get_font(canvas, ("Arial", 14)),
             fill=heart_color,
+            tags=_TAGS["hearts"],
         )
         items.append(heart_id)
 
@@ -516,25 +786,37 @@ def draw_zzz(
     Returns:
         List of canvas item IDs created.
     """
-    items = []
-
     zzz_color = Colors.SOFT_PURPLE
-    sizes = [8, 10, 12]
-
-    for i, size in enumerate(sizes):
-        # Float upward
-        y_offset = -i * 15 - (phase * 20) % 45
-        x_offset = i * 5
-
-        # Fade out at top
-        if abs(y_offset) < 50:
-            z_id = canvas.create_text(
-                x + x_offset, y + y_offset,
-                text="Z",
-                font=("Arial", size, "bold"),
-                fill=zzz_color,
-            )
-            items.append(z_id)
+
+    # Float upward; the three Zs (sizes 8, 10, 12) sit 15px apart, so the
+    # upper two fade out (pass 50px above the base) early in the cycle.
+    drift = (phase * 20) % 45
+
+    items = [canvas.create_text(
+        x, y - drift,
+        text="Z",
+        font=_get_font(canvas, ("Arial", 8, "bold")),
+        fill=zzz_color,
+        tags=_TAGS["zzz"],
+    )]
+
+    if drift < 35:
+        items.append(canvas.create_text(
+            x + 5, y - 15 - drift,
+            text="Z",
+            font=_get_font(canvas, ("Arial", 10, "bold")),
+            fill=zzz_color,
+            tags=_TAGS["zzz"],
+        ))
+
+    if drift < 20:
+        items.append(canvas.create_text(
+            x + 10, y - 30 - drift,
+            text="Z",
+            font=_get_font(canvas, ("Arial", 12, "bold")),
+            fill=zzz_color,
+            tags=_TAGS["zzz"],
+        ))
 
     return items
 
@@ -581,8 +863,9 @@ def draw_sparkles(
                 x + px * spread,
                 y + py * spread,
                 text="\u2734",
-                font=("Arial", 10),
+                font=_get_font(canvas, ("Arial", 10)),
                 fill=sparkle_color,
+                tags=_TAGS["sparkles"],
             )
             items.append(spark_id)
 
@@ -612,6 +895,7 @@ def draw_sweat_drops(
     items = []
 
     drop_color = Colors.SOFT_BLUE
+    drop_image = _get_drop_image(canvas)
 
     for i in range(count):
         # Fall downward
@@ -619,7 +903,18 @@ def draw_sweat_drops(
         drop_y = y + drop_phase * 30
         drop_x = x + (i - 0.5) * 20
 
-        if drop_phase < 0.8:  # Fade out near end
+        if drop_phase >= 0.8:  # Fade out near end
+            continue
+
+        if drop_image is not None:
+            # Blit the pre-rendered teardrop
+            drop_id = canvas.create_image(
+                drop_x, drop_y,
+                image=drop_image,
+                tags=_TAGS["sweat"],
+            )
+            items.append(drop_id)
+        else:
             # Teardrop shape
             points = [
                 drop_x, drop_y - 5,
@@ -632,12 +927,80 @@ def draw_sweat_drops(
                 fill=drop_color,
                 outline="",
                 smooth=True,
+                tags=_TAGS["sweat"],
             )
             items.append(drop_id)
 
     return items
 
 
+def _teardrop_rows() -> Tuple[Tuple[int, int, int], ...]:
+    """
+    Rasterize the sweat drop shape into horizontal pixel runs.
+
+    Traces the same curve Tk draws for the smoothed teardrop polygon
+    (0, -5), (-3, 2), (0, 5), (3, 2) and samples pixel centers on a
+    7x11 grid centered on the drop.
+
+    Returns:
+        Tuple of (row, first column, last column) runs.
+    """
+    vertices = [(0, -5), (-3, 2), (0, 5), (3, 2)]
+    outline = []
+    for i, (cx, cy) in enumerate(vertices):
+        px, py = vertices[i - 1]
+        nx, ny = vertices[(i + 1) % len(vertices)]
+        x0, y0 = (px + cx) / 2, (py + cy) / 2
+        x2, y2 = (cx + nx) / 2, (cy + ny) / 2
+        for step in range(10):
+            t = step / 10
+            u = 1 - t
+            outline.append((
+                u * u * x0 + 2 * u * t * cx + t * t * x2,
+                u * u * y0 + 2 * u * t * cy + t * t * y2,
+            ))
+
+    def inside(x: float, y: float) -> bool:
+        hit = False
+        for (ax, ay), (bx, by) in zip(outline, outline[1:] + outline[:1]):
+            if (ay > y) != (by > y) and x < ax + (y - ay) * (bx - ax) / (by - ay):
+                hit = not hit
+        return hit
+
+    rows = []
+    for row in range(11):
+        cols = [col for col in range(7) if inside(col - 3, row - 5)]
+        if cols:
+            rows.append((row, cols[0], cols[-1]))
+    return tuple(rows)
+
+
+_TEARDROP_ROWS = _teardrop_rows()
+
+# Pre-rendered sweat drop images, keyed by Tk interpreter
+_drop_images: Dict[object, tk.PhotoImage] = {}
+
+
+def _get_drop_image(canvas: tk.Canvas) -> Optional[tk.PhotoImage]:
+    """
+    Get the pre-rendered sweat drop image for a canvas's Tk interpreter.
+
+    Built lazily since a PhotoImage needs a Tk root. Returns None for
+    canvas stand-ins without a Tk interpreter.
+    """
+    interp = getattr(canvas, "tk", None)
+    if interp is None:
+        return None
+    image = _drop_images.get(interp)
+    if image is None:
+        # Pixels that are never put stay transparent
+        image = tk.PhotoImage(master=canvas, width=7, height=11)
+        for row, first, last in _TEARDROP_ROWS:
+            image.put(Colors.SOFT_BLUE, to=(first, row, last + 1, row + 1))
+        _drop_images[interp] = image
+    return image
+
+
 def draw_music_notes(
     canvas: tk.Canvas,
     x: float,
@@ -663,17 +1026,26 @@ def draw_music_notes(
     note_color = Colors.SOFT_PURPLE
     notes = ["\u266A", "\u266B", "\u266C"]
 
+    # sin(note_phase) and sin(2 * note_phase) via angle sums, where
+    # note_phase = phase + i * 0.7
+    cp, sp = math.cos(phase), math.sin(phase)
+    cp2, sp2 = math.cos(phase * 2), math.sin(phase * 2)
+    offsets = _angle_table(0.7, count)
+    offsets2 = _angle_table(1.4, count)
+
     for i in range(count):
-        note_phase = phase + i * 0.7
+        ci, si = offsets[i]
+        ci2, si2 = offsets2[i]
         # Bounce motion
-        bounce_y = y - 20 - abs(math.sin(note_phase * 2)) * 15
-        bounce_x = x + (i - 1) * 25 + math.sin(note_phase) * 5
+        bounce_y = y - 20 - abs(sp2 * ci2 + cp2 * si2) * 15
+        bounce_x = x + (i - 1) * 25 + (sp * ci + cp * si) * 5
 
         note_id = canvas.create_text(
             bounce_x, bounce_y,
             text=notes[i % len(notes)],
-            font=("Arial", 12),
+            font=_get_font(canvas, ("Arial", 12)),
             fill=note_color,
+            tags=_TAGS["music"],
         )
         items.append(note_id)
 
@@ -704,11 +1076,28 @@ def draw_food_crumbs(
 
     crumb_color = Colors.SOFT_ORANGE
 
-    for i in range(count):
-        crumb_phase = (phase * 2 + i * 0.3) % 1.0
-        # Fall with slight sideways drift
-        crumb_y = y + crumb_phase * 25
-        crumb_x = x + (i - count / 2) * 10 + math.sin(crumb_phase * 4) * 3
+    if np is not None and count >= _NUMPY_MIN_COUNT:
+        idx = np.arange(count, dtype=np.float64)
+        phases = (phase * 2 + idx * 0.3) % 1.0
+        crumbs = zip(
+            range(count),
+            phases.tolist(),
+            (x + (idx - count / 2) * 10 + np.sin(phases * 4) * 3).tolist(),
+            (y + phases * 25).tolist(),
+        )
+    else:
+        crumbs = []
+        for i in range(count):
+            crumb_phase = (phase * 2 + i * 0.3) % 1.0
+            # Fall with slight sideways drift
+            crumbs.append((
+                i,
+                crumb_phase,
+                x + (i - count / 2) * 10 + math.sin(crumb_phase * 4) * 3,
+                y + crumb_phase * 25,
+            ))
+
+    for i, crumb_phase, crumb_x, crumb_y in crumbs:
         crumb_size = 3 + (i % 2)
 
         if crumb_phase < 0.9:  # Fade near end
@@ -717,27 +1106,213 @@ def draw_food_crumbs(
                 crumb_x + crumb_size, crumb_y + crumb_size,
                 fill=crumb_color,
                 outline="",
+                tags=_TAGS["crumbs"],
             )
             items.append(crumb_id)
 
     return items
 
 
-@dataclass
+def draw_confetti(
+    canvas: tk.Canvas,
+    x: float,
+    y: float,
+    count: int = 10,
+    spread: float = 80.0,
+    phase: float = 0.0,
+) -> List[int]:
+    """
+    Draw falling confetti particles.
+
+    Args:
+        canvas: Tkinter canvas to draw on.
+        x: Center X coordinate.
+        y: Center Y coordinate.
+        count: Number of confetti pieces.
+        spread: How spread out the confetti is.
+        phase: Animation phase.
+
+    Returns:
+        List of canvas item IDs created.
+    """
+    items = []
+    confetti_colors = [
+        Colors.SOFT_PINK,
+        Colors.SOFT_BLUE,
+        Colors.SOFT_YELLOW,
+        Colors.SOFT_GREEN,
+        Colors.SOFT_PURPLE,
+        Colors.SOFT_ORANGE,
+    ]
+
+    if np is not None and count >= _NUMPY_MIN_COUNT:
+        idx = np.arange(count, dtype=np.float64)
+        phases = (phase * 0.8 + idx * 0.2) % 2.0
+        pieces = zip(
+            range(count),
+            phases.tolist(),
+            (x + np.sin(phases * 3 + idx) * spread * 0.5 + (idx - count // 2) * 15).tolist(),
+            (y + phases * 40 - 20).tolist(),
+        )
+    else:
+        pieces = []
+        for i in range(count):
+            confetti_phase = (phase * 0.8 + i * 0.2) % 2.0
+            # Fall downward with drift
+            pieces.append((
+                i,
+                confetti_phase,
+                x + math.sin(confetti_phase * 3 + i) * spread * 0.5 + (i - count // 2) * 15,
+                y + confetti_phase * 40 - 20,
+            ))
+
+    for i, confetti_phase, drift_x, fall_y in pieces:
+        if confetti_phase < 1.8:  # Fade near end
+            color = confetti_colors[i % len(confetti_colors)]
+            size = 4 + (i % 3)
+
+            # Draw rotated rectangle (simplified as oval)
+            confetti_id = canvas.create_oval(
+                drift_x - size, fall_y - size * 0.5,
+                drift_x + size, fall_y + size * 0.5,
+                fill=color,
+                outline="",
+                tags=_TAGS["confetti"],
+            )
+            items.append(confetti_id)
+
+    return items
+
+
+class _ParticleRecorder:
+    """
+    Canvas stand-in that records particle draw calls.
+
+    Lets the regular ``draw_*`` particle functions be replayed into a
+    single PIL image instead of creating one canvas item per particle.
+    """
+
+    def __init__(self) -> None:
+        self.ops: List[Tuple[str, Tuple[float, ...], dict]] = []
+
+    def _record(self, kind: str, coords: tuple, options: dict) -> int:
+        if len(coords) == 1:
+            coords = tuple(coords[0])
+        self.ops.append((kind, coords, options))
+        return len(self.ops)
+
+    def create_text(self, *coords, **options) -> int:
+        return self._record("text", coords, options)
+
+    def create_oval(self, *coords, **options) -> int:
+        return self._record("oval", coords, options)
+
+    def create_polygon(self, *coords, **options) -> int:
+        return self._record("polygon", coords, options)
+
+
+# Tk font family -> TrueType file names tried by PIL
+_PIL_FONT_FILES = {
+    "Arial": ("arial.ttf", "Arial.ttf", "DejaVuSans.ttf"),
+    "Arial bold": ("arialbd.ttf", "Arial Bold.ttf", "DejaVuSans-Bold.ttf"),
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _get_pil_font(font: tuple):
+    """Load a PIL font matching a Tk font tuple such as ("Arial", 10, "bold")."""
+    family = font[0]
+    if "bold" in font[2:]:
+        family += " bold"
+    # Tk sizes are points, PIL sizes are pixels (96 DPI)
+    size = max(1, round(font[1] * 4 / 3))
+    for filename in _PIL_FONT_FILES.get(family, ()):
+        try:
+            return ImageFont.truetype(filename, size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+
+def _composite_particles(
+    ops: List[Tuple[str, Tuple[float, ...], dict]],
+) -> Optional[Tuple[int, int, "Image.Image"]]:
+    """
+    Rasterize recorded particle draw calls into one RGBA image.
+
+    Args:
+        ops: Draw calls recorded by a _ParticleRecorder.
+
+    Returns:
+        Tuple of (left, top, image), or None if nothing was drawn.
+    """
+    if not ops:
+        return None
+
+    # Bounding box of all particles (text gets a generous glyph margin)
+    xs: List[float] = []
+    ys: List[float] = []
+    for kind, coords, options in ops:
+        if kind == "text":
+            margin = options.get("font", ("Arial", 10))[1] * 2
+            xs.extend((coords[0] - margin, coords[0] + margin))
+            ys.extend((coords[1] - margin, coords[1] + margin))
+        else:
+            xs.extend(coords[0::2])
+            ys.extend(coords[1::2])
+    left, top = int(min(xs)) - 1, int(min(ys)) - 1
+    width, height = int(max(xs)) - left + 2, int(max(ys)) - top + 2
+
+    image = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    for kind, coords, options in ops:
+        fill = options.get("fill") or None
+        points = [
+            (coords[i] - left, coords[i + 1] - top)
+            for i in range(0, len(coords), 2)
+        ]
+        if kind == "text":
+            anchor = "lm" if options.get("anchor") == "w" else "mm"
+            draw.text(
+                points[0], options.get("text", ""),
+                fill=fill, font=_get_pil_font(options.get("font", ("Arial", 10))),
+                anchor=anchor,
+            )
+        elif kind == "oval":
+            draw.ellipse(points, fill=fill)
+        else:
+            draw.polygon(points, fill=fill)
+
+    return left, top, image
+
+
 class EffectState:
     """
     State tracking for visual effects.
 
-    Used to manage effect animations and cleanup.
+    Used to manage effect animations and cleanup. Uses ``__slots__``
+    since many of these are updated every frame.
     """
-    items: List[int] = None
-    phase: float = 0.0
-    duration: float = 0.0
-    elapsed: float = 0.0
 
-    def __post_init__(self):
-        if self.items is None:
-            self.items = []
+    __slots__ = ("items", "phase", "duration", "elapsed")
+
+    def __init__(
+        self,
+        items: Optional[List[int]] = None,
+        phase: float = 0.0,
+        duration: float = 0.0,
+        elapsed: float = 0.0,
+    ) -> None:
+        self.items: List[int] = [] if items is None else items
+        self.phase = phase
+        self.duration = duration
+        self.elapsed = elapsed
+
+    def __repr__(self) -> str:
+        return (
+            f"EffectState(items={self.items!r}, phase={self.phase!r}, "
+            f"duration={self.duration!r}, elapsed={self.elapsed!r})"
+        )
 
     def update(self, delta_time: float) -> bool:
         """
@@ -751,10 +1326,7 @@ class EffectState:
         """
         self.elapsed += delta_time
         self.phase += delta_time
-
-        if self.duration > 0 and self.elapsed >= self.duration:
-            return False
-        return True
+        return not (self.duration > 0 and self.elapsed >= self.duration)
 
     def get_progress(self) -> float:
         """Get effect progress (0.0-1.0)."""
@@ -774,11 +1346,19 @@ class Effects:
     - Stat indicator icons
     - Particle effect coordination
 
+    Effects drawn with an ``effect_id`` keep their canvas items across
+    frames and are moved with ``coords``/``itemconfigure`` instead of
+    being deleted and recreated. They survive ``clear()`` and are removed
+    with ``release()``.
+
     Usage:
         effects = Effects(canvas)
         effects.draw_shadow(x, y, width)
         effects.draw_glow(x, y, size, color, intensity)
+        effects.draw_pulsing_glow_effect(x, y, r, color, phase, effect_id="aura")
+        effects.raise_effects()
         effects.clear()
+        effects.release("aura")
     """
 
     def __init__(self, canvas: tk.Canvas) -> None:
@@ -789,7 +1369,48 @@ class Effects:
             canvas: Tkinter canvas to draw on.
         """
         self.canvas = canvas
-        self.items: List[int] = []
+        # Transient item IDs, compact and reused between frames
+        self.items: array = array("i")
+
+        # Create the named fonts up front so the first frame doesn't pay for it
+        for spec in _EFFECT_FONTS:
+            _get_font(canvas, spec)
+
+        # Persistent items per effect_id: (last color, item IDs)
+        self._effect_cache: Dict[Hashable, Tuple[str, List[int]]] = {}
+        # Effect IDs whose persistent items are currently hidden
+        self._hidden_effects: set = set()
+        # Persistent stat bars: (x, y, width, height) ->
+        # (bg_id, fill_id, value, color, show_outline)
+        self._stat_bar_cache: Dict[
+            Tuple[float, float, float, float], Tuple[int, int, float, str, bool]
+        ] = {}
+        # Persistent stat icons: (stat_type, x, y) -> (item IDs, whole percent)
+        self._stat_icon_cache: Dict[Tuple[StatType, float, float], Tuple[List[int], int]] = {}
+        # Composited particle images (Tk needs a live reference)
+        self._particle_images: Dict[Hashable, "ImageTk.PhotoImage"] = {}
+
+    def _get_cached(self, effect_id: Hashable, color: str) -> Tuple[Optional[List[int]], bool]:
+        """
+        Look up persistent items for an effect.
+
+        Returns:
+            Tuple of (cached item IDs or None, whether a recolor is needed).
+        """
+        cached = self._effect_cache.get(effect_id)
+        if cached is None:
+            return None, True
+        return cached[1], cached[0] != color
+
+    def _store_cached(self, effect_id: Hashable, color: str, items: List[int]) -> None:
+        """Remember persistent items, deleting any that were replaced."""
+        cached = self._effect_cache.get(effect_id)
+        if cached is None or cached[1] is not items:
+            if cached is not None:
+                self.canvas.delete(*cached[1])
+            for item_id in items:
+                self.canvas.addtag_withtag(PERSISTENT_EFFECT_TAG, item_id)
+        self._effect_cache[effect_id] = (color, items)
 
     def draw_shadow(
         self,
@@ -810,7 +1431,7 @@ class Effects:
         Returns:
             List of canvas item IDs created.
         """
-        items = draw_shadow(self.canvas, x, y, width, 0.0, opacity)
+        items = draw_shadow_default(self.canvas, x, y, width, opacity)
         self.items.extend(items)
         return items
 
@@ -821,6 +1442,7 @@ class Effects:
         size: float,
         color: str,
         intensity: float,
+        effect_id: Optional[Hashable] = None,
     ) -> List[int]:
         """
         Draw glowing aura (for evolution, level up).
@@ -831,10 +1453,17 @@ class Effects:
             size: Glow radius.
             color: Glow color in hex format.
             intensity: Glow intensity (0.0-1.0).
+            effect_id: Key for reusing this glow's items across frames.
 
         Returns:
             List of canvas item IDs created.
         """
+        if effect_id is not None:
+            reuse, recolor = self._get_cached(effect_id, color)
+            items = draw_glow(self.canvas, x, y, size, color, intensity, reuse=reuse, recolor=recolor)
+            self._store_cached(effect_id, color, items)
+            return items
+
         items = draw_glow(self.canvas, x, y, size, color, intensity)
         self.items.extend(items)
         return items
@@ -847,6 +1476,7 @@ class Effects:
         color: str,
         phase: float,
         pulse_amount: float = 0.15,
+        effect_id: Optional[Hashable] = None,
     ) -> List[int]:
         """
         Draw a pulsing glow effect.
@@ -858,14 +1488,60 @@ class Effects:
             color: Glow color in hex format.
             phase: Animation phase for pulsing.
             pulse_amount: How much the glow pulses.
+            effect_id: Key for reusing this glow's items across frames.
 
         Returns:
             List of canvas item IDs created.
         """
+        if effect_id is not None:
+            reuse, recolor = self._get_cached(effect_id, color)
+            items = draw_pulsing_glow(
+                self.canvas, x, y, base_radius, color, phase, pulse_amount,
+                reuse=reuse, recolor=recolor,
+            )
+            self._store_cached(effect_id, color, items)
+            return items
+
         items = draw_pulsing_glow(self.canvas, x, y, base_radius, color, phase, pulse_amount)
         self.items.extend(items)
         return items
 
+    def draw_level_up_burst_effect(
+        self,
+        x: float,
+        y: float,
+        radius: float,
+        phase: float,
+        color: str = Colors.SOFT_YELLOW,
+        effect_id: Optional[Hashable] = None,
+    ) -> List[int]:
+        """
+        Draw a level-up burst (expanding ring with sparkles).
+
+        Args:
+            x: Center X coordinate.
+            y: Center Y coordinate.
+            radius: Current radius of the burst.
+            phase: Animation phase.
+            color: Burst color.
+            effect_id: Key for reusing this burst's items across frames.
+
+        Returns:
+            List of canvas item IDs created.
+        """
+        if effect_id is not None:
+            reuse, recolor = self._get_cached(effect_id, color)
+            items = draw_level_up_burst(
+                self.canvas, x, y, radius, phase, color,
+                reuse=reuse, recolor=recolor,
+            )
+            self._store_cached(effect_id, color, items)
+            return items
+
+        items = draw_level_up_burst(self.canvas, x, y, radius, phase, color)
+        self.items.extend(items)
+        return items
+
     def draw_thought_bubble_effect(
         self,
         x: float,
@@ -899,19 +1575,153 @@ class Effects:
         """
         Draw small stat indicator (heart for hunger, etc.).
 
+        The icon and bar background persist per (stat_type, x, y); later
+        calls only resize the fill bar, and only when the value changes
+        by a whole percent.
+
         Args:
             x: Icon X coordinate.
             y: Icon Y coordinate.
             stat_type: Type of stat to display.
             value: Current stat value (0-100).
 
+        Returns:
+            List of canvas item IDs (icon, background, fill).
+        """
+        key = (stat_type, x, y)
+        level = int(value)
+        cached = self._stat_icon_cache.get(key)
+        if cached is not None:
+            items, last_level = cached
+            if level != last_level:
+                self.canvas.coords(items[2], *_stat_icon_fill_coords(x, y, 20.0, level))
+                self._stat_icon_cache[key] = (items, level)
+            return items
+
+        items = draw_stat_icon(self.canvas, x, y, stat_type, level, keep_fill=True)
+        for item_id in items:
+            self.canvas.addtag_withtag(PERSISTENT_EFFECT_TAG, item_id)
+        self._stat_icon_cache[key] = (items, level)
+        return items
+
+    def draw_particles_batched(
+        self,
+        effect_id: Hashable,
+        draw_fn,
+        *args,
+    ) -> List[int]:
+        """
+        Draw a particle effect as a single persistent image item.
+
+        Replays one of the module's ``draw_*`` particle functions into a
+        PIL image and shows it with one ``create_image`` item that is
+        reused across frames. Without PIL, falls back to drawing the
+        particles as regular canvas items.
+
+        Args:
+            effect_id: Key for reusing the image item across frames.
+            draw_fn: Particle function taking (canvas, *args).
+            *args: Arguments passed to draw_fn after the canvas.
+
         Returns:
             List of canvas item IDs created.
         """
-        items = draw_stat_icon(self.canvas, x, y, stat_type, value)
-        self.items.extend(items)
+        if Image is None:
+            items = draw_fn(self.canvas, *args)
+            self.items.extend(items)
+            return items
+
+        recorder = _ParticleRecorder()
+        draw_fn(recorder, *args)
+        composite = _composite_particles(recorder.ops)
+        if composite is None:
+            self.release(effect_id)
+            return []
+
+        left, top, image = composite
+        photo = ImageTk.PhotoImage(image, master=self.canvas)
+        reuse, _ = self._get_cached(effect_id, "")
+        if reuse is not None:
+            self.canvas.coords(reuse[0], left, top)
+            self.canvas.itemconfigure(reuse[0], image=photo)
+            items = reuse
+        else:
+            items = [self.canvas.create_image(
+                left, top,
+                image=photo,
+                anchor=tk.NW,
+                tags=_TAGS["particles"],
+            )]
+
+        self._particle_images[effect_id] = photo
+        self._store_cached(effect_id, "", items)
         return items
 
+    def draw_stat_bar_effect(
+        self,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        value: float,
+        color: str,
+        show_outline: bool = True,
+    ) -> List[int]:
+        """
+        Draw a horizontal stat bar that persists across frames.
+
+        The bar's items are kept per (x, y, width, height); later calls
+        only resize the fill and restyle the items whose color or outline
+        changed, and do nothing when all of these are unchanged.
+
+        Args:
+            x: Left X coordinate.
+            y: Top Y coordinate.
+            width: Bar width.
+            height: Bar height.
+            value: Current value (0-100).
+            color: Fill color for the bar.
+            show_outline: Whether to show outline.
+
+        Returns:
+            List of canvas item IDs (background, fill).
+        """
+        key = (x, y, width, height)
+        x, y, width, height = int(x), int(y), int(width), int(height)
+        cached = self._stat_bar_cache.get(key)
+        if cached is not None:
+            bg_id, fill_id, last_value, last_color, last_outline = cached
+            if value != last_value:
+                fill_width = int(width * _percent_fraction(value))
+                self.canvas.coords(fill_id, x, y, x + fill_width, y + height)
+            if color != last_color:
+                self.canvas.itemconfigure(fill_id, fill=color)
+            if show_outline != last_outline:
+                self.canvas.itemconfigure(
+                    bg_id, outline=Colors.UI_BORDER if show_outline else ""
+                )
+            if (value, color, show_outline) != (last_value, last_color, last_outline):
+                self._stat_bar_cache[key] = (bg_id, fill_id, value, color, show_outline)
+            return [bg_id, fill_id]
+
+        bg_id = self.canvas.create_rectangle(
+            x, y,
+            x + width, y + height,
+            fill=Colors.SOFT_GRAY,
+            outline=Colors.UI_BORDER if show_outline else "",
+            tags=_TAGS["stat"] + (PERSISTENT_EFFECT_TAG,),
+        )
+        fill_width = int(width * _percent_fraction(value))
+        fill_id = self.canvas.create_rectangle(
+            x, y,
+            x + fill_width, y + height,
+            fill=color,
+            outline="",
+            tags=_TAGS["stat"] + (PERSISTENT_EFFECT_TAG,),
+        )
+        self._stat_bar_cache[key] = (bg_id, fill_id, value, color, show_outline)
+        return [bg_id, fill_id]
+
     def draw_hearts_effect(
         self,
         x: float,
@@ -919,6 +1729,7 @@ class Effects:
         count: int = 3,
         spread: float = 50.0,
         phase: float = 0.0,
+        effect_id: Optional[Hashable] = None,
     ) -> List[int]:
         """
         Draw floating heart particles.
@@ -929,10 +1740,14 @@ class Effects:
             count: Number of hearts.
             spread: How spread out the hearts are.
             phase: Animation phase.
+            effect_id: Key for drawing the particles as one reused image.
 
         Returns:
             List of canvas item IDs created.
         """
+        if effect_id is not None:
+            return self.draw_particles_batched(effect_id, draw_hearts, x, y, count, spread, phase)
+
         items = draw_hearts(self.canvas, x, y, count, spread, phase)
         self.items.extend(items)
         return items
@@ -942,6 +1757,7 @@ class Effects:
         x: float,
         y: float,
         phase: float = 0.0,
+        effect_id: Optional[Hashable] = None,
     ) -> List[int]:
         """
         Draw floating ZZZ sleep particles.
@@ -950,10 +1766,14 @@ class Effects:
             x: Base X coordinate.
             y: Base Y coordinate.
             phase: Animation phase.
+            effect_id: Key for drawing the particles as one reused image.
 
         Returns:
             List of canvas item IDs created.
         """
+        if effect_id is not None:
+            return self.draw_particles_batched(effect_id, draw_zzz, x, y, phase)
+
         items = draw_zzz(self.canvas, x, y, phase)
         self.items.extend(items)
         return items
@@ -965,6 +1785,7 @@ class Effects:
         count: int = 5,
         spread: float = 50.0,
         phase: float = 0.0,
+        effect_id: Optional[Hashable] = None,
     ) -> List[int]:
         """
         Draw sparkle particles.
@@ -975,10 +1796,14 @@ class Effects:
             count: Number of sparkles.
             spread: How spread out the sparkles are.
             phase: Animation phase.
+            effect_id: Key for drawing the particles as one reused image.
 
         Returns:
             List of canvas item IDs created.
         """
+        if effect_id is not None:
+            return self.draw_particles_batched(effect_id, draw_sparkles, x, y, count, spread, phase)
+
         items = draw_sparkles(self.canvas, x, y, count, spread, phase)
         self.items.extend(items)
         return items
@@ -990,6 +1815,7 @@ class Effects:
         count: int = 10,
         spread: float = 80.0,
         phase: float = 0.0,
+        effect_id: Optional[Hashable] = None,
     ) -> List[int]:
         """
         Draw falling confetti particles.
@@ -1000,40 +1826,15 @@ class Effects:
             count: Number of confetti pieces.
             spread: How spread out the confetti is.
             phase: Animation phase.
+            effect_id: Key for drawing the particles as one reused image.
 
         Returns:
             List of canvas item IDs created.
         """
-        items = []
-        confetti_colors = [
-            Colors.SOFT_PINK,
-            Colors.SOFT_BLUE,
-            Colors.SOFT_YELLOW,
-            Colors.SOFT_GREEN,
-            Colors.SOFT_PURPLE,
-            Colors.SOFT_ORANGE,
-        ]
-
-        for i in range(count):
-            confetti_phase = (phase * 0.8 + i * 0.2) % 2.0
-            # Fall downward with drift
-            fall_y = y + confetti_phase * 40 - 20
-            drift_x = x + math.sin(confetti_phase * 3 + i) * spread * 0.5 + (i - count // 2) * 15
-            rotation = confetti_phase * 180
-
-            if confetti_phase < 1.8:  # Fade near end
-                color = confetti_colors[i % len(confetti_colors)]
-                size = 4 + (i % 3)
-
-                # Draw rotated rectangle (simplified as oval)
-                confetti_id = self.canvas.create_oval(
-                    drift_x - size, fall_y - size * 0.5,
-                    drift_x + size, fall_y + size * 0.5,
-                    fill=color,
-                    outline="",
-                )
-                items.append(confetti_id)
+        if effect_id is not None:
+            return self.draw_particles_batched(effect_id, draw_confetti, x, y, count, spread, phase)
 
+        items = draw_confetti(self.canvas, x, y, count, spread, phase)
         self.items.extend(items)
         return items
 
@@ -1044,6 +1845,7 @@ class Effects:
         count: int = 8,
         radius: float = 60.0,
         phase: float = 0.0,
+        effect_id: Optional[Hashable] = None,
     ) -> List[int]:
         """
         Draw a burst pattern of stars.
@@ -1054,35 +1856,138 @@ class Effects:
             count: Number of stars.
             radius: Burst radius.
             phase: Animation phase.
+            effect_id: Key for reusing this burst's items across frames.
 
         Returns:
             List of canvas item IDs created.
         """
-        items = []
         star_color = Colors.SOFT_YELLOW
 
-        for i in range(count):
-            angle = (i / count) * 2 * math.pi + phase * 0.5
-            # Expand outward
-            current_radius = radius * (0.3 + (phase % 1.0) * 0.7)
-            star_x = x + math.cos(angle) * current_radius
-            star_y = y + math.sin(angle) * current_radius
+        if effect_id is not None:
+            return self._draw_cached_stars_burst(effect_id, x, y, count, radius, phase, star_color)
+
+        items = []
+
+        # Expand outward
+        current_radius = radius * (0.3 + (phase % 1.0) * 0.7)
+        cp, sp = math.cos(phase * 0.5), math.sin(phase * 0.5)
+
+        for ux, uy in _unit_circle(count):
+            star_x = x + (ux * cp - uy * sp) * current_radius
+            star_y = y + (uy * cp + ux * sp) * current_radius
 
             # Fade out as expanding
             if (phase % 1.0) < 0.9:
                 star_id = self.canvas.create_text(
                     star_x, star_y,
                     text="\u2734",  # Star character
-                    font=("Arial", 10),
+                    font=_get_font(self.canvas, ("Arial", 10)),
                     fill=star_color,
+                    tags=_TAGS["stars"],
                 )
                 items.append(star_id)
 
         self.items.extend(items)
         return items
 
+    def _draw_cached_stars_burst(
+        self,
+        effect_id: Hashable,
+        x: float,
+        y: float,
+        count: int,
+        radius: float,
+        phase: float,
+        star_color: str,
+    ) -> List[int]:
+        """Draw a stars burst whose items persist across frames."""
+        current_radius = radius * (0.3 + (phase % 1.0) * 0.7)
+        visible = (phase % 1.0) < 0.9
+
+        cp, sp = math.cos(phase * 0.5), math.sin(phase * 0.5)
+        unit = _unit_circle(count)
+
+        reuse, _ = self._get_cached(effect_id, star_color)
+        if reuse is not None and len(reuse) == count:
+            for star_id, (ux, uy) in zip(reuse, unit):
+                self.canvas.coords(
+                    star_id,
+                    x + (ux * cp - uy * sp) * current_radius,
+                    y + (uy * cp + ux * sp) * current_radius,
+                )
+            items = reuse
+            if visible == (effect_id in self._hidden_effects):
+                state = tk.NORMAL if visible else tk.HIDDEN
+                for star_id in items:
+                    self.canvas.itemconfigure(star_id, state=state)
+        else:
+            items = []
+            for ux, uy in unit:
+                star_id = self.canvas.create_text(
+                    x + (ux * cp - uy * sp) * current_radius,
+                    y + (uy * cp + ux * sp) * current_radius,
+                    text="\u2734",  # Star character
+                    font=_get_font(self.canvas, ("Arial", 10)),
+                    fill=star_color,
+                    state=tk.NORMAL if visible else tk.HIDDEN,
+                    tags=_TAGS["stars"],
+                )
+                items.append(star_id)
+
+        if visible:
+            self._hidden_effects.discard(effect_id)
+        else:
+            self._hidden_effects.add(effect_id)
+        self._store_cached(effect_id, star_color, items)
+        return items
+
+    def raise_effects(self) -> None:
+        """
+        Restack every effect item above the rest of the canvas.
+
+        Effects form a layer through their shared tag rather than a
+        separate overlay canvas (Tk canvases can't be transparent).
+        Persistent effect items keep their old stacking position while
+        sprites are recreated every frame, so call this after drawing the
+        sprites to keep the effects layer on top in one Tcl call.
+        """
+        self.canvas.tag_raise(EFFECT_TAG)
+
+    def release(self, effect_id: Optional[Hashable] = None) -> None:
+        """
+        Delete persistent items kept for an effect.
+
+        Args:
+            effect_id: Effect to release, or None to release all of them
+                (including persistent stat bars and icons).
+        """
+        if effect_id is None:
+            effect_ids = list(self._effect_cache)
+            for bg_id, fill_id, *_ in self._stat_bar_cache.values():
+                self.canvas.delete(bg_id, fill_id)
+            self._stat_bar_cache.clear()
+            for items, _ in self._stat_icon_cache.values():
+                self.canvas.delete(*items)
+            self._stat_icon_cache.clear()
+        else:
+            effect_ids = [effect_id]
+
+        for key in effect_ids:
+            cached = self._effect_cache.pop(key, None)
+            if cached is not None:
+                for item_id in cached[1]:
+                    self.canvas.delete(item_id)
+            self._hidden_effects.discard(key)
+            self._particle_images.pop(key, None)
+
     def clear(self) -> None:
-        """Clear all rendered items from canvas."""
-        for item_id in self.items:
-            self.canvas.delete(item_id)
-        self.items.clear()
+        """
+        Clear this manager's transient effect items in one delete call.
+
+        Items kept for an ``effect_id`` (and persistent stat bars/icons)
+        are left alone; use release() for those. Effect items drawn by
+        other managers or renderers on the same canvas are not touched.
+        """
+        if self.items:
+            self.canvas.delete(*self.items)
+            del self.items[:]
@@ -36,11 +36,15 @@ ADULT Stage (5 variants):
 
 from __future__ import annotations
 
+import itertools
 import math
 import tkinter as tk
-from dataclasses import dataclass, field
-from enum import Enum, auto
-from typing import Dict, List, Optional, Tuple
+import weakref
+from functools import cached_property
+from dataclasses import dataclass, field, replace
+from enum import Enum, IntEnum, IntFlag, auto
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Union
 
 from graphics.sprites import (
     BlobSprite,
@@ -50,6 +54,7 @@ from graphics.sprites import (
     draw_nub_limbs,
     darken_color,
     lighten_color,
+    unbind_handler,
 )
 from graphics.expressions import (
     ExpressionRenderer,
@@ -90,6 +95,97 @@ except ImportError:
         ADULT_SCALE = 1.0
         BABY_EYE_MULTIPLIER = 1.5
 
+# Optional JIT compilation for particle math (Numba depends on NumPy)
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
+
+
+# Unit-circle (cos, sin) pairs per evenly spaced angle count, built on demand
+_ANGLE_TABLES: Dict[int, Tuple[Tuple[float, float], ...]] = {}
+
+
+def _angle_table(count: int) -> Tuple[Tuple[float, float], ...]:
+    """
+    Get (cos, sin) pairs for ``count`` evenly spaced angles around a circle.
+
+    The particle loops only add a per-frame phase to these fixed angles,
+    which the angle-sum identities turn into one sin/cos per frame.
+    """
+    table = _ANGLE_TABLES.get(count)
+    if table is None:
+        step = 2 * math.pi / count
+        table = tuple((math.cos(i * step), math.sin(i * step)) for i in range(count))
+        _ANGLE_TABLES[count] = table
+    return table
+
+
+# Unscaled radius around a form's center that its features can reach
+_CULL_RADIUS = 80
+
+# Polyline templates as (dx, dy) offsets per unit of size
+_CRACK_MAIN = ((-0.3, -0.2), (-0.15, -0.1), (-0.25, 0.1), (-0.1, 0.2))
+_CRACK_SMALL = ((0.2, -0.15), (0.1, 0.0))
+_LIGHTNING_LEFT = ((-15, -5), (-10, 0), (-18, 5), (-12, 10))
+_LIGHTNING_RIGHT = tuple((-dx, dy) for dx, dy in _LIGHTNING_LEFT)
+
+# Zigzag antenna template as (dx, sway factor, dy per unit scale) per vertex
+_ANTENNA_TEMPLATE = ((0, 0.2, 0), (5, 0.5, -8), (-3, 0.7, -16), (4, 1.0, -24))
+
+
+def _template_points(
+    template: Tuple[Tuple[float, float], ...], x: float, y: float, size: float
+) -> List[float]:
+    """Place a polyline template at (x, y), scaled by size, as flat coords."""
+    return [coord for dx, dy in template for coord in (x + dx * size, y + dy * size)]
+
+
+# Star blink pattern per half-phase tick: visible for 3 ticks, hidden for 1
+_STAR_VISIBLE = (True, True, True, False)
+
+# Five-pointed star outline as unit (dx, dy) offsets, first point up
+_STAR_TEMPLATE: Tuple[Tuple[float, float], ...] = tuple(
+    (math.cos(angle) * radius, math.sin(angle) * radius)
+    for angle, radius in (
+        (-math.pi / 2 + i * math.pi / 5, 1.0 if i % 2 == 0 else 0.4)
+        for i in range(10)
+    )
+)
+
+
+def _floating_particle_layout(
+    out, x: float, y: float, scale: float, phase: float
+) -> None:
+    """
+    Fill ``out`` with (x0, y0, x1, y1, visible) for each floating particle.
+
+    Uses only scalar float math so it runs as plain Python or compiled
+    by Numba when available.
+    """
+    for i in range(len(out) // 5):
+        # Float upward and fade
+        offset_phase = phase + i * 0.4
+        float_y = (offset_phase * 15) % 50
+        fade = 1.0 - (float_y / 50)
+
+        p_x = x + math.sin(offset_phase * 2 + i) * 30 * scale
+        p_y = y - 20 * scale - float_y * scale
+        p_size = (3 + fade * 2) * scale
+
+        j = i * 5
+        out[j] = p_x - p_size
+        out[j + 1] = p_y - p_size
+        out[j + 2] = p_x + p_size
+        out[j + 3] = p_y + p_size
+        out[j + 4] = 1.0 if fade > 0.2 else 0.0
+
+
+if njit is not None:
+    _floating_particle_layout = njit(cache=True)(_floating_particle_layout)
+
 
 class EvolutionStage(Enum):
     """Evolution stages."""
@@ -100,7 +196,63 @@ class EvolutionStage(Enum):
     ADULT = auto()
 
 
-@dataclass
+class FormId(IntEnum):
+    """Evolution form identifiers, usable as indexes into the form table."""
+    EGG = 0
+    BLOBLET = 1
+    BOUNCY = 2
+    BALANCED = 3
+    SLEEPY = 4
+    SPARKY = 5
+    ZIPPY = 6
+    CHILL = 7
+    DREAMY = 8
+    COZY = 9
+    ZAPPER = 10
+    DASHER = 11
+    LOAFER = 12
+    MYSTIC = 13
+    FLOOFY = 14
+
+
+class FeatureFlag(IntFlag):
+    """Bitmask of the special features the renderer acts on."""
+    ZIGZAG_ANTENNA = 1
+    SPEED_LINES = 2
+    CLOUD_EDGES = 4
+    FLUFFY_EDGES = 8
+    LIGHTNING_MARKS = 16
+    STAR_PARTICLES = 32
+    FLOATING_PARTICLES = 64
+    CRACK_LINES = 128
+    HALF_LIDDED_DEFAULT = 256
+    BLUSH_DEFAULT = 512
+    ROSY_CHEEKS = 1024
+
+
+# Plain-int copies for per-frame tests; IntFlag operators build new enum
+# members on every call and are much slower than int arithmetic
+_ZIGZAG_ANTENNA = int(FeatureFlag.ZIGZAG_ANTENNA)
+_SPEED_LINES = int(FeatureFlag.SPEED_LINES)
+_CLOUD_EDGES = int(FeatureFlag.CLOUD_EDGES)
+_FLUFFY_EDGES = int(FeatureFlag.FLUFFY_EDGES)
+_LIGHTNING_MARKS = int(FeatureFlag.LIGHTNING_MARKS)
+_STAR_PARTICLES = int(FeatureFlag.STAR_PARTICLES)
+_FLOATING_PARTICLES = int(FeatureFlag.FLOATING_PARTICLES)
+_CRACK_LINES = int(FeatureFlag.CRACK_LINES)
+_HALF_LIDDED_DEFAULT = int(FeatureFlag.HALF_LIDDED_DEFAULT)
+
+# Features drawn by _draw_special_features
+_SPECIAL_FEATURES = (
+    _ZIGZAG_ANTENNA | _SPEED_LINES | _CLOUD_EDGES | _FLUFFY_EDGES
+    | _LIGHTNING_MARKS | _STAR_PARTICLES | _FLOATING_PARTICLES
+)
+
+# Features that show blush marks without being asked to
+_BLUSH_FEATURES = int(FeatureFlag.BLUSH_DEFAULT | FeatureFlag.ROSY_CHEEKS)
+
+
+@dataclass(frozen=True)
 class FormAppearance:
     """
     Visual appearance configuration for an evolution form.
@@ -116,6 +268,11 @@ class FormAppearance:
         has_glow: Whether to show glow effect.
         expression_tendencies: Default expression emotions.
         special_features: List of special visual features.
+        body_width: Base body width in pixels before scaling.
+        body_height: Base body height in pixels before scaling.
+
+    ``derived_colors`` and ``feature_flags`` are computed on first access
+    and then cached on the instance.
     """
     form_id: str
     stage: EvolutionStage
@@ -129,18 +286,45 @@ class FormAppearance:
     limb_config: NubLimbs = field(default_factory=NubLimbs)
     expression_tendencies: Dict[str, float] = field(default_factory=dict)
     special_features: List[str] = field(default_factory=list)
+    body_width: int = 55
+    body_height: int = 50
+
+    @cached_property
+    def derived_colors(self) -> Dict[str, str]:
+        """Lightened/darkened colors the renderer draws every frame."""
+        primary = self.colors.primary
+        return {
+            "glow": lighten_color(primary, 0.3),
+            "aura": lighten_color(primary, 0.4),
+            "puff": lighten_color(primary, 0.3),
+            "fluff": lighten_color(primary, 0.2),
+            "mark": darken_color(primary, 0.7),
+            "particle": lighten_color(self.colors.secondary, 0.3),
+        }
+
+    @cached_property
+    def feature_flags(self) -> int:
+        """
+        FeatureFlag bits of the rendered special features, as a plain int.
 
-
-# Define all form appearances
-FORM_APPEARANCES: Dict[str, FormAppearance] = {}
+        Antenna forms always include ZIGZAG_ANTENNA.
+        """
+        flags = FeatureFlag(0)
+        for feature in self.special_features:
+            flag = FeatureFlag.__members__.get(feature.upper())
+            if flag is not None:
+                flags |= flag
+        if self.has_antenna:
+            flags |= FeatureFlag.ZIGZAG_ANTENNA
+        return int(flags)
 
 
-def _init_form_appearances() -> None:
-    """Initialize all form appearance configurations."""
-    global FORM_APPEARANCES
+def _init_form_appearances() -> Dict[str, FormAppearance]:
+    """Build all form appearance configurations, keyed by form name."""
+    appearances: Dict[str, FormAppearance] = {}
 
     # EGG Stage
-    FORM_APPEARANCES["egg"] = FormAppearance(
+    appearances["egg"] = FormAppearance(
         form_id="egg",
         stage=EvolutionStage.EGG,
         colors=BlobColors.from_form_id("egg") if "egg" in FORM_COLORS else BlobColors.from_primary(Colors.SOFT_CREAM),
@@ -151,7 +335,7 @@ def _init_form_appearances() -> None:
     )
 
     # BABY Stage (Bloblet)
-    FORM_APPEARANCES["bloblet"] = FormAppearance(
+    appearances["bloblet"] = FormAppearance(
         form_id="bloblet",
         stage=EvolutionStage.BABY,
         colors=BlobColors.from_form_id("bloblet") if "bloblet" in FORM_COLORS else BlobColors.from_primary(Colors.SOFT_PINK),
@@ -164,7 +348,7 @@ def _init_form_appearances() -> None:
     )
 
     # CHILD Stage (3 variants)
-    FORM_APPEARANCES["bouncy"] = FormAppearance(
+    appearances["bouncy"] = FormAppearance(
         form_id="bouncy",
         stage=EvolutionStage.CHILD,
         colors=BlobColors.from_primary(Colors.SOFT_YELLOW),
@@ -175,9 +359,11 @@ def _init_form_appearances() -> None:
         limb_config=NubLimbs(show_arms=True, show_legs=True),
         expression_tendencies={"happy": 0.7, "energetic": 0.8},
         special_features=["taller_shape", "bounce_lines"],
+        body_width=50,
+        body_height=55,
     )
 
-    FORM_APPEARANCES["balanced"] = FormAppearance(
+    appearances["balanced"] = FormAppearance(
         form_id="balanced",
         stage=EvolutionStage.CHILD,
         colors=BlobColors.from_primary(Colors.SOFT_BLUE),
@@ -190,7 +376,7 @@ def _init_form_appearances() -> None:
         special_features=["round_symmetric"],
     )
 
-    FORM_APPEARANCES["sleepy"] = FormAppearance(
+    appearances["sleepy"] = FormAppearance(
         form_id="sleepy",
         stage=EvolutionStage.CHILD,
         colors=BlobColors.from_primary(Colors.SOFT_LAVENDER),
@@ -201,10 +387,12 @@ def _init_form_appearances() -> None:
         limb_config=NubLimbs(show_arms=True, show_legs=True, arm_size=0.12),
         expression_tendencies={"sleepy": 0.5, "relaxed": 0.7},
         special_features=["droopy_shape", "melted_look"],
+        body_width=55,
+        body_height=45,
     )
 
     # TEEN Stage (5 variants)
-    FORM_APPEARANCES["sparky"] = FormAppearance(
+    appearances["sparky"] = FormAppearance(
         form_id="sparky",
         stage=EvolutionStage.TEEN,
         colors=BlobColors.from_primary(Colors.SOFT_YELLOW),
@@ -218,7 +406,7 @@ def _init_form_appearances() -> None:
         special_features=["angular_edges", "zigzag_antenna", "spark_particles"],
     )
 
-    FORM_APPEARANCES["zippy"] = FormAppearance(
+    appearances["zippy"] = FormAppearance(
         form_id="zippy",
         stage=EvolutionStage.TEEN,
         colors=BlobColors.from_primary(Colors.SOFT_ORANGE),
@@ -229,9 +417,11 @@ def _init_form_appearances() -> None:
         limb_config=NubLimbs(show_arms=True, show_legs=True, leg_size=0.15),
         expression_tendencies={"focused": 0.7, "determined": 0.6},
         special_features=["teardrop_shape", "speed_lines", "streamlined"],
+        body_width=45,
+        body_height=60,
     )
 
-    FORM_APPEARANCES["chill"] = FormAppearance(
+    appearances["chill"] = FormAppearance(
         form_id="chill",
         stage=EvolutionStage.TEEN,
         colors=BlobColors.from_primary(Colors.SOFT_BLUE),
@@ -244,7 +434,7 @@ def _init_form_appearances() -> None:
         special_features=["round_relaxed", "half_lidded_default"],
     )
 
-    FORM_APPEARANCES["dreamy"] = FormAppearance(
+    appearances["dreamy"] = FormAppearance(
         form_id="dreamy",
         stage=EvolutionStage.TEEN,
         colors=BlobColors.from_primary(Colors.SOFT_PURPLE),
@@ -258,7 +448,7 @@ def _init_form_appearances() -> None:
         special_features=["cloud_edges", "star_particles", "fluffy"],
     )
 
-    FORM_APPEARANCES["cozy"] = FormAppearance(
+    appearances["cozy"] = FormAppearance(
         form_id="cozy",
         stage=EvolutionStage.TEEN,
         colors=BlobColors.from_primary(Colors.SOFT_PINK),
@@ -269,10 +459,12 @@ def _init_form_appearances() -> None:
         limb_config=NubLimbs(show_arms=True, show_legs=True, arm_size=0.2),
         expression_tendencies={"content": 0.8, "warm": 0.7},
         special_features=["chunky_soft", "rosy_cheeks", "warm_glow"],
+        body_width=60,
+        body_height=50,
     )
 
     # ADULT Stage (5 variants)
-    FORM_APPEARANCES["zapper"] = FormAppearance(
+    appearances["zapper"] = FormAppearance(
         form_id="zapper",
         stage=EvolutionStage.ADULT,
         colors=BlobColors.from_primary(Colors.SOFT_YELLOW),
@@ -287,7 +479,7 @@ def _init_form_appearances() -> None:
         special_features=["sharp_features", "lightning_marks", "electric_glow", "spark_burst"],
     )
 
-    FORM_APPEARANCES["dasher"] = FormAppearance(
+    appearances["dasher"] = FormAppearance(
         form_id="dasher",
         stage=EvolutionStage.ADULT,
         colors=BlobColors.from_primary(Colors.SOFT_GREEN),
@@ -298,9 +490,11 @@ def _init_form_appearances() -> None:
         limb_config=NubLimbs(show_arms=True, show_legs=True, leg_size=0.18),
         expression_tendencies={"focused": 0.8, "determined": 0.7},
         special_features=["aerodynamic", "motion_blur", "speed_aura", "sleek"],
+        body_width=45,
+        body_height=50,
     )
 
-    FORM_APPEARANCES["loafer"] = FormAppearance(
+    appearances["loafer"] = FormAppearance(
         form_id="loafer",
         stage=EvolutionStage.ADULT,
         colors=BlobColors.from_primary(Colors.SOFT_BLUE),
@@ -311,9 +505,11 @@ def _init_form_appearances() -> None:
         limb_config=NubLimbs(show_arms=True, show_legs=True, arm_size=0.2, leg_size=0.15),
         expression_tendencies={"content": 0.9, "relaxed": 0.85},
         special_features=["big_relaxed", "content_smile", "soft_round"],
+        body_width=65,
+        body_height=55,
     )
 
-    FORM_APPEARANCES["mystic"] = FormAppearance(
+    appearances["mystic"] = FormAppearance(
         form_id="mystic",
         stage=EvolutionStage.ADULT,
         colors=BlobColors.from_primary(Colors.SOFT_PURPLE),
@@ -327,7 +523,7 @@ def _init_form_appearances() -> None:
         special_features=["ethereal_glow", "floating_particles", "aura", "sparkle_eyes"],
     )
 
-    FORM_APPEARANCES["floofy"] = FormAppearance(
+    appearances["floofy"] = FormAppearance(
         form_id="floofy",
         stage=EvolutionStage.ADULT,
         colors=BlobColors.from_primary(Colors.SOFT_PINK),
@@ -340,9 +536,52 @@ def _init_form_appearances() -> None:
         special_features=["fluffy_edges", "heart_particles", "blush_default", "soft_fur"],
     )
 
+    return appearances
+
+
+# Read-only form appearances, keyed by form name
+FORM_APPEARANCES: Mapping[str, FormAppearance] = MappingProxyType(_init_form_appearances())
+
+# Flat form table indexed by FormId, and the name -> FormId lookup
+_FORM_TABLE: Tuple[FormAppearance, ...] = tuple(
+    FORM_APPEARANCES[form.name.lower()] for form in FormId
+)
+FORM_IDS: Mapping[str, FormId] = MappingProxyType(
+    {form.name.lower(): form for form in FormId}
+)
+
+# Appearance used for unknown form names
+_DEFAULT_APPEARANCE = _FORM_TABLE[FormId.BLOBLET]
+
 
-# Initialize on module load
-_init_form_appearances()
+# Shared sprite and face renderers; forms pass their own size and colors
+_BLOB = BlobSprite()
+_EXPR = ExpressionRenderer()
+
+# Renderer numbers for slot tags; unlike id() they are never reused
+_RENDERER_NUMBERS = itertools.count()
+
+
+class _FeatureSlot:
+    """Persistent special feature items for one form drawn per frame."""
+
+    __slots__ = ("items", "static_args", "form", "tag", "face", "geometry_key", "geometry")
+
+    def __init__(self, tag: str) -> None:
+        self.items: Dict[str, List[int]] = {}
+        self.static_args: Dict[str, tuple] = {}
+        self.form: Optional[FormAppearance] = None
+        self.tag = tag
+        self.face = False
+        self.geometry_key: Optional[tuple] = None
+        self.geometry: Optional[tuple] = None
+
+
+def _forget_faces(expressions: ExpressionRenderer, slots: List[_FeatureSlot]) -> None:
+    """Drop the faces a garbage-collected renderer kept in its slots."""
+    for slot in slots:
+        if slot.face:
+            expressions.forget_face(slot.tag)
 
 
 class EvolutionSpriteRenderer:
@@ -351,35 +590,92 @@ class EvolutionSpriteRenderer:
 
     Handles drawing the unique visual features for each form,
     including special effects, shapes, and decorations.
+
+    Special feature items (antenna, puffs, fluff, particles, ...) and face
+    items persist across frames and are moved with ``coords`` instead of
+    being recreated.
+    They are rebuilt when the form or canvas changes and removed by
+    ``clear``.
+
+    To draw several forms per frame with one renderer, wrap the
+    ``draw_form`` calls in ``begin_frame``/``end_frame``; each call in the
+    frame then keeps its own persistent items.
     """
 
     def __init__(self) -> None:
         """Initialize the evolution sprite renderer."""
-        self.blob_sprite = BlobSprite()
-        self.expression_renderer = ExpressionRenderer()
+        self.blob_sprite = _BLOB
+        self.expression_renderer = _EXPR
         self._canvas_items: List[int] = []
 
-    def get_form_appearance(self, form_id: str) -> FormAppearance:
+        # Persistent feature items, one slot per form drawn in a frame
+        self._persistent_canvas: Optional[tk.Canvas] = None
+        self._hidden_items: set = set()
+        self._number = next(_RENDERER_NUMBERS)
+        self._slots: List[_FeatureSlot] = [self._new_slot(0)]
+        self._slot = self._slots[0]
+        # The shared face renderer keeps this renderer's faces by slot
+        # tag; drop them once the renderer is garbage-collected
+        weakref.finalize(self, _forget_faces, self.expression_renderer, self._slots)
+
+        # Canvas of the frame in progress, and draw_form calls made in it
+        self._frame_canvas: Optional[tk.Canvas] = None
+        self._frame_draws = 0
+
+        # Cached canvas viewport size for offscreen culling
+        self._view_canvas: Optional[tk.Canvas] = None
+        self._view_binding: Optional[str] = None
+        self._view_width = 0
+        self._view_height = 0
+
+    def begin_frame(self, canvas: tk.Canvas) -> None:
+        """
+        Start a frame of one or more ``draw_form`` calls.
+
+        Args:
+            canvas: Tkinter canvas the frame is drawn on.
+        """
+        self._frame_canvas = canvas
+        self._frame_draws = 0
+        self._canvas_items.clear()
+
+    def end_frame(self) -> None:
+        """
+        Finish the frame started by ``begin_frame``.
+
+        Releases persistent items of forms not drawn this frame, then
+        flushes the canvas redraw once for every form drawn in it.
+        """
+        canvas = self._frame_canvas
+        if canvas is None:
+            return
+        self._frame_canvas = None
+
+        for slot in self._slots[max(self._frame_draws, 1):]:
+            self._release_slot(slot)
+        del self._slots[max(self._frame_draws, 1):]
+        canvas.update_idletasks()
+
+    def get_form_appearance(self, form_id: Union[str, FormId]) -> FormAppearance:
         """
         Get the appearance configuration for a form.
 
         Args:
-            form_id: Form identifier.
+            form_id: Form name, or a FormId for a direct table index.
 
         Returns:
             FormAppearance for the form, or default if not found.
         """
-        return FORM_APPEARANCES.get(
-            form_id,
-            FORM_APPEARANCES.get("bloblet", FormAppearance("unknown", EvolutionStage.BABY))
-        )
+        if type(form_id) is FormId:
+            return _FORM_TABLE[form_id]
+        return FORM_APPEARANCES.get(form_id, _DEFAULT_APPEARANCE)
 
     def draw_form(
         self,
         canvas: tk.Canvas,
         x: float,
         y: float,
-        form_id: str,
+        form_id: Union[str, FormId],
         animation: Optional[AnimationParams] = None,
         eye_params: Optional[EyeParams] = None,
         mouth_params: Optional[MouthParams] = None,
@@ -394,7 +690,7 @@ class EvolutionSpriteRenderer:
             canvas: Tkinter canvas to draw on.
             x: Center X coordinate.
             y: Center Y coordinate.
-            form_id: Evolution form identifier.
+            form_id: Evolution form name or FormId.
             animation: Animation parameters.
             eye_params: Eye expression parameters.
             mouth_params: Mouth expression parameters.
@@ -403,54 +699,98 @@ class EvolutionSpriteRenderer:
             phase: Animation phase for effects.
 
         Returns:
-            List of canvas item IDs created.
+            List of canvas item IDs created this frame. Persistent special
+            feature and face items are not included; they are kept until
+            ``clear``.
+            Empty if the form lies entirely outside the canvas.
         """
-        self._canvas_items.clear()
+        if self._frame_canvas is None:
+            self._canvas_items.clear()
+            slot = self._slots[0]
+        else:
+            index = self._frame_draws
+            self._frame_draws += 1
+            if index == len(self._slots):
+                self._slots.append(self._new_slot(index))
+            slot = self._slots[index]
+        self._slot = slot
         items = []
+        extend = items.extend
 
         appearance = self.get_form_appearance(form_id)
         animation = animation or AnimationParams()
+        colors = appearance.colors
+        offset_x = animation.offset_x
+        offset_y = animation.offset_y
+
+        # Skip forms that are entirely outside the visible canvas
+        if canvas is not self._view_canvas:
+            self._watch_viewport(canvas)
+        if self._view_width > 1:
+            reach = _CULL_RADIUS * appearance.scale * animation.scale
+            center_x = x + offset_x
+            center_y = y + offset_y
+            if (
+                center_x + reach < 0
+                or center_x - reach > self._view_width
+                or center_y + reach < 0
+                or center_y - reach > self._view_height
+            ):
+                self._release_slot(slot)
+                return items
+
+        # Persistent features belong to one form on one canvas
+        if canvas is not self._persistent_canvas:
+            self._release_features()
+            self._persistent_canvas = canvas
+        elif (slot.items or slot.face) and (
+            appearance is not slot.form or not canvas.type(slot.tag)
+        ):
+            self._release_slot(slot)
+        slot.form = appearance
 
         # Apply form-specific scale and wobble
-        animation.scale *= appearance.scale
-        if appearance.wobble_intensity > 0:
-            animation.wobble = appearance.wobble_intensity
+        scale = animation.scale * appearance.scale
+        animation.scale = scale
+        wobble_intensity = appearance.wobble_intensity
+        if wobble_intensity > 0:
+            animation.wobble = wobble_intensity
             animation.wobble_phase = phase
 
-        # Update blob colors
-        self.blob_sprite.colors = appearance.colors
+        blob = self.blob_sprite
 
         # Draw based on stage
-        if appearance.stage == EvolutionStage.EGG:
-            items.extend(self._draw_egg(canvas, x, y, appearance, animation, phase))
+        if appearance.stage is EvolutionStage.EGG:
+            extend(self._draw_egg(canvas, x, y, appearance, animation, phase))
         else:
             # Draw main body
-            items.extend(self._draw_body(canvas, x, y, appearance, animation, phase))
+            extend(self._draw_body(canvas, x, y, appearance, animation, phase))
+
+            # Deformed body size, shared by the limbs and the face
+            width, height = blob.apply_squash_stretch(
+                animation.squash, animation.stretch,
+                appearance.body_width, appearance.body_height,
+            )
+            width *= scale
+            height *= scale
 
             # Draw limbs if applicable
             if appearance.has_limbs:
-                width, height = self.blob_sprite.apply_squash_stretch(
-                    animation.squash, animation.stretch
-                )
-                width *= animation.scale
-                height *= animation.scale
-                items.extend(draw_nub_limbs(
-                    canvas, x + animation.offset_x, y + animation.offset_y,
-                    width, height, appearance.colors, appearance.limb_config, phase
+                extend(draw_nub_limbs(
+                    canvas, x + offset_x, y + offset_y,
+                    width, height, colors, appearance.limb_config, phase
                 ))
 
             # Draw special features
-            items.extend(self._draw_special_features(
-                canvas, x, y, appearance, animation, phase
-            ))
+            self._draw_special_features(canvas, x, y, appearance, animation, phase)
 
             # Draw face
-            items.extend(self._draw_face(
-                canvas, x, y, appearance, animation,
+            extend(self._draw_face(
+                canvas, x + offset_x, y + offset_y, width, height, appearance,
                 eye_params, mouth_params, show_blush, show_sweat
             ))
 
-        self._canvas_items = items
+        self._canvas_items.extend(items)
         return items
 
     def _draw_egg(
@@ -472,67 +812,146 @@ class EvolutionSpriteRenderer:
             glow_id = canvas.create_oval(
                 x - glow_size, y - glow_size * 1.2,
                 x + glow_size, y + glow_size * 0.8,
-                fill=lighten_color(appearance.colors.primary, 0.3),
+                fill=appearance.derived_colors["glow"],
                 outline="",
             )
             items.append(glow_id)
 
         # Draw egg body
         egg_items = self.blob_sprite.draw_egg_shape(
-            canvas, x, y, animation.scale, animation
+            canvas, x, y, animation.scale, animation, colors=appearance.colors
         )
         items.extend(egg_items)
 
         # Crack lines
-        if "crack_lines" in appearance.special_features:
-            items.extend(self._draw_crack_lines(
-                canvas, x, y, animation.scale, phase
-            ))
+        if appearance.feature_flags & _CRACK_LINES:
+            self._update_static_feature(
+                canvas, "crack_lines", self._draw_crack_lines, x, y, animation.scale
+            )
+            canvas.tag_raise(self._slot.tag)
 
         return items
 
+    def _watch_viewport(self, canvas: tk.Canvas) -> None:
+        """Cache the canvas size and keep it current on resize."""
+        self._unwatch_viewport()
+        self._view_canvas = canvas
+        self._view_width = canvas.winfo_width()
+        self._view_height = canvas.winfo_height()
+        self._view_binding = canvas.bind("<Configure>", self._on_configure, add="+")
+
+    def _unwatch_viewport(self) -> None:
+        """Stop tracking the size of the watched canvas."""
+        if self._view_binding is not None:
+            unbind_handler(self._view_canvas, "<Configure>", self._view_binding)
+            self._view_binding = None
+        self._view_canvas = None
+        self._view_width = 0
+        self._view_height = 0
+
+    def _on_configure(self, event: tk.Event) -> None:
+        """Track the canvas viewport size for offscreen culling."""
+        if event.widget is self._view_canvas:
+            self._view_width = event.width
+            self._view_height = event.height
+
+    def _update_feature(self, canvas: tk.Canvas, key: str, draw_fn, *args) -> None:
+        """
+        Draw a persistent feature, reusing its items from the last frame.
+
+        Args:
+            canvas: Tkinter canvas to draw on.
+            key: Feature name the items are stored under.
+            draw_fn: Feature drawer taking ``(canvas, *args, reuse=...)``.
+            *args: Positional arguments for the drawer.
+        """
+        slot = self._slot
+        reuse = slot.items.get(key)
+        items = draw_fn(canvas, *args, reuse=reuse)
+        if items is not reuse:
+            for item_id in items:
+                canvas.addtag_withtag(slot.tag, item_id)
+            slot.items[key] = items
+
+    def _update_static_feature(self, canvas: tk.Canvas, key: str, draw_fn, *args) -> None:
+        """
+        Draw a persistent feature whose shape depends only on its arguments.
+
+        Marks and cracks do not animate, so their items are left untouched
+        while the arguments match the previous frame.
+        """
+        slot = self._slot
+        if slot.static_args.get(key) == args and key in slot.items:
+            return
+        slot.static_args[key] = args
+        self._update_feature(canvas, key, draw_fn, *args)
+
+    def _set_visible(self, canvas: tk.Canvas, item_id: int, visible: bool) -> None:
+        """Show or hide a persistent item, skipping no-op state changes."""
+        if visible == (item_id in self._hidden_items):
+            if visible:
+                self._hidden_items.discard(item_id)
+                canvas.itemconfigure(item_id, state=tk.NORMAL)
+            else:
+                self._hidden_items.add(item_id)
+                canvas.itemconfigure(item_id, state=tk.HIDDEN)
+
+    def _new_slot(self, index: int) -> _FeatureSlot:
+        """Create the persistent item slot for the index-th form in a frame."""
+        return _FeatureSlot(f"floob_form_features_{self._number}_{index}")
+
+    def _release_slot(self, slot: _FeatureSlot) -> None:
+        """Delete the persistent feature items kept in one slot."""
+        canvas = self._persistent_canvas
+        for feature_items in slot.items.values():
+            if canvas is not None:
+                canvas.delete(*feature_items)
+            self._hidden_items.difference_update(feature_items)
+        slot.items.clear()
+        slot.static_args.clear()
+        if slot.face:
+            self.expression_renderer.release_face(slot.tag)
+            slot.face = False
+
+    def _release_features(self) -> None:
+        """Delete all persistent feature items."""
+        for slot in self._slots:
+            self._release_slot(slot)
+        self._hidden_items.clear()
+
     def _draw_crack_lines(
         self,
         canvas: tk.Canvas,
         x: float,
         y: float,
         scale: float,
-        phase: float,
+        reuse: Optional[List[int]] = None,
     ) -> List[int]:
         """Draw subtle crack lines on the egg."""
-        items = []
-
         # Small cracks that appear over time
         crack_color = "#D0D0D0"
         base_size = 25 * scale
 
-        # Main crack (zigzag)
-        crack1_points = [
-            x - base_size * 0.3, y - base_size * 0.2,
-            x - base_size * 0.15, y - base_size * 0.1,
-            x - base_size * 0.25, y + base_size * 0.1,
-            x - base_size * 0.1, y + base_size * 0.2,
-        ]
+        # Main crack (zigzag) and a secondary smaller crack
+        crack1_points = _template_points(_CRACK_MAIN, x, y, base_size)
+        crack2_points = _template_points(_CRACK_SMALL, x, y, base_size)
+
+        if reuse is not None:
+            canvas.coords(reuse[0], crack1_points)
+            canvas.coords(reuse[1], crack2_points)
+            return reuse
+
         crack1_id = canvas.create_line(
             crack1_points,
             fill=crack_color,
             width=1,
         )
-        items.append(crack1_id)
-
-        # Secondary smaller crack
-        crack2_points = [
-            x + base_size * 0.2, y - base_size * 0.15,
-            x + base_size * 0.1, y,
-        ]
         crack2_id = canvas.create_line(
             crack2_points,
             fill=crack_color,
             width=1,
         )
-        items.append(crack2_id)
-
-        return items
+        return [crack1_id, crack2_id]
 
     def _draw_body(
         self,
@@ -546,39 +965,19 @@ class EvolutionSpriteRenderer:
         """Draw the main blob body for non-egg stages."""
         items = []
 
-        # Form-specific body modifications
-        if "taller_shape" in appearance.special_features:
-            self.blob_sprite.base_height = 55
-            self.blob_sprite.base_width = 50
-        elif "teardrop_shape" in appearance.special_features:
-            self.blob_sprite.base_height = 60
-            self.blob_sprite.base_width = 45
-        elif "droopy_shape" in appearance.special_features:
-            self.blob_sprite.base_height = 45
-            self.blob_sprite.base_width = 55
-        elif "chunky_soft" in appearance.special_features:
-            self.blob_sprite.base_height = 50
-            self.blob_sprite.base_width = 60
-        elif "big_relaxed" in appearance.special_features:
-            self.blob_sprite.base_height = 55
-            self.blob_sprite.base_width = 65
-        elif "aerodynamic" in appearance.special_features:
-            self.blob_sprite.base_height = 50
-            self.blob_sprite.base_width = 45
-        else:
-            # Default proportions
-            self.blob_sprite.base_height = 50
-            self.blob_sprite.base_width = 55
+        # Form-specific body proportions
+        base_width = appearance.body_width
+        base_height = appearance.body_height
 
         # Draw glow effect behind body if applicable
         if appearance.has_glow:
-            glow_pulse = 1.0 + math.sin(phase * 1.5) * 0.08
-            width = self.blob_sprite.base_width * animation.scale * glow_pulse
-            height = self.blob_sprite.base_height * animation.scale * glow_pulse
+            glow_scale = animation.scale * (1.0 + math.sin(phase * 1.5) * 0.08)
+            width = base_width * glow_scale
+            height = base_height * glow_scale
             glow_id = canvas.create_oval(
                 x - width * 0.6, y - height * 0.6,
                 x + width * 0.6, y + height * 0.6,
-                fill=lighten_color(appearance.colors.primary, 0.4),
+                fill=appearance.derived_colors["aura"],
                 outline="",
             )
             items.append(glow_id)
@@ -587,7 +986,10 @@ class EvolutionSpriteRenderer:
         body_items = self.blob_sprite.draw(
             canvas, x, y,
             scale_x=1.0, scale_y=1.0,
-            animation=animation
+            animation=animation,
+            base_width=base_width,
+            base_height=base_height,
+            colors=appearance.colors,
         )
         items.extend(body_items)
 
@@ -601,40 +1003,53 @@ class EvolutionSpriteRenderer:
         appearance: FormAppearance,
         animation: AnimationParams,
         phase: float,
-    ) -> List[int]:
-        """Draw form-specific special features."""
-        items = []
+    ) -> None:
+        """Draw or update the persistent form-specific special features."""
+        flags = appearance.feature_flags
+        if not flags & _SPECIAL_FEATURES:
+            return
+
         scale = animation.scale
+        derived = appearance.derived_colors
+        update = self._update_feature
 
         # Antenna (for sparky, zapper)
-        if appearance.has_antenna or "zigzag_antenna" in appearance.special_features:
-            items.extend(self._draw_antenna(canvas, x, y, scale, phase, appearance.colors))
+        if flags & _ZIGZAG_ANTENNA:
+            # Sway in half-pixel steps so still frames skip the antenna
+            sway = round(math.sin(phase * 3) * 6) * 0.5
+            self._update_static_feature(
+                canvas, "antenna", self._draw_antenna, x, y, scale, sway, appearance.colors
+            )
 
         # Speed lines (for zippy, dasher)
-        if "speed_lines" in appearance.special_features:
-            items.extend(self._draw_speed_lines(canvas, x, y, scale, phase))
+        if flags & _SPEED_LINES:
+            update(canvas, "speed_lines", self._draw_speed_lines, x, y, scale, phase)
 
         # Cloud edges (for dreamy)
-        if "cloud_edges" in appearance.special_features:
-            items.extend(self._draw_cloud_puffs(canvas, x, y, scale, phase, appearance.colors))
+        if flags & _CLOUD_EDGES:
+            update(canvas, "cloud_puffs", self._draw_cloud_puffs, x, y, scale, phase, derived["puff"])
 
         # Fluffy edges (for floofy)
-        if "fluffy_edges" in appearance.special_features:
-            items.extend(self._draw_fluffy_edges(canvas, x, y, scale, phase, appearance.colors))
+        if flags & _FLUFFY_EDGES:
+            update(canvas, "fluffy_edges", self._draw_fluffy_edges, x, y, scale, phase, derived["fluff"])
 
         # Lightning marks (for zapper)
-        if "lightning_marks" in appearance.special_features:
-            items.extend(self._draw_lightning_marks(canvas, x, y, scale, appearance.colors))
+        if flags & _LIGHTNING_MARKS:
+            self._update_static_feature(
+                canvas, "lightning_marks", self._draw_lightning_marks, x, y, scale, derived["mark"]
+            )
 
         # Star particles (for dreamy, mystic)
-        if "star_particles" in appearance.special_features:
-            items.extend(self._draw_star_particles(canvas, x, y, scale, phase))
+        if flags & _STAR_PARTICLES:
+            update(canvas, "star_particles", self._draw_star_particles, x, y, scale, phase)
 
         # Floating particles (for mystic)
-        if "floating_particles" in appearance.special_features:
-            items.extend(self._draw_floating_particles(canvas, x, y, scale, phase, appearance.colors))
+        if flags & _FLOATING_PARTICLES:
+            update(canvas, "floating_particles", self._draw_floating_particles, x, y, scale, phase, derived["particle"])
 
-        return items
+        # Keep reused items above this frame's body and limbs
+        if self._slot.items:
+            canvas.tag_raise(self._slot.tag)
 
     def _draw_antenna(
         self,
@@ -642,45 +1057,45 @@ class EvolutionSpriteRenderer:
         x: float,
         y: float,
         scale: float,
-        phase: float,
+        sway: float,
         colors: BlobColors,
+        reuse: Optional[List[int]] = None,
     ) -> List[int]:
-        """Draw a zigzag antenna on top of the blob."""
-        items = []
-
-        # Antenna sway
-        sway = math.sin(phase * 3) * 3
-
+        """Draw a zigzag antenna on top of the blob, swayed by ``sway`` pixels."""
         # Zigzag points
         base_y = y - 30 * scale
         points = [
-            x + sway * 0.2, base_y,
-            x + 5 + sway * 0.5, base_y - 8 * scale,
-            x - 3 + sway * 0.7, base_y - 16 * scale,
-            x + 4 + sway, base_y - 24 * scale,
+            coord
+            for dx, sway_k, dy in _ANTENNA_TEMPLATE
+            for coord in (x + dx + sway * sway_k, base_y + dy * scale)
         ]
 
+        # Ball at top
+        ball_x = x + 4 + sway
+        ball_y = base_y - 24 * scale
+        ball_size = 5 * scale
+        ball_coords = (
+            ball_x - ball_size, ball_y - ball_size,
+            ball_x + ball_size, ball_y + ball_size,
+        )
+
+        if reuse is not None:
+            canvas.coords(reuse[0], points)
+            canvas.coords(reuse[1], ball_coords)
+            return reuse
+
         # Draw antenna line
         line_id = canvas.create_line(
             points,
             fill=colors.outline,
             width=2,
         )
-        items.append(line_id)
-
-        # Ball at top
-        ball_x = x + 4 + sway
-        ball_y = base_y - 24 * scale
-        ball_size = 5 * scale
         ball_id = canvas.create_oval(
-            ball_x - ball_size, ball_y - ball_size,
-            ball_x + ball_size, ball_y + ball_size,
+            *ball_coords,
             fill=colors.secondary,
             outline=colors.outline,
         )
-        items.append(ball_id)
-
-        return items
+        return [line_id, ball_id]
 
     def _draw_speed_lines(
         self,
@@ -689,6 +1104,7 @@ class EvolutionSpriteRenderer:
         y: float,
         scale: float,
         phase: float,
+        reuse: Optional[List[int]] = None,
     ) -> List[int]:
         """Draw speed/motion lines behind the blob."""
         items = []
@@ -698,17 +1114,24 @@ class EvolutionSpriteRenderer:
             offset_y = (i - 1) * 12 * scale
             offset_x = -40 * scale - (phase * 20) % 30
             length = 15 + (i * 5)
-
-            line_id = canvas.create_line(
+            coords = (
                 x + offset_x, y + offset_y,
                 x + offset_x - length * scale, y + offset_y,
+            )
+
+            if reuse is not None:
+                canvas.coords(reuse[i], coords)
+                continue
+
+            line_id = canvas.create_line(
+                *coords,
                 fill=line_color,
                 width=2,
                 capstyle=tk.ROUND,
             )
             items.append(line_id)
 
-        return items
+        return reuse if reuse is not None else items
 
     def _draw_cloud_puffs(
         self,
@@ -717,30 +1140,43 @@ class EvolutionSpriteRenderer:
         y: float,
         scale: float,
         phase: float,
-        colors: BlobColors,
+        puff_color: str,
+        reuse: Optional[List[int]] = None,
     ) -> List[int]:
         """Draw fluffy cloud-like puffs around the blob."""
         items = []
 
-        puff_color = lighten_color(colors.primary, 0.3)
         num_puffs = 5
         radius = 35 * scale
+        radius_y = radius * 0.7
+
+        # Rotate the fixed puff angles by the drift phase
+        cos_p = math.cos(phase * 0.5)
+        sin_p = math.sin(phase * 0.5)
+        phase2 = phase * 2
+        sin = math.sin
+
+        for i, (cos_a, sin_a) in enumerate(_angle_table(num_puffs)):
+            puff_x = x + (cos_a * cos_p - sin_a * sin_p) * radius
+            puff_y = y + (sin_a * cos_p + cos_a * sin_p) * radius_y
+            puff_size = (8 + sin(phase2 + i) * 3) * scale
+            coords = (
+                puff_x - puff_size, puff_y - puff_size,
+                puff_x + puff_size, puff_y + puff_size,
+            )
 
-        for i in range(num_puffs):
-            angle = (i / num_puffs) * 2 * math.pi + phase * 0.5
-            puff_x = x + math.cos(angle) * radius
-            puff_y = y + math.sin(angle) * radius * 0.7
-            puff_size = (8 + math.sin(phase * 2 + i) * 3) * scale
+            if reuse is not None:
+                canvas.coords(reuse[i], coords)
+                continue
 
             puff_id = canvas.create_oval(
-                puff_x - puff_size, puff_y - puff_size,
-                puff_x + puff_size, puff_y + puff_size,
+                *coords,
                 fill=puff_color,
                 outline="",
             )
             items.append(puff_id)
 
-        return items
+        return reuse if reuse is not None else items
 
     def _draw_fluffy_edges(
         self,
@@ -749,31 +1185,41 @@ class EvolutionSpriteRenderer:
         y: float,
         scale: float,
         phase: float,
-        colors: BlobColors,
+        fluff_color: str,
+        reuse: Optional[List[int]] = None,
     ) -> List[int]:
         """Draw fluffy/fuzzy edges around the blob."""
         items = []
 
-        fluff_color = lighten_color(colors.primary, 0.2)
         num_fluffs = 8
         radius = 32 * scale
+        radius_y = radius * 0.8
+        phase2 = phase * 2
+        phase3 = phase * 3
+        sin = math.sin
+
+        for i, (cos_a, sin_a) in enumerate(_angle_table(num_fluffs)):
+            wobble = sin(phase3 + i * 0.5) * 2
+            fluff_x = x + cos_a * (radius + wobble)
+            fluff_y = y + sin_a * (radius_y + wobble)
+            fluff_size = (5 + sin(phase2 + i) * 2) * scale
+            coords = (
+                fluff_x - fluff_size, fluff_y - fluff_size,
+                fluff_x + fluff_size, fluff_y + fluff_size,
+            )
 
-        for i in range(num_fluffs):
-            angle = (i / num_fluffs) * 2 * math.pi
-            wobble = math.sin(phase * 3 + i * 0.5) * 2
-            fluff_x = x + math.cos(angle) * (radius + wobble)
-            fluff_y = y + math.sin(angle) * (radius * 0.8 + wobble)
-            fluff_size = (5 + math.sin(phase * 2 + i) * 2) * scale
+            if reuse is not None:
+                canvas.coords(reuse[i], coords)
+                continue
 
             fluff_id = canvas.create_oval(
-                fluff_x - fluff_size, fluff_y - fluff_size,
-                fluff_x + fluff_size, fluff_y + fluff_size,
+                *coords,
                 fill=fluff_color,
                 outline="",
             )
             items.append(fluff_id)
 
-        return items
+        return reuse if reuse is not None else items
 
     def _draw_lightning_marks(
         self,
@@ -781,42 +1227,30 @@ class EvolutionSpriteRenderer:
         x: float,
         y: float,
         scale: float,
-        colors: BlobColors,
+        mark_color: str,
+        reuse: Optional[List[int]] = None,
     ) -> List[int]:
         """Draw lightning bolt marks on the body."""
-        items = []
+        # Left and right lightning marks
+        left_points = _template_points(_LIGHTNING_LEFT, x, y, scale)
+        right_points = _template_points(_LIGHTNING_RIGHT, x, y, scale)
 
-        mark_color = darken_color(colors.primary, 0.7)
+        if reuse is not None:
+            canvas.coords(reuse[0], left_points)
+            canvas.coords(reuse[1], right_points)
+            return reuse
 
-        # Left lightning mark
-        left_points = [
-            x - 15 * scale, y - 5 * scale,
-            x - 10 * scale, y,
-            x - 18 * scale, y + 5 * scale,
-            x - 12 * scale, y + 10 * scale,
-        ]
         left_id = canvas.create_line(
             left_points,
             fill=mark_color,
             width=2,
         )
-        items.append(left_id)
-
-        # Right lightning mark
-        right_points = [
-            x + 15 * scale, y - 5 * scale,
-            x + 10 * scale, y,
-            x + 18 * scale, y + 5 * scale,
-            x + 12 * scale, y + 10 * scale,
-        ]
         right_id = canvas.create_line(
             right_points,
             fill=mark_color,
             width=2,
         )
-        items.append(right_id)
-
-        return items
+        return [left_id, right_id]
 
     def _draw_star_particles(
         self,
@@ -825,31 +1259,51 @@ class EvolutionSpriteRenderer:
         y: float,
         scale: float,
         phase: float,
+        reuse: Optional[List[int]] = None,
     ) -> List[int]:
         """Draw floating star particles around the blob."""
         items = []
 
         star_color = Colors.SOFT_YELLOW
+        star_size = 4 * scale
         num_stars = 4
 
-        for i in range(num_stars):
+        radius = 45 * scale
+        radius_y = radius * 0.6
+        center_y = y - 10 * scale
+        cos_p = math.cos(phase)
+        sin_p = math.sin(phase)
+        tick = math.floor(phase * 2)
+
+        for i, (cos_a, sin_a) in enumerate(_angle_table(num_stars)):
+            # Fade in/out based on phase; star i runs i ticks ahead
+            visible = _STAR_VISIBLE[(tick + i) & 3]
+
             # Orbit around the blob
-            angle = (i / num_stars) * 2 * math.pi + phase
-            radius = 45 * scale
-            star_x = x + math.cos(angle) * radius
-            star_y = y + math.sin(angle) * radius * 0.6 - 10 * scale
-
-            # Fade in/out based on phase
-            if (phase + i * 0.5) % 2 < 1.5:
-                star_id = canvas.create_text(
-                    star_x, star_y,
-                    text="*",
-                    font=("Arial", int(8 * scale)),
-                    fill=star_color,
-                )
-                items.append(star_id)
+            star_x = x + (cos_a * cos_p - sin_a * sin_p) * radius
+            star_y = center_y + (sin_a * cos_p + cos_a * sin_p) * radius_y
+            points = [
+                coord
+                for dx, dy in _STAR_TEMPLATE
+                for coord in (star_x + dx * star_size, star_y + dy * star_size)
+            ]
+
+            if reuse is not None:
+                star_id = reuse[i]
+                if visible:
+                    canvas.coords(star_id, points)
+                self._set_visible(canvas, star_id, visible)
+                continue
+
+            star_id = canvas.create_polygon(
+                points,
+                fill=star_color,
+                outline="",
+            )
+            self._set_visible(canvas, star_id, visible)
+            items.append(star_id)
 
-        return items
+        return reuse if reuse is not None else items
 
     def _draw_floating_particles(
         self,
@@ -858,100 +1312,135 @@ class EvolutionSpriteRenderer:
         y: float,
         scale: float,
         phase: float,
-        colors: BlobColors,
+        particle_color: str,
+        reuse: Optional[List[int]] = None,
     ) -> List[int]:
         """Draw ethereal floating particles."""
         items = []
 
-        particle_color = lighten_color(colors.secondary, 0.3)
         num_particles = 6
 
+        if np is not None:
+            layout = np.empty(num_particles * 5)
+            _floating_particle_layout(layout, x, y, scale, phase)
+            layout = layout.tolist()
+        else:
+            layout = [0.0] * (num_particles * 5)
+            _floating_particle_layout(layout, x, y, scale, phase)
+
         for i in range(num_particles):
-            # Float upward and fade
-            offset_phase = phase + i * 0.4
-            float_y = (offset_phase * 15) % 50
-            fade = 1.0 - (float_y / 50)
-
-            if fade > 0.2:
-                p_x = x + math.sin(offset_phase * 2 + i) * 30 * scale
-                p_y = y - 20 * scale - float_y * scale
-                p_size = (3 + fade * 2) * scale
-
-                p_id = canvas.create_oval(
-                    p_x - p_size, p_y - p_size,
-                    p_x + p_size, p_y + p_size,
-                    fill=particle_color,
-                    outline="",
-                )
-                items.append(p_id)
+            j = i * 5
+            coords = layout[j:j + 4]
+            visible = layout[j + 4] > 0.0
+
+            if reuse is not None:
+                p_id = reuse[i]
+                if visible:
+                    canvas.coords(p_id, coords)
+                self._set_visible(canvas, p_id, visible)
+                continue
+
+            p_id = canvas.create_oval(
+                *coords,
+                fill=particle_color,
+                outline="",
+            )
+            self._set_visible(canvas, p_id, visible)
+            items.append(p_id)
 
-        return items
+        return reuse if reuse is not None else items
 
     def _draw_face(
         self,
         canvas: tk.Canvas,
-        x: float,
-        y: float,
+        face_x: float,
+        face_y: float,
+        width: float,
+        height: float,
         appearance: FormAppearance,
-        animation: AnimationParams,
         eye_params: Optional[EyeParams],
         mouth_params: Optional[MouthParams],
         show_blush: bool,
         show_sweat: bool,
     ) -> List[int]:
-        """Draw the face (eyes, mouth, extras)."""
+        """Draw the face (eyes, mouth, extras) for a body of the given size."""
         items = []
 
-        # Calculate face dimensions
-        width, height = self.blob_sprite.apply_squash_stretch(
-            animation.squash, animation.stretch
-        )
-        width *= animation.scale
-        height *= animation.scale
-
-        face_x = x + animation.offset_x
-        face_y = y + animation.offset_y
-
-        # Apply form-specific eye size
+        # Apply form-specific eye size and expression tendencies to a copy,
+        # leaving the caller's (possibly shared) params untouched
         eye_params = eye_params or EyeParams()
-        eye_params.size_multiplier *= appearance.eye_size_mult
-
-        # Apply expression tendencies
-        if "half_lidded_default" in appearance.special_features:
+        flags = appearance.feature_flags
+        overrides = {}
+        if appearance.eye_size_mult != 1.0:
+            overrides["size_multiplier"] = eye_params.size_multiplier * appearance.eye_size_mult
+        if flags & _HALF_LIDDED_DEFAULT:
             if eye_params.emotion == EyeEmotion.NORMAL:
-                eye_params.emotion = EyeEmotion.SLEEPY
-                eye_params.openness = 0.6
+                overrides["emotion"] = EyeEmotion.SLEEPY
+                overrides["openness"] = 0.6
+        if overrides:
+            eye_params = replace(eye_params, **overrides)
+
+        # Face items persist with the slot's features, under its tag
+        expressions = self.expression_renderer
+        slot = self._slot
+        face_id = slot.tag
+        slot.face = True
+
+        # Eye/mouth layout only changes with the body size and params
+        mouth_params = mouth_params or MouthParams()
+        geometry_key = (width, height, eye_params.size_multiplier, mouth_params.width)
+        if slot.geometry_key != geometry_key:
+            slot.geometry_key = geometry_key
+            slot.geometry = expressions.face_geometry(width, height, eye_params, mouth_params)
+        geometry = slot.geometry
 
         # Draw eyes
-        items.extend(self.expression_renderer.draw_eyes(
-            canvas, face_x, face_y, width, height, eye_params
-        ))
+        expressions.draw_eyes(
+            canvas, face_x, face_y, width, height, eye_params,
+            face_id=face_id, geometry=geometry,
+        )
 
         # Draw mouth
-        mouth_params = mouth_params or MouthParams()
-        items.extend(self.expression_renderer.draw_mouth(
-            canvas, face_x, face_y, width, height, mouth_params
-        ))
+        expressions.draw_mouth(
+            canvas, face_x, face_y, width, height, mouth_params,
+            face_id=face_id, geometry=geometry,
+        )
 
         # Draw blush if applicable
-        if show_blush or "blush_default" in appearance.special_features or "rosy_cheeks" in appearance.special_features:
-            items.extend(self.expression_renderer.draw_blush(
-                canvas, face_x, face_y, width, height
-            ))
+        if show_blush or flags & _BLUSH_FEATURES:
+            expressions.draw_blush(
+                canvas, face_x, face_y, width, height, face_id=face_id
+            )
+        else:
+            expressions.release_face(face_id, "blush")
 
         # Draw sweat drop if applicable
         if show_sweat:
-            items.extend(self.expression_renderer.draw_sweat_drop(
-                canvas, face_x, face_y, width, height
-            ))
+            expressions.draw_sweat_drop(
+                canvas, face_x, face_y, width, height, face_id=face_id
+            )
+        else:
+            expressions.release_face(face_id, "sweat")
 
         return items
 
     def clear(self, canvas: tk.Canvas) -> None:
-        """Clear all canvas items."""
+        """Clear all canvas items, including persistent feature items."""
         for item_id in self._canvas_items:
             canvas.delete(item_id)
         self._canvas_items.clear()
+        self._release_features()
+        self._unwatch_viewport()
+
+
+# Scale factor per evolution stage, indexed by EvolutionStage.value - 1
+_STAGE_SCALES = (
+    SpritesConfig.EGG_SCALE,
+    SpritesConfig.BABY_SCALE,
+    SpritesConfig.CHILD_SCALE,
+    SpritesConfig.TEEN_SCALE,
+    SpritesConfig.ADULT_SCALE,
+)
 
 
 def get_stage_scale(stage: EvolutionStage) -> float:
@@ -962,13 +1451,8 @@ def get_stage_scale(stage: EvolutionStage) -> float:
         stage: Evolution stage.
 
     Returns:
-        Scale factor (0.0-1.0).
+        Scale factor (0.0-1.0), or 1.0 if ``stage`` is not an EvolutionStage.
     """
-    scales = {
-        EvolutionStage.EGG: SpritesConfig.EGG_SCALE,
-        EvolutionStage.BABY: SpritesConfig.BABY_SCALE,
-        EvolutionStage.CHILD: SpritesConfig.CHILD_SCALE,
-        EvolutionStage.TEEN: SpritesConfig.TEEN_SCALE,
-        EvolutionStage.ADULT: SpritesConfig.ADULT_SCALE,
-    }
-    return scales.get(stage, 1.0)
+    if type(stage) is EvolutionStage:
+        return _STAGE_SCALES[stage.value - 1]
+    return 1.0
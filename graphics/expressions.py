@@ -26,10 +26,12 @@ Mouth Emotions:
 from __future__ import annotations
 
 import math
+import sys
 import tkinter as tk
 from dataclasses import dataclass
+from functools import lru_cache
 from enum import Enum, auto
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 # Import colors
 try:
@@ -41,6 +43,78 @@ except ImportError:
         BLACK = "#2D2D2D"
         WHITE = "#FFFFFF"
 
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Palette colors used by the drawers, bound once
+_SOFT_BLUE = Colors.SOFT_BLUE
+_WHITE = Colors.WHITE
+
+# Face colors, read as module globals by the drawers
+_EYE_COLOR = "#2D2D2D"  # Near black
+_EYE_WHITE = "#FFFFFF"
+_HIGHLIGHT_COLOR = "#FFFFFF"
+_MOUTH_COLOR = "#2D2D2D"
+_MOUTH_INSIDE_COLOR = "#3D3D3D"
+_TONGUE_COLOR = "#FFADAD"  # Soft pink/red
+_BLUSH_COLOR = "#FFD6E0"  # Soft pink
+_SWEAT_COLOR = "#A2D2FF"  # Soft blue
+_HEART_COLOR = "#FF6B8A"  # Pink-red
+
+# Optional vectorized eye layout for drawing many faces at once
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional: PIL lets a whole face be pre-rendered into one image
+try:
+    from PIL import Image, ImageDraw, ImageTk
+except ImportError:
+    Image = None
+
+# Pre-rendered face images kept before the oldest are dropped
+_FACE_IMAGE_LIMIT = 256
+
+# Tk option constants, bound once for the drawers
+_ROUND = tk.ROUND
+_ARC = tk.ARC
+
+# Eating mouth chomp: |sin(phase * 4 pi)| opens and closes 4 times per unit phase
+_sin = math.sin
+_CHOMP_RATE = math.pi * 4
+
+# Unit 4-pointed star for the sparkle highlight: (cos, sin, radius) per vertex
+_STAR_UNIT = tuple(
+    (math.cos(i * math.pi / 4), math.sin(i * math.pi / 4), 1.0 if i % 2 == 0 else 0.4)
+    for i in range(8)
+)
+
+
+def _heart_unit(count: int = 24) -> Tuple[Tuple[float, float], ...]:
+    """
+    Sample a unit heart outline for the love eyes.
+
+    Uses the classic parametric heart, scaled so a heart of size 1 spans
+    x in [-0.8, 0.8] and y in [-0.6, 0.8] around the eye center.
+    """
+    raw = []
+    for i in range(count):
+        t = 2 * math.pi * i / count
+        raw.append((
+            16 * math.sin(t) ** 3,
+            -(13 * math.cos(t) - 5 * math.cos(2 * t) - 2 * math.cos(3 * t) - math.cos(4 * t)),
+        ))
+    top = min(py for _, py in raw)
+    bottom = max(py for _, py in raw)
+    return tuple(
+        (px / 16 * 0.8, -0.6 + (py - top) / (bottom - top) * 1.4)
+        for px, py in raw
+    )
+
+
+_HEART_UNIT = _heart_unit()
+
 
 class EyeEmotion(Enum):
     """Eye expression types."""
@@ -67,15 +141,26 @@ class MouthEmotion(Enum):
     WORRIED = auto()
 
 
-@dataclass
+def _quantize(value: float) -> float:
+    """Round an expression parameter to 0.1 steps."""
+    return round(value * 10) / 10
+
+
+@dataclass(frozen=True, **_SLOTS)
 class EyeParams:
     """
     Parameters for eye rendering.
 
+    Instances are immutable so they can be shared (see
+    ``get_expression_for_mood``); use ``dataclasses.replace`` to derive
+    variants.
+
     Attributes:
         emotion: Current eye emotion.
-        openness: How open the eyes are (0.0 = closed, 1.0 = fully open).
-        direction: Tuple of (x, y) offset for looking direction.
+        openness: How open the eyes are (0.0 = closed, 1.0 = fully open),
+            quantized to 0.1 steps.
+        direction: Tuple of (x, y) offset for looking direction, quantized
+            to 0.1 steps.
         size_multiplier: Eye size multiplier (babies have bigger eyes).
         pupil_size: Pupil size relative to eye.
         highlight: Whether to show highlight/sparkle.
@@ -87,37 +172,219 @@ class EyeParams:
     pupil_size: float = 0.5
     highlight: bool = True
 
+    def __post_init__(self) -> None:
+        # Quantize so jittering inputs still hit the face caches
+        object.__setattr__(self, "openness", _quantize(self.openness))
+        look_x, look_y = self.direction
+        object.__setattr__(self, "direction", (_quantize(look_x), _quantize(look_y)))
+
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class MouthParams:
     """
     Parameters for mouth rendering.
 
+    Instances are immutable; use ``dataclasses.replace`` to derive variants.
+
     Attributes:
         emotion: Current mouth emotion.
-        openness: How open the mouth is (0.0 = closed, 1.0 = fully open).
+        openness: How open the mouth is (0.0 = closed, 1.0 = fully open),
+            quantized to 0.1 steps. For EATING it is the chomp animation
+            phase instead and is kept as given.
         width: Mouth width multiplier.
     """
     emotion: MouthEmotion = MouthEmotion.NEUTRAL
     openness: float = 0.0
     width: float = 1.0
 
+    def __post_init__(self) -> None:
+        if self.emotion is not MouthEmotion.EATING:
+            object.__setattr__(self, "openness", _quantize(self.openness))
+
+
+class _ShapeRecorder:
+    """
+    Canvas stand-in that records ``create_*`` calls instead of issuing them.
+
+    Lets the drawers run unchanged while ExpressionRenderer decides whether
+    to create the shapes or move the items kept from the previous frame.
+    """
+
+    __slots__ = ("shapes",)
+
+    def __init__(self) -> None:
+        self.shapes: List[Tuple[str, tuple, dict]] = []
+
+    def _record(self, kind: str, coords: tuple, options: dict) -> int:
+        # Tags are assigned when the recorded shapes become canvas items
+        del options["tags"]
+        self.shapes.append((kind, coords, options))
+        return len(self.shapes) - 1
+
+    def create_oval(self, *coords, **options) -> int:
+        return self._record("oval", coords, options)
+
+    def create_line(self, *coords, **options) -> int:
+        return self._record("line", coords, options)
+
+    def create_arc(self, *coords, **options) -> int:
+        return self._record("arc", coords, options)
+
+    def create_polygon(self, *coords, **options) -> int:
+        return self._record("polygon", coords, options)
+
+
+class _FacePart:
+    """Persistent canvas items of one part (eyes, mouth, ...) of a face."""
+
+    __slots__ = ("canvas", "tag", "items", "styles", "args")
+
+    def __init__(self, canvas: tk.Canvas, tag: str) -> None:
+        self.canvas = canvas
+        self.tag = tag
+        self.items: List[int] = []
+        self.styles: List[Tuple[str, dict]] = []
+        self.args: Optional[tuple] = None
+
+
+def _smooth_points(
+    points: List[Tuple[float, float]],
+    closed: bool,
+    steps: int = 8,
+) -> List[Tuple[float, float]]:
+    """
+    Sample the parabolic spline Tk draws for ``smooth=True`` items.
+
+    Each interior control point pulls a quadratic segment running between
+    the midpoints of its neighbouring edges; open lines start and end on
+    their first and last points.
+    """
+    count = len(points)
+    if count < 3:
+        return list(points)
+
+    def mid(a: Tuple[float, float], b: Tuple[float, float]) -> Tuple[float, float]:
+        return ((a[0] + b[0]) * 0.5, (a[1] + b[1]) * 0.5)
+
+    if closed:
+        segments = [
+            (mid(points[i - 1], points[i]), points[i], mid(points[i], points[(i + 1) % count]))
+            for i in range(count)
+        ]
+    else:
+        segments = [
+            (
+                points[0] if i == 1 else mid(points[i - 1], points[i]),
+                points[i],
+                points[-1] if i == count - 2 else mid(points[i], points[i + 1]),
+            )
+            for i in range(1, count - 1)
+        ]
+
+    sampled = [segments[0][0]]
+    for (x0, y0), (cx, cy), (x1, y1) in segments:
+        for step in range(1, steps + 1):
+            t = step / steps
+            u = 1.0 - t
+            sampled.append((
+                u * u * x0 + 2 * u * t * cx + t * t * x1,
+                u * u * y0 + 2 * u * t * cy + t * t * y1,
+            ))
+    return sampled
+
+
+def rasterize_shapes(
+    shapes: List[Tuple[str, tuple, dict]],
+) -> Optional[Tuple[int, int, "Image.Image"]]:
+    """
+    Rasterize recorded face shapes into one RGBA image.
+
+    Also used for BlobRenderer's pre-rendered sprites. Needs Pillow.
+
+    Args:
+        shapes: ``(kind, coords, options)`` for each canvas create_* call,
+            in drawing order (as recorded by a _ShapeRecorder).
+
+    Returns:
+        Tuple of (left, top, image), or None if nothing was drawn.
+    """
+    flat = []
+    for kind, coords, options in shapes:
+        if len(coords) == 1:
+            coords = tuple(coords[0])
+        flat.append((kind, coords, options))
+    if not flat:
+        return None
+
+    margin = 2 + max(options.get("width", 1) for _, _, options in flat)
+    xs = [x for _, coords, _ in flat for x in coords[0::2]]
+    ys = [y for _, coords, _ in flat for y in coords[1::2]]
+    left = int(math.floor(min(xs))) - margin
+    top = int(math.floor(min(ys))) - margin
+    width = int(math.ceil(max(xs))) - left + margin
+    height = int(math.ceil(max(ys))) - top + margin
+
+    image = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    for kind, coords, options in flat:
+        points = [
+            (coords[i] - left, coords[i + 1] - top)
+            for i in range(0, len(coords), 2)
+        ]
+        fill = options.get("fill") or None
+        outline = options.get("outline") or None
+        line_width = options.get("width", 1)
+
+        if kind in ("oval", "arc"):
+            (x0, y0), (x1, y1) = points
+            box = (min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))
+            if kind == "oval":
+                draw.ellipse(box, fill=fill, outline=outline, width=line_width)
+            else:
+                # Tk angles run counter-clockwise on screen, PIL's clockwise
+                start = options.get("start", 0.0)
+                end = start + options.get("extent", 90.0)
+                draw.arc(box, -max(start, end), -min(start, end), fill=outline, width=line_width)
+        elif kind == "line":
+            if options.get("smooth"):
+                points = _smooth_points(points, closed=False)
+            draw.line(points, fill=fill or "black", width=line_width, joint="curve")
+            if options.get("capstyle") == _ROUND and line_width > 1:
+                radius = line_width / 2
+                for px, py in (points[0], points[-1]):
+                    draw.ellipse((px - radius, py - radius, px + radius, py + radius), fill=fill or "black")
+        else:  # polygon
+            if options.get("smooth"):
+                points = _smooth_points(points, closed=True)
+            draw.polygon(points, fill=fill, outline=outline)
+
+    return left, top, image
+
 
 class ExpressionRenderer:
     """
     Renders facial expressions (eyes and mouth) on blob sprites.
 
     Uses simple shapes to convey emotions without complex details.
+
+    The ``draw_*`` methods create new canvas items on every call unless a
+    ``face_id`` is given. Items drawn for a face id are kept and moved with
+    ``coords`` on the next call for that face, and are only recreated when
+    the shapes change (e.g. a new emotion). Remove them with
+    ``release_face`` or ``clear``.
+
+    Every item drawn carries the renderer's ``tag``, so ``clear`` removes
+    them all with a single delete.
     """
 
-    # Default colors
-    EYE_COLOR = "#2D2D2D"  # Near black
-    EYE_WHITE = "#FFFFFF"
-    HIGHLIGHT_COLOR = "#FFFFFF"
-    MOUTH_COLOR = "#2D2D2D"
-    TONGUE_COLOR = "#FFADAD"  # Soft pink/red
-    BLUSH_COLOR = "#FFD6E0"  # Soft pink
-    SWEAT_COLOR = "#A2D2FF"  # Soft blue
+    # Default colors (the drawers read the module-level constants)
+    EYE_COLOR = _EYE_COLOR
+    EYE_WHITE = _EYE_WHITE
+    HIGHLIGHT_COLOR = _HIGHLIGHT_COLOR
+    MOUTH_COLOR = _MOUTH_COLOR
+    TONGUE_COLOR = _TONGUE_COLOR
+    BLUSH_COLOR = _BLUSH_COLOR
+    SWEAT_COLOR = _SWEAT_COLOR
 
     def __init__(
         self,
@@ -144,6 +411,74 @@ class ExpressionRenderer:
         self.base_mouth_width = base_mouth_width
         self._canvas_items: List[int] = []
 
+        # Tag on every item this renderer draws, so clear is one delete
+        self.tag = f"floob_expression_{id(self)}"
+
+        # Persistent items per (face id, part)
+        self._face_parts: Dict[Tuple[str, str], _FacePart] = {}
+        # Pre-rendered faces: (Tk interpreter, params, size) -> (left, top, image)
+        self._face_images: Dict[tuple, Tuple[int, int, "ImageTk.PhotoImage"]] = {}
+
+        # Emotion -> (bound drawer, argument kind, returns a single id).
+        # Resolved once per call instead of walking an if/elif ladder for
+        # every eye.
+        self._eye_dispatch: Dict[EyeEmotion, Tuple[Callable[..., object], str, bool]] = {
+            EyeEmotion.NORMAL: (self._draw_normal_eye, "look_highlight", False),
+            EyeEmotion.BLINK: (self._draw_closed_eye, "basic", True),
+            EyeEmotion.HAPPY: (self._draw_happy_eye, "basic", True),
+            EyeEmotion.SAD: (self._draw_sad_eye, "basic", True),
+            EyeEmotion.SURPRISED: (self._draw_surprised_eye, "surprised", False),
+            EyeEmotion.SLEEPY: (self._draw_sleepy_eye, "openness", False),
+            EyeEmotion.SPARKLE: (self._draw_sparkle_eye, "look", False),
+            EyeEmotion.ANGRY: (self._draw_angry_eye, "side", False),
+            EyeEmotion.LOVE: (self._draw_heart_eye, "basic", True),
+        }
+        # Single-shape mouths return one item id; "multi" drawers a list
+        self._mouth_dispatch: Dict[MouthEmotion, Tuple[Callable[..., object], str]] = {
+            MouthEmotion.NEUTRAL: (self._draw_neutral_mouth, "single"),
+            MouthEmotion.HAPPY: (self._draw_happy_mouth, "single"),
+            MouthEmotion.SAD: (self._draw_sad_mouth, "single"),
+            MouthEmotion.OPEN: (self._draw_open_mouth, "single_openness"),
+            MouthEmotion.EATING: (self._draw_eating_mouth, "multi_openness"),
+            MouthEmotion.YAWN: (self._draw_yawn_mouth, "multi_openness"),
+            MouthEmotion.SMIRK: (self._draw_smirk_mouth, "single"),
+            MouthEmotion.WORRIED: (self._draw_worried_mouth, "single"),
+        }
+
+    def face_geometry(
+        self,
+        face_width: float,
+        face_height: float,
+        eye_params: Optional[EyeParams] = None,
+        mouth_params: Optional[MouthParams] = None,
+    ) -> Tuple[float, float, float, float, float]:
+        """
+        Compute the position-independent eye and mouth layout of a face.
+
+        The result only changes with the face size and params, so callers
+        drawing the same face every frame can keep it and pass it to
+        ``draw_eyes``/``draw_mouth`` as ``geometry``.
+
+        Args:
+            face_width: Width of face.
+            face_height: Height of face.
+            eye_params: Eye rendering parameters.
+            mouth_params: Mouth rendering parameters.
+
+        Returns:
+            Tuple of (eye Y offset, eye X offset, eye size, mouth Y offset,
+            mouth width).
+        """
+        eye_params = eye_params or EyeParams()
+        mouth_params = mouth_params or MouthParams()
+        return (
+            face_height * self.eye_height,
+            face_width * self.eye_spacing,
+            self.base_eye_size * eye_params.size_multiplier,
+            face_height * self.mouth_height,
+            self.base_mouth_width * mouth_params.width,
+        )
+
     def draw_eyes(
         self,
         canvas: tk.Canvas,
@@ -152,6 +487,8 @@ class ExpressionRenderer:
         face_width: float,
         face_height: float,
         params: Optional[EyeParams] = None,
+        face_id: Optional[str] = None,
+        geometry: Optional[Tuple[float, float, float, float, float]] = None,
     ) -> List[int]:
         """
         Draw eyes on the blob face.
@@ -163,85 +500,153 @@ class ExpressionRenderer:
             face_width: Width of face.
             face_height: Height of face.
             params: Eye rendering parameters.
+            face_id: Key to keep and reuse this face's items across calls.
+            geometry: Precomputed ``face_geometry`` for this face size and
+                params, to skip recomputing it.
 
         Returns:
-            List of canvas item IDs created.
+            List of canvas item IDs created (or reused, with ``face_id``).
         """
         params = params or EyeParams()
         items = []
+        if face_id is None:
+            target = canvas
+        else:
+            face_args = (face_x, face_y, face_width, face_height, params)
+            kept = self._unchanged_face_part(canvas, face_id, "eyes", face_args)
+            if kept is not None:
+                return kept
+            target = _ShapeRecorder()
 
         # Calculate eye positions
-        eye_y = face_y + face_height * self.eye_height
-        eye_offset = face_width * self.eye_spacing
-        eye_size = self.base_eye_size * params.size_multiplier
+        if geometry is None:
+            eye_y = face_y + face_height * self.eye_height
+            eye_offset = face_width * self.eye_spacing
+            eye_size = self.base_eye_size * params.size_multiplier
+        else:
+            eye_dy, eye_offset, eye_size = geometry[:3]
+            eye_y = face_y + eye_dy
 
         # Apply look direction
         look_x, look_y = params.direction
         look_x = max(-1.0, min(1.0, look_x)) * eye_size * 0.3
         look_y = max(-1.0, min(1.0, look_y)) * eye_size * 0.2
 
-        # Draw both eyes
-        for side in [-1, 1]:  # -1 = left, 1 = right
-            eye_x = face_x + side * eye_offset
-
-            if params.emotion == EyeEmotion.BLINK or params.openness <= 0.1:
-                # Closed eyes - horizontal line
-                items.extend(self._draw_closed_eye(
-                    canvas, eye_x, eye_y, eye_size
-                ))
+        # Resolve the drawer once for both eyes
+        if params.openness <= 0.1:
+            drawer, kind, single = self._draw_closed_eye, "basic", True
+        else:
+            drawer, kind, single = self._eye_dispatch.get(
+                params.emotion, self._eye_dispatch[EyeEmotion.NORMAL]
+            )
 
-            elif params.emotion == EyeEmotion.HAPPY:
-                # Happy eyes - upward arc (^ shape)
-                items.extend(self._draw_happy_eye(
-                    canvas, eye_x, eye_y, eye_size
-                ))
+        if kind == "basic":
+            args = (eye_size,)
+        elif kind == "look_highlight":
+            args = (eye_size, look_x, look_y, params.highlight)
+        elif kind == "surprised":
+            args = (eye_size * 1.3, look_x, look_y, params.highlight)
+        elif kind == "openness":
+            args = (eye_size, params.openness)
+        else:  # "look", "side"
+            args = (eye_size, look_x, look_y)
+
+        # Draw both eyes (left, then right)
+        left_x = face_x - eye_offset
+        right_x = face_x + eye_offset
+        add = items.append if single else items.extend
+        if kind == "side":
+            add(drawer(target, left_x, eye_y, eye_size, -1, look_x, look_y))
+            add(drawer(target, right_x, eye_y, eye_size, 1, look_x, look_y))
+        else:
+            add(drawer(target, left_x, eye_y, *args))
+            add(drawer(target, right_x, eye_y, *args))
+
+        if face_id is not None:
+            return self._update_face_part(
+                canvas, face_id, "eyes", face_args, target.shapes
+            )
+        return items
 
-            elif params.emotion == EyeEmotion.SAD:
-                # Sad eyes - downward arc
-                items.extend(self._draw_sad_eye(
-                    canvas, eye_x, eye_y, eye_size
-                ))
+    def draw_eyes_batch(
+        self,
+        canvas: tk.Canvas,
+        face_xs: Sequence[float],
+        face_ys: Sequence[float],
+        face_widths: Sequence[float],
+        face_heights: Sequence[float],
+        params: Sequence[Optional[EyeParams]],
+    ) -> List[int]:
+        """
+        Draw eyes for many faces at once.
 
-            elif params.emotion == EyeEmotion.SURPRISED:
-                # Surprised - large circles
-                items.extend(self._draw_surprised_eye(
-                    canvas, eye_x, eye_y, eye_size * 1.3,
-                    look_x, look_y, params.highlight
-                ))
+        Equivalent to calling ``draw_eyes`` for each face in order. When
+        NumPy is available the eye and highlight rectangles of all normal
+        (dot) eyes are computed in one vectorized pass; other emotions
+        use the regular per-face drawers.
 
-            elif params.emotion == EyeEmotion.SLEEPY:
-                # Sleepy - half-closed, droopy
-                items.extend(self._draw_sleepy_eye(
-                    canvas, eye_x, eye_y, eye_size, params.openness
-                ))
+        Args:
+            canvas: Tkinter canvas to draw on.
+            face_xs: Center X of each face.
+            face_ys: Center Y of each face.
+            face_widths: Width of each face.
+            face_heights: Height of each face.
+            params: Eye rendering parameters per face.
 
-            elif params.emotion == EyeEmotion.SPARKLE:
-                # Sparkle - star highlight
-                items.extend(self._draw_sparkle_eye(
-                    canvas, eye_x, eye_y, eye_size,
-                    look_x, look_y
-                ))
+        Returns:
+            List of canvas item IDs created.
+        """
+        params = [p or EyeParams() for p in params]
+        if np is None or not params:
+            items = []
+            for face in zip(face_xs, face_ys, face_widths, face_heights, params):
+                items.extend(self.draw_eyes(canvas, *face))
+            return items
 
-            elif params.emotion == EyeEmotion.ANGRY:
-                # Angry - angled brows
-                items.extend(self._draw_angry_eye(
-                    canvas, eye_x, eye_y, eye_size, side,
-                    look_x, look_y
-                ))
+        # Face geometry as one array per quantity
+        xs = np.asarray(face_xs, dtype=float)
+        heights = np.asarray(face_heights, dtype=float)
+        eye_y = np.asarray(face_ys, dtype=float) + heights * self.eye_height
+        eye_offset = np.asarray(face_widths, dtype=float) * self.eye_spacing
+        size = self.base_eye_size * np.array([p.size_multiplier for p in params])
+        direction = np.array([p.direction for p in params], dtype=float)
+        look_x = np.clip(direction[:, 0], -1.0, 1.0) * size * 0.3
+        look_y = np.clip(direction[:, 1], -1.0, 1.0) * size * 0.2
+
+        # Dot eye and highlight rectangles, rows are [left, right] per face
+        eye_x = np.stack((xs - eye_offset, xs + eye_offset), axis=1)
+        size2 = size[:, None]
+        look_x2 = look_x[:, None]
+        eye_y2 = eye_y[:, None]
+        look_y2 = look_y[:, None]
+        eye_rects = np.stack(np.broadcast_arrays(
+            eye_x - size2 + look_x2, eye_y2 - size2 + look_y2,
+            eye_x + size2 + look_x2, eye_y2 + size2 + look_y2,
+        ), axis=2).tolist()
+        hl_size = size2 * 0.35
+        hl_x = eye_x - size2 * 0.3 + look_x2
+        hl_y = eye_y2 - size2 * 0.3 + look_y2
+        hl_rects = np.stack(np.broadcast_arrays(
+            hl_x - hl_size, hl_y - hl_size, hl_x + hl_size, hl_y + hl_size,
+        ), axis=2).tolist()
 
-            elif params.emotion == EyeEmotion.LOVE:
-                # Heart eyes
-                items.extend(self._draw_heart_eye(
-                    canvas, eye_x, eye_y, eye_size
+        items = []
+        create_oval = canvas.create_oval
+        tag = self.tag
+        for i, p in enumerate(params):
+            if p.emotion is not EyeEmotion.NORMAL or p.openness <= 0.1:
+                items.extend(self.draw_eyes(
+                    canvas, face_xs[i], face_ys[i], face_widths[i], face_heights[i], p
                 ))
-
-            else:  # NORMAL
-                # Normal dot eyes with optional highlight
-                items.extend(self._draw_normal_eye(
-                    canvas, eye_x, eye_y, eye_size,
-                    look_x, look_y, params.highlight
+                continue
+            for eye_rect, hl_rect in zip(eye_rects[i], hl_rects[i]):
+                items.append(create_oval(
+                    *eye_rect, fill=_EYE_COLOR, outline="", tags=tag
                 ))
-
+                if p.highlight:
+                    items.append(create_oval(
+                        *hl_rect, fill=_HIGHLIGHT_COLOR, outline="", tags=tag
+                    ))
         return items
 
     def _draw_normal_eye(
@@ -261,8 +666,9 @@ class ExpressionRenderer:
         eye_id = canvas.create_oval(
             x - size + look_x, y - size + look_y,
             x + size + look_x, y + size + look_y,
-            fill=self.EYE_COLOR,
+            fill=_EYE_COLOR,
             outline="",
+            tags=self.tag,
         )
         items.append(eye_id)
 
@@ -274,8 +680,9 @@ class ExpressionRenderer:
             hl_id = canvas.create_oval(
                 hl_x - hl_size, hl_y - hl_size,
                 hl_x + hl_size, hl_y + hl_size,
-                fill=self.HIGHLIGHT_COLOR,
+                fill=_HIGHLIGHT_COLOR,
                 outline="",
+                tags=self.tag,
             )
             items.append(hl_id)
 
@@ -287,18 +694,16 @@ class ExpressionRenderer:
         x: float,
         y: float,
         size: float,
-    ) -> List[int]:
+    ) -> int:
         """Draw a closed eye (horizontal line)."""
-        items = []
-        line_id = canvas.create_line(
+        return canvas.create_line(
             x - size, y,
             x + size, y,
-            fill=self.EYE_COLOR,
+            fill=_EYE_COLOR,
             width=2,
-            capstyle=tk.ROUND,
+            capstyle=_ROUND,
+            tags=self.tag,
         )
-        items.append(line_id)
-        return items
 
     def _draw_happy_eye(
         self,
@@ -306,20 +711,18 @@ class ExpressionRenderer:
         x: float,
         y: float,
         size: float,
-    ) -> List[int]:
+    ) -> int:
         """Draw a happy eye (^ arc)."""
-        items = []
         # Draw upward arc
-        arc_id = canvas.create_arc(
+        return canvas.create_arc(
             x - size, y - size * 0.5,
             x + size, y + size * 1.5,
             start=0, extent=180,
-            style=tk.ARC,
-            outline=self.EYE_COLOR,
+            style=_ARC,
+            outline=_EYE_COLOR,
             width=2,
+            tags=self.tag,
         )
-        items.append(arc_id)
-        return items
 
     def _draw_sad_eye(
         self,
@@ -327,20 +730,18 @@ class ExpressionRenderer:
         x: float,
         y: float,
         size: float,
-    ) -> List[int]:
+    ) -> int:
         """Draw a sad eye (v arc, slightly droopy)."""
-        items = []
         # Draw downward arc
-        arc_id = canvas.create_arc(
+        return canvas.create_arc(
             x - size, y - size * 1.2,
             x + size, y + size * 0.8,
             start=180, extent=180,
-            style=tk.ARC,
-            outline=self.EYE_COLOR,
+            style=_ARC,
+            outline=_EYE_COLOR,
             width=2,
+            tags=self.tag,
         )
-        items.append(arc_id)
-        return items
 
     def _draw_surprised_eye(
         self,
@@ -359,9 +760,10 @@ class ExpressionRenderer:
         white_id = canvas.create_oval(
             x - size + look_x * 0.3, y - size + look_y * 0.3,
             x + size + look_x * 0.3, y + size + look_y * 0.3,
-            fill=self.EYE_WHITE,
-            outline=self.EYE_COLOR,
+            fill=_EYE_WHITE,
+            outline=_EYE_COLOR,
             width=1,
+            tags=self.tag,
         )
         items.append(white_id)
 
@@ -370,8 +772,9 @@ class ExpressionRenderer:
         pupil_id = canvas.create_oval(
             x - pupil_size + look_x, y - pupil_size + look_y,
             x + pupil_size + look_x, y + pupil_size + look_y,
-            fill=self.EYE_COLOR,
+            fill=_EYE_COLOR,
             outline="",
+            tags=self.tag,
         )
         items.append(pupil_id)
 
@@ -383,8 +786,9 @@ class ExpressionRenderer:
             hl_id = canvas.create_oval(
                 hl_x - hl_size, hl_y - hl_size,
                 hl_x + hl_size, hl_y + hl_size,
-                fill=self.HIGHLIGHT_COLOR,
+                fill=_HIGHLIGHT_COLOR,
                 outline="",
+                tags=self.tag,
             )
             items.append(hl_id)
 
@@ -403,7 +807,7 @@ class ExpressionRenderer:
 
         if openness < 0.3:
             # Nearly closed - just a line
-            return self._draw_closed_eye(canvas, x, y, size)
+            return [self._draw_closed_eye(canvas, x, y, size)]
 
         # Half-closed eye with droopy lid
         # Draw the eye
@@ -411,8 +815,9 @@ class ExpressionRenderer:
         eye_id = canvas.create_oval(
             x - size, y - eye_height,
             x + size, y + eye_height,
-            fill=self.EYE_COLOR,
+            fill=_EYE_COLOR,
             outline="",
+            tags=self.tag,
         )
         items.append(eye_id)
 
@@ -422,9 +827,10 @@ class ExpressionRenderer:
             x - size * 1.2, lid_y - size,
             x + size * 1.2, lid_y + size * 0.5,
             start=0, extent=-180,
-            style=tk.ARC,
-            outline=self.EYE_COLOR,
+            style=_ARC,
+            outline=_EYE_COLOR,
             width=2,
+            tags=self.tag,
         )
         items.append(lid_id)
 
@@ -446,8 +852,9 @@ class ExpressionRenderer:
         eye_id = canvas.create_oval(
             x - size + look_x, y - size + look_y,
             x + size + look_x, y + size + look_y,
-            fill=self.EYE_COLOR,
+            fill=_EYE_COLOR,
             outline="",
+            tags=self.tag,
         )
         items.append(eye_id)
 
@@ -458,17 +865,15 @@ class ExpressionRenderer:
 
         # Draw 4-pointed star
         points = []
-        for i in range(8):
-            angle = i * math.pi / 4
-            r = star_size if i % 2 == 0 else star_size * 0.4
-            px = star_x + math.cos(angle) * r
-            py = star_y + math.sin(angle) * r
-            points.extend([px, py])
+        for cos_a, sin_a, radius in _STAR_UNIT:
+            r = star_size * radius
+            points.extend((star_x + cos_a * r, star_y + sin_a * r))
 
         star_id = canvas.create_polygon(
             points,
-            fill=self.HIGHLIGHT_COLOR,
+            fill=_HIGHLIGHT_COLOR,
             outline="",
+            tags=self.tag,
         )
         items.append(star_id)
 
@@ -491,8 +896,9 @@ class ExpressionRenderer:
         eye_id = canvas.create_oval(
             x - size + look_x, y - size + look_y,
             x + size + look_x, y + size + look_y,
-            fill=self.EYE_COLOR,
+            fill=_EYE_COLOR,
             outline="",
+            tags=self.tag,
         )
         items.append(eye_id)
 
@@ -503,9 +909,10 @@ class ExpressionRenderer:
         brow_id = canvas.create_line(
             inner_x, brow_y + size * 0.3,
             outer_x, brow_y - size * 0.2,
-            fill=self.EYE_COLOR,
+            fill=_EYE_COLOR,
             width=2,
-            capstyle=tk.ROUND,
+            capstyle=_ROUND,
+            tags=self.tag,
         )
         items.append(brow_id)
 
@@ -517,42 +924,20 @@ class ExpressionRenderer:
         x: float,
         y: float,
         size: float,
-    ) -> List[int]:
-        """Draw a heart-shaped eye (love eyes)."""
-        items = []
-
-        # Simple heart using overlapping circles and triangle
-        heart_color = "#FF6B8A"  # Pink-red
-
-        # Top circles of heart
-        c_size = size * 0.6
-        left_id = canvas.create_oval(
-            x - size * 0.8, y - size * 0.6,
-            x, y + size * 0.2,
-            fill=heart_color,
-            outline="",
-        )
-        items.append(left_id)
-
-        right_id = canvas.create_oval(
-            x, y - size * 0.6,
-            x + size * 0.8, y + size * 0.2,
-            fill=heart_color,
-            outline="",
-        )
-        items.append(right_id)
-
-        # Bottom point of heart
-        point_id = canvas.create_polygon(
-            x - size * 0.7, y - size * 0.1,
-            x + size * 0.7, y - size * 0.1,
-            x, y + size * 0.8,
-            fill=heart_color,
+    ) -> int:
+        """Draw a heart-shaped eye (love eyes) as one smoothed polygon."""
+        points = [
+            coord
+            for unit_x, unit_y in _HEART_UNIT
+            for coord in (x + unit_x * size, y + unit_y * size)
+        ]
+        return canvas.create_polygon(
+            points,
+            fill=_HEART_COLOR,
             outline="",
+            smooth=True,
+            tags=self.tag,
         )
-        items.append(point_id)
-
-        return items
 
     def draw_mouth(
         self,
@@ -562,6 +947,8 @@ class ExpressionRenderer:
         face_width: float,
         face_height: float,
         params: Optional[MouthParams] = None,
+        face_id: Optional[str] = None,
+        geometry: Optional[Tuple[float, float, float, float, float]] = None,
     ) -> List[int]:
         """
         Draw mouth on the blob face.
@@ -573,46 +960,47 @@ class ExpressionRenderer:
             face_width: Width of face.
             face_height: Height of face.
             params: Mouth rendering parameters.
+            face_id: Key to keep and reuse this face's items across calls.
+            geometry: Precomputed ``face_geometry`` for this face size and
+                params, to skip recomputing it.
 
         Returns:
-            List of canvas item IDs created.
+            List of canvas item IDs created (or reused, with ``face_id``).
         """
         params = params or MouthParams()
         items = []
-
-        mouth_y = face_y + face_height * self.mouth_height
-        mouth_width = self.base_mouth_width * params.width
-
-        if params.emotion == MouthEmotion.NEUTRAL:
-            items.extend(self._draw_neutral_mouth(canvas, face_x, mouth_y, mouth_width))
-
-        elif params.emotion == MouthEmotion.HAPPY:
-            items.extend(self._draw_happy_mouth(canvas, face_x, mouth_y, mouth_width))
-
-        elif params.emotion == MouthEmotion.SAD:
-            items.extend(self._draw_sad_mouth(canvas, face_x, mouth_y, mouth_width))
-
-        elif params.emotion == MouthEmotion.OPEN:
-            items.extend(self._draw_open_mouth(
-                canvas, face_x, mouth_y, mouth_width, params.openness
+        if face_id is None:
+            target = canvas
+        else:
+            face_args = (face_x, face_y, face_width, face_height, params)
+            kept = self._unchanged_face_part(canvas, face_id, "mouth", face_args)
+            if kept is not None:
+                return kept
+            target = _ShapeRecorder()
+
+        if geometry is None:
+            mouth_y = face_y + face_height * self.mouth_height
+            mouth_width = self.base_mouth_width * params.width
+        else:
+            mouth_y = face_y + geometry[3]
+            mouth_width = geometry[4]
+
+        drawer, kind = self._mouth_dispatch.get(params.emotion, (None, ""))
+        if kind == "single":
+            items.append(drawer(target, face_x, mouth_y, mouth_width))
+        elif kind == "single_openness":
+            items.append(drawer(
+                target, face_x, mouth_y, mouth_width, params.openness
             ))
-
-        elif params.emotion == MouthEmotion.EATING:
-            items.extend(self._draw_eating_mouth(
-                canvas, face_x, mouth_y, mouth_width, params.openness
-            ))
-
-        elif params.emotion == MouthEmotion.YAWN:
-            items.extend(self._draw_yawn_mouth(
-                canvas, face_x, mouth_y, mouth_width, params.openness
+        elif kind == "multi_openness":
+            items.extend(drawer(
+                target, face_x, mouth_y, mouth_width, params.openness
             ))
 
-        elif params.emotion == MouthEmotion.SMIRK:
-            items.extend(self._draw_smirk_mouth(canvas, face_x, mouth_y, mouth_width))
-
-        elif params.emotion == MouthEmotion.WORRIED:
-            items.extend(self._draw_worried_mouth(canvas, face_x, mouth_y, mouth_width))
-
+        if face_id is not None:
+            return self._update_face_part(
+                canvas, face_id, "mouth", face_args, target.shapes
+            )
         return items
 
     def _draw_neutral_mouth(
@@ -621,18 +1009,16 @@ class ExpressionRenderer:
         x: float,
         y: float,
         width: float,
-    ) -> List[int]:
+    ) -> int:
         """Draw a neutral mouth (small horizontal line)."""
-        items = []
-        line_id = canvas.create_line(
+        return canvas.create_line(
             x - width * 0.3, y,
             x + width * 0.3, y,
-            fill=self.MOUTH_COLOR,
+            fill=_MOUTH_COLOR,
             width=2,
-            capstyle=tk.ROUND,
+            capstyle=_ROUND,
+            tags=self.tag,
         )
-        items.append(line_id)
-        return items
 
     def _draw_happy_mouth(
         self,
@@ -640,19 +1026,17 @@ class ExpressionRenderer:
         x: float,
         y: float,
         width: float,
-    ) -> List[int]:
+    ) -> int:
         """Draw a happy smile (upward curve)."""
-        items = []
-        arc_id = canvas.create_arc(
+        return canvas.create_arc(
             x - width, y - width * 0.8,
             x + width, y + width * 0.6,
             start=200, extent=140,
-            style=tk.ARC,
-            outline=self.MOUTH_COLOR,
+            style=_ARC,
+            outline=_MOUTH_COLOR,
             width=2,
+            tags=self.tag,
         )
-        items.append(arc_id)
-        return items
 
     def _draw_sad_mouth(
         self,
@@ -660,19 +1044,17 @@ class ExpressionRenderer:
         x: float,
         y: float,
         width: float,
-    ) -> List[int]:
+    ) -> int:
         """Draw a sad frown (downward curve)."""
-        items = []
-        arc_id = canvas.create_arc(
+        return canvas.create_arc(
             x - width * 0.8, y,
             x + width * 0.8, y + width,
             start=20, extent=140,
-            style=tk.ARC,
-            outline=self.MOUTH_COLOR,
+            style=_ARC,
+            outline=_MOUTH_COLOR,
             width=2,
+            tags=self.tag,
         )
-        items.append(arc_id)
-        return items
 
     def _draw_open_mouth(
         self,
@@ -681,19 +1063,17 @@ class ExpressionRenderer:
         y: float,
         width: float,
         openness: float,
-    ) -> List[int]:
+    ) -> int:
         """Draw an open mouth (oval)."""
-        items = []
         open_amt = max(0.3, openness) * width * 0.6
-        mouth_id = canvas.create_oval(
+        return canvas.create_oval(
             x - width * 0.5, y - open_amt * 0.3,
             x + width * 0.5, y + open_amt,
-            fill="#3D3D3D",
-            outline=self.MOUTH_COLOR,
+            fill=_MOUTH_INSIDE_COLOR,
+            outline=_MOUTH_COLOR,
             width=1,
+            tags=self.tag,
         )
-        items.append(mouth_id)
-        return items
 
     def _draw_eating_mouth(
         self,
@@ -706,15 +1086,16 @@ class ExpressionRenderer:
         """Draw an eating/chomping mouth."""
         items = []
         # Animate between open and closed
-        open_amt = abs(math.sin(openness * math.pi * 4)) * width * 0.5 + 3
+        open_amt = abs(_sin(openness * _CHOMP_RATE)) * width * 0.5 + 3
 
         # Mouth opening
         mouth_id = canvas.create_oval(
             x - width * 0.6, y - open_amt * 0.3,
             x + width * 0.6, y + open_amt,
-            fill=self.TONGUE_COLOR,
-            outline=self.MOUTH_COLOR,
+            fill=_TONGUE_COLOR,
+            outline=_MOUTH_COLOR,
             width=2,
+            tags=self.tag,
         )
         items.append(mouth_id)
 
@@ -725,8 +1106,9 @@ class ExpressionRenderer:
                 tooth_id = canvas.create_line(
                     tooth_x, y - open_amt * 0.2,
                     tooth_x, y + open_amt * 0.2,
-                    fill=Colors.WHITE,
+                    fill=_WHITE,
                     width=2,
+                    tags=self.tag,
                 )
                 items.append(tooth_id)
 
@@ -748,9 +1130,10 @@ class ExpressionRenderer:
         mouth_id = canvas.create_oval(
             x - width * 0.7, y - open_amt * 0.2,
             x + width * 0.7, y + open_amt,
-            fill="#3D3D3D",
-            outline=self.MOUTH_COLOR,
+            fill=_MOUTH_INSIDE_COLOR,
+            outline=_MOUTH_COLOR,
             width=2,
+            tags=self.tag,
         )
         items.append(mouth_id)
 
@@ -758,8 +1141,9 @@ class ExpressionRenderer:
         tongue_id = canvas.create_oval(
             x - width * 0.3, y + open_amt * 0.3,
             x + width * 0.3, y + open_amt * 0.9,
-            fill=self.TONGUE_COLOR,
+            fill=_TONGUE_COLOR,
             outline="",
+            tags=self.tag,
         )
         items.append(tongue_id)
 
@@ -771,24 +1155,22 @@ class ExpressionRenderer:
         x: float,
         y: float,
         width: float,
-    ) -> List[int]:
+    ) -> int:
         """Draw a smirk (asymmetric smile)."""
-        items = []
         # Draw curve that goes up more on one side
         points = [
             x - width * 0.5, y + 2,
             x, y - 2,
             x + width * 0.5, y - 5,
         ]
-        line_id = canvas.create_line(
+        return canvas.create_line(
             points,
-            fill=self.MOUTH_COLOR,
+            fill=_MOUTH_COLOR,
             width=2,
             smooth=True,
-            capstyle=tk.ROUND,
+            capstyle=_ROUND,
+            tags=self.tag,
         )
-        items.append(line_id)
-        return items
 
     def _draw_worried_mouth(
         self,
@@ -796,9 +1178,8 @@ class ExpressionRenderer:
         x: float,
         y: float,
         width: float,
-    ) -> List[int]:
+    ) -> int:
         """Draw a worried wavy mouth."""
-        items = []
         # Wavy line
         points = [
             x - width * 0.5, y + 2,
@@ -807,15 +1188,14 @@ class ExpressionRenderer:
             x + width * 0.25, y - 2,
             x + width * 0.5, y + 2,
         ]
-        line_id = canvas.create_line(
+        return canvas.create_line(
             points,
-            fill=self.MOUTH_COLOR,
+            fill=_MOUTH_COLOR,
             width=2,
             smooth=True,
-            capstyle=tk.ROUND,
+            capstyle=_ROUND,
+            tags=self.tag,
         )
-        items.append(line_id)
-        return items
 
     def draw_blush(
         self,
@@ -825,6 +1205,7 @@ class ExpressionRenderer:
         face_width: float,
         face_height: float,
         intensity: float = 1.0,
+        face_id: Optional[str] = None,
     ) -> List[int]:
         """
         Draw blush marks on cheeks.
@@ -836,14 +1217,25 @@ class ExpressionRenderer:
             face_width: Width of face.
             face_height: Height of face.
             intensity: Blush intensity (0.0-1.0).
+            face_id: Key to keep and reuse this face's items across calls.
 
         Returns:
-            List of canvas item IDs created.
+            List of canvas item IDs created (or reused, with ``face_id``).
         """
         items = []
 
         if intensity <= 0:
+            if face_id is not None:
+                self.release_face(face_id, "blush")
             return items
+        if face_id is None:
+            target = canvas
+        else:
+            face_args = (face_x, face_y, face_width, face_height, intensity)
+            kept = self._unchanged_face_part(canvas, face_id, "blush", face_args)
+            if kept is not None:
+                return kept
+            target = _ShapeRecorder()
 
         blush_y = face_y + face_height * 0.05
         blush_offset = face_width * 0.3
@@ -851,26 +1243,32 @@ class ExpressionRenderer:
         blush_h = blush_w * 0.6
 
         # Adjust color based on intensity
-        color = self.BLUSH_COLOR
+        color = _BLUSH_COLOR
 
         # Left blush
-        left_id = canvas.create_oval(
+        left_id = target.create_oval(
             face_x - blush_offset - blush_w, blush_y - blush_h,
             face_x - blush_offset + blush_w, blush_y + blush_h,
             fill=color,
             outline="",
+            tags=self.tag,
         )
         items.append(left_id)
 
         # Right blush
-        right_id = canvas.create_oval(
+        right_id = target.create_oval(
             face_x + blush_offset - blush_w, blush_y - blush_h,
             face_x + blush_offset + blush_w, blush_y + blush_h,
             fill=color,
             outline="",
+            tags=self.tag,
         )
         items.append(right_id)
 
+        if face_id is not None:
+            return self._update_face_part(
+                canvas, face_id, "blush", face_args, target.shapes
+            )
         return items
 
     def draw_sweat_drop(
@@ -881,6 +1279,7 @@ class ExpressionRenderer:
         face_width: float,
         face_height: float,
         side: int = 1,
+        face_id: Optional[str] = None,
     ) -> List[int]:
         """
         Draw a sweat drop for stress/hunger/tiredness.
@@ -892,11 +1291,20 @@ class ExpressionRenderer:
             face_width: Width of face.
             face_height: Height of face.
             side: Which side (-1 = left, 1 = right).
+            face_id: Key to keep and reuse this face's items across calls.
 
         Returns:
-            List of canvas item IDs created.
+            List of canvas item IDs created (or reused, with ``face_id``).
         """
         items = []
+        if face_id is None:
+            target = canvas
+        else:
+            face_args = (face_x, face_y, face_width, face_height, side)
+            kept = self._unchanged_face_part(canvas, face_id, "sweat", face_args)
+            if kept is not None:
+                return kept
+            target = _ShapeRecorder()
 
         drop_x = face_x + side * face_width * 0.45
         drop_y = face_y - face_height * 0.2
@@ -908,23 +1316,218 @@ class ExpressionRenderer:
             drop_x, drop_y + 5,    # Bottom
             drop_x + 5, drop_y,    # Right curve
         ]
-        drop_id = canvas.create_polygon(
+        drop_id = target.create_polygon(
             points,
-            fill=self.SWEAT_COLOR,
-            outline=Colors.SOFT_BLUE,
+            fill=_SWEAT_COLOR,
+            outline=_SOFT_BLUE,
             smooth=True,
+            tags=self.tag,
         )
         items.append(drop_id)
 
+        if face_id is not None:
+            return self._update_face_part(
+                canvas, face_id, "sweat", face_args, target.shapes
+            )
         return items
 
+    def _unchanged_face_part(
+        self,
+        canvas: tk.Canvas,
+        face_id: str,
+        part: str,
+        args: tuple,
+    ) -> Optional[List[int]]:
+        """
+        Return a face part's items if its drawing arguments are unchanged.
+
+        Expressions change far less often than frames are drawn, so a part
+        whose geometry and params match the previous call is left as is
+        (only raised back above anything drawn since).
+
+        Returns:
+            The part's canvas item IDs, or None if it needs redrawing.
+        """
+        key = (face_id, part)
+        entry = self._face_parts.get(key)
+        if entry is None or entry.canvas is not canvas or entry.args != args:
+            return None
+        if entry.items and not canvas.type(entry.tag):
+            # Deleted behind the renderer's back; draw the part afresh
+            del self._face_parts[key]
+            return None
+        canvas.tag_raise(entry.tag)
+        return entry.items
+
+    def _update_face_part(
+        self,
+        canvas: tk.Canvas,
+        face_id: str,
+        part: str,
+        args: tuple,
+        shapes: List[Tuple[str, tuple, dict]],
+    ) -> List[int]:
+        """
+        Bring a persistent face part's items in line with recorded shapes.
+
+        Items from the previous call are moved with ``coords`` (and
+        reconfigured only when their options changed) as long as they
+        still exist and the same kinds of shapes with the same options are
+        drawn; otherwise the part is recreated.
+
+        Args:
+            canvas: Tkinter canvas to draw on.
+            face_id: Key of the face.
+            part: Name of the face part.
+            args: Drawing arguments, kept to skip unchanged redraws.
+            shapes: ``(kind, coords, options)`` recorded by the drawers.
+
+        Returns:
+            Canvas item IDs of the part, in drawing order.
+        """
+        key = (face_id, part)
+        entry = self._face_parts.get(key)
+        styles = entry.styles if entry is not None else ()
+
+        if (
+            entry is not None
+            and entry.canvas is canvas
+            and len(styles) == len(shapes)
+            and all(
+                kind == old_kind and options.keys() == old_options.keys()
+                for (kind, _, options), (old_kind, old_options) in zip(shapes, styles)
+            )
+            and (not entry.items or canvas.type(entry.tag))
+        ):
+            for index, (kind, coords, options) in enumerate(shapes):
+                item_id = entry.items[index]
+                canvas.coords(item_id, *coords)
+                if options != styles[index][1]:
+                    canvas.itemconfigure(item_id, **options)
+                    styles[index] = (kind, options)
+            # Keep reused items above anything drawn since the last call
+            canvas.tag_raise(entry.tag)
+            entry.args = args
+            return entry.items
+
+        if entry is not None:
+            entry.canvas.delete(entry.tag)
+        entry = _FacePart(canvas, f"{face_id}_{part}")
+        for kind, coords, options in shapes:
+            create = getattr(canvas, "create_" + kind)
+            entry.items.append(create(*coords, tags=(self.tag, face_id, entry.tag), **options))
+            entry.styles.append((kind, options))
+        entry.args = args
+        self._face_parts[key] = entry
+        return entry.items
+
+    def draw_face_image(
+        self,
+        canvas: tk.Canvas,
+        face_x: float,
+        face_y: float,
+        face_width: float,
+        face_height: float,
+        eye_params: Optional[EyeParams] = None,
+        mouth_params: Optional[MouthParams] = None,
+        face_id: str = "face",
+    ) -> List[int]:
+        """
+        Draw eyes and mouth as one pre-rendered image item.
+
+        The face is rasterized with PIL once per combination of params and
+        (whole pixel) face size, then shown with a single ``create_image``
+        item that is moved across frames. Without PIL, falls back to
+        ``draw_eyes`` and ``draw_mouth`` with the same ``face_id``.
+
+        Args:
+            canvas: Tkinter canvas to draw on.
+            face_x: Center X of face.
+            face_y: Center Y of face.
+            face_width: Width of face.
+            face_height: Height of face.
+            eye_params: Eye rendering parameters.
+            mouth_params: Mouth rendering parameters.
+            face_id: Key for reusing the image item across calls.
+
+        Returns:
+            List of canvas item IDs drawn (or reused).
+        """
+        if Image is None:
+            return self.draw_eyes(
+                canvas, face_x, face_y, face_width, face_height, eye_params, face_id=face_id
+            ) + self.draw_mouth(
+                canvas, face_x, face_y, face_width, face_height, mouth_params, face_id=face_id
+            )
+
+        eye_params = eye_params or EyeParams()
+        mouth_params = mouth_params or MouthParams()
+        face_args = (face_x, face_y, face_width, face_height, eye_params, mouth_params)
+        kept = self._unchanged_face_part(canvas, face_id, "image", face_args)
+        if kept is not None:
+            return kept
+
+        width = round(face_width)
+        height = round(face_height)
+        key = (canvas.tk, eye_params, mouth_params, width, height)
+        cached = self._face_images.get(key)
+        if cached is None:
+            recorder = _ShapeRecorder()
+            self.draw_eyes(recorder, 0.0, 0.0, width, height, eye_params)
+            self.draw_mouth(recorder, 0.0, 0.0, width, height, mouth_params)
+            raster = rasterize_shapes(recorder.shapes)
+            if raster is None:
+                self.release_face(face_id, "image")
+                return []
+            left, top, image = raster
+            cached = (left, top, ImageTk.PhotoImage(image, master=canvas))
+            if len(self._face_images) >= _FACE_IMAGE_LIMIT:
+                del self._face_images[next(iter(self._face_images))]
+            self._face_images[key] = cached
+
+        left, top, photo = cached
+        shapes = [("image", (face_x + left, face_y + top), {"image": photo, "anchor": tk.NW})]
+        return self._update_face_part(canvas, face_id, "image", face_args, shapes)
+
+    def release_face(self, face_id: str, part: Optional[str] = None) -> None:
+        """
+        Delete the persistent items drawn for a face.
+
+        Args:
+            face_id: Key the items were drawn with.
+            part: Only release this part ("eyes", "mouth", "blush", "sweat"
+                or "image"); all parts when None.
+        """
+        parts = (part,) if part is not None else ("eyes", "mouth", "blush", "sweat", "image")
+        for name in parts:
+            entry = self._face_parts.pop((face_id, name), None)
+            if entry is not None:
+                entry.canvas.delete(entry.tag)
+
+    def forget_face(self, face_id: str) -> None:
+        """
+        Drop what is kept for a face without touching the canvas.
+
+        For faces whose owner has gone away; the items are left as they
+        are, but no longer reused or kept alive.
+
+        Args:
+            face_id: Key the items were drawn with.
+        """
+        for key in [key for key in self._face_parts if key[0] == face_id]:
+            del self._face_parts[key]
+
     def clear(self, canvas: tk.Canvas) -> None:
         """Clear all canvas items created by this renderer."""
-        for item_id in self._canvas_items:
-            canvas.delete(item_id)
+        canvas.delete(self.tag)
         self._canvas_items.clear()
+        for entry in self._face_parts.values():
+            if entry.canvas is not canvas:
+                entry.canvas.delete(entry.tag)
+        self._face_parts.clear()
 
 
+@lru_cache(maxsize=64)
 def get_expression_for_mood(
     mood: str,
     is_hungry: bool = False,
@@ -939,46 +1542,51 @@ def get_expression_for_mood(
         is_tired: Whether pet is tired.
 
     Returns:
-        Tuple of (EyeParams, MouthParams) for the mood.
+        Tuple of (EyeParams, MouthParams) for the mood. Results are cached
+        and shared between callers; the params are immutable.
     """
-    eye_params = EyeParams()
-    mouth_params = MouthParams()
+    eye_emotion = EyeEmotion.NORMAL
+    eye_openness = 1.0
+    mouth_emotion = MouthEmotion.NEUTRAL
+    mouth_width = 1.0
 
     if mood == "ecstatic":
-        eye_params.emotion = EyeEmotion.SPARKLE
-        mouth_params.emotion = MouthEmotion.HAPPY
-        mouth_params.width = 1.3
+        eye_emotion = EyeEmotion.SPARKLE
+        mouth_emotion = MouthEmotion.HAPPY
+        mouth_width = 1.3
 
     elif mood == "happy":
-        eye_params.emotion = EyeEmotion.HAPPY
-        mouth_params.emotion = MouthEmotion.HAPPY
+        eye_emotion = EyeEmotion.HAPPY
+        mouth_emotion = MouthEmotion.HAPPY
 
     elif mood == "content":
-        eye_params.emotion = EyeEmotion.NORMAL
-        eye_params.highlight = True
-        mouth_params.emotion = MouthEmotion.HAPPY
-        mouth_params.width = 0.8
+        eye_emotion = EyeEmotion.NORMAL
+        mouth_emotion = MouthEmotion.HAPPY
+        mouth_width = 0.8
 
     elif mood == "neutral":
-        eye_params.emotion = EyeEmotion.NORMAL
-        mouth_params.emotion = MouthEmotion.NEUTRAL
+        eye_emotion = EyeEmotion.NORMAL
+        mouth_emotion = MouthEmotion.NEUTRAL
 
     elif mood == "sad":
-        eye_params.emotion = EyeEmotion.SAD
-        mouth_params.emotion = MouthEmotion.SAD
+        eye_emotion = EyeEmotion.SAD
+        mouth_emotion = MouthEmotion.SAD
 
     elif mood == "miserable":
-        eye_params.emotion = EyeEmotion.SAD
-        eye_params.openness = 0.7
-        mouth_params.emotion = MouthEmotion.SAD
-        mouth_params.width = 1.2
+        eye_emotion = EyeEmotion.SAD
+        eye_openness = 0.7
+        mouth_emotion = MouthEmotion.SAD
+        mouth_width = 1.2
 
     # Override for status effects
     if is_tired:
-        eye_params.emotion = EyeEmotion.SLEEPY
-        eye_params.openness = 0.5
+        eye_emotion = EyeEmotion.SLEEPY
+        eye_openness = 0.5
 
     if is_hungry:
-        mouth_params.emotion = MouthEmotion.WORRIED
+        mouth_emotion = MouthEmotion.WORRIED
 
-    return eye_params, mouth_params
+    return (
+        EyeParams(emotion=eye_emotion, openness=eye_openness),
+        MouthParams(emotion=mouth_emotion, width=mouth_width),
+    )
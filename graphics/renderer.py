@@ -15,9 +15,11 @@ This is the main interface for drawing pets - it handles:
 from __future__ import annotations
 
 import math
+import operator
+import sys
 import tkinter as tk
-from dataclasses import dataclass, field
-from enum import Enum, auto
+from dataclasses import dataclass, field, replace
+from enum import IntEnum, auto
 from typing import Dict, List, Optional, Tuple, Any
 
 from graphics.sprites import (
@@ -28,6 +30,7 @@ from graphics.sprites import (
     draw_nub_limbs,
     darken_color,
     lighten_color,
+    unbind_handler,
 )
 from graphics.expressions import (
     ExpressionRenderer,
@@ -36,6 +39,7 @@ from graphics.expressions import (
     EyeEmotion,
     MouthEmotion,
     get_expression_for_mood,
+    rasterize_shapes,
 )
 from graphics.evolution_sprites import (
     EvolutionSpriteRenderer,
@@ -78,9 +82,43 @@ except ImportError:
         SHADOW_OFFSET_Y = 0.1
         SHADOW_SCALE_X = 0.8
 
+# Thought bubbles at or below this opacity are not drawn
+_BUBBLE_MIN_OPACITY = 0.02
 
-class RenderState(Enum):
-    """Current rendering state/mode."""
+# Config values read on the per-frame path, bound once
+_SHADOW_OPACITY = SpritesConfig.SHADOW_OPACITY
+_SHADOW_SCALE_X = SpritesConfig.SHADOW_SCALE_X
+_COLOR_LEVEL_UP = Colors.SOFT_YELLOW
+
+# Optional: PIL lets the pet be drawn as one pre-rendered image item
+try:
+    from PIL import ImageTk
+except ImportError:
+    ImageTk = None
+
+# Pre-rendered pet images kept per renderer before the oldest is dropped
+_SPRITE_IMAGE_LIMIT = 64
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Pet and stats attributes read every frame, fetched in one C call each
+_PET_FIELDS = operator.attrgetter("form_id", "name", "state", "thought_bubble", "stats")
+_STATS_FIELDS = operator.attrgetter("hunger", "happiness", "energy")
+
+# Unscaled radius around the pet's center that its body can reach, plus
+# room for the effects and thought bubble drawn around it
+_CULL_RADIUS = 80
+_EFFECT_REACH = 100
+
+
+class RenderState(IntEnum):
+    """
+    Current rendering state/mode.
+
+    An IntEnum so states can be passed around as plain ints; members are
+    singletons, so hot paths compare them with ``is``.
+    """
     IDLE = auto()
     WALKING = auto()
     EATING = auto()
@@ -95,7 +133,19 @@ class RenderState(Enum):
     EVOLVING = auto()
 
 
-@dataclass
+# Pet state names (upper case) and the render states they map to
+_PET_STATE_MAP: Dict[str, RenderState] = {
+    "IDLE": RenderState.IDLE,
+    "WALKING": RenderState.WALKING,
+    "EATING": RenderState.EATING,
+    "PLAYING": RenderState.PLAYING,
+    "SLEEPING": RenderState.SLEEPING,
+    "HAPPY": RenderState.HAPPY,
+    "TRICK": RenderState.TRICK,
+}
+
+
+@dataclass(**_SLOTS)
 class PetRenderState:
     """
     Complete state needed to render a pet.
@@ -153,6 +203,237 @@ class PetRenderState:
     level_up_progress: float = 0.0  # 0.0 = not leveling, 1.0 = complete
 
 
+def _state_fingerprint(state: PetRenderState) -> tuple:
+    """
+    Get a key of everything in a render state that affects the drawing.
+
+    Positions and amounts are rounded below what is visible, and the
+    animation phase is bucketed to 1/30, so states that would draw the
+    same frame share a key.
+    """
+    return (
+        state.form_id,
+        state.render_state,
+        round(state.x, 1),
+        round(state.y, 1),
+        round(state.offset_x, 1),
+        round(state.offset_y, 1),
+        round(state.squash, 3),
+        round(state.stretch, 3),
+        state.rotation,
+        state.direction,
+        state.eye_emotion,
+        round(state.eye_openness, 2),
+        state.look_direction,
+        state.mouth_emotion,
+        round(state.mouth_openness, 2),
+        state.show_blush,
+        state.show_sweat,
+        state.is_hungry,
+        state.is_tired,
+        state.thought_text,
+        state.thought_icon,
+        round(state.thought_opacity, 2),
+        state.show_hearts,
+        state.show_zzz,
+        state.show_sparkles,
+        state.show_music,
+        round(state.level_up_progress, 2),
+        round(state.animation_phase * 30),
+    )
+
+
+class _RenderLayer:
+    """
+    Canvas stand-in that keeps one render layer's items across frames.
+
+    The effect ``draw_*`` functions run against the layer unchanged: each
+    ``create_*`` call moves the item created by the same call on the
+    previous frame (with ``coords``, reconfiguring it only when its
+    options changed) and only creates an item when there is none of that
+    kind to reuse. Items left over once the layer is finished are deleted.
+    Other canvas methods are passed through to the real canvas.
+
+    Items are tagged with the layer's tag and its renderer's tag.
+    """
+
+    __slots__ = ("canvas", "tag", "tags", "items", "styles", "index")
+
+    def __init__(self, tag: str, renderer_tag: str) -> None:
+        self.canvas: Optional[tk.Canvas] = None
+        self.tag = tag
+        self.tags = (tag, renderer_tag)
+        self.items: List[int] = []
+        self.styles: List[Tuple[str, dict]] = []
+        self.index = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.canvas, name)
+
+    def begin(self, canvas: tk.Canvas) -> _RenderLayer:
+        """Start drawing the layer's items for a frame on ``canvas``."""
+        self.canvas = canvas
+        self.index = 0
+        # Items deleted behind the renderer's back can't be reused
+        if self.items and not canvas.type(self.tag):
+            self.items.clear()
+            self.styles.clear()
+        return self
+
+    def keep(self) -> List[int]:
+        """Keep all of the last frame's items unchanged for this frame."""
+        self.index = len(self.items)
+        return self.items
+
+    def finish(self) -> None:
+        """Delete items not drawn this frame and raise the rest to the top."""
+        index = self.index
+        if index < len(self.items):
+            self.canvas.delete(*self.items[index:])
+            del self.items[index:]
+            del self.styles[index:]
+        if self.items:
+            # Stack reused items as if they had just been created
+            self.canvas.tag_raise(self.tag)
+
+    def forget(self) -> None:
+        """Drop the layer's items after they were deleted from the canvas."""
+        self.items.clear()
+        self.styles.clear()
+
+    def _create(self, kind: str, coords: tuple, options: dict) -> int:
+        index = self.index
+        self.index = index + 1
+        tags = options.pop("tags", ())
+        canvas = self.canvas
+        items = self.items
+
+        if index < len(items):
+            old_kind, old_options = self.styles[index]
+            if kind == old_kind and options.keys() == old_options.keys():
+                item_id = items[index]
+                canvas.coords(item_id, *coords)
+                if options != old_options:
+                    canvas.itemconfigure(item_id, **options)
+                    self.styles[index] = (kind, options)
+                return item_id
+            # A different shape is drawn from here on
+            canvas.delete(*items[index:])
+            del items[index:]
+            del self.styles[index:]
+
+        item_id = getattr(canvas, "create_" + kind)(
+            *coords, tags=(*tags, *self.tags), **options
+        )
+        items.append(item_id)
+        self.styles.append((kind, options))
+        return item_id
+
+    def create_oval(self, *coords, **options) -> int:
+        return self._create("oval", coords, options)
+
+    def create_line(self, *coords, **options) -> int:
+        return self._create("line", coords, options)
+
+    def create_polygon(self, *coords, **options) -> int:
+        return self._create("polygon", coords, options)
+
+    def create_text(self, *coords, **options) -> int:
+        return self._create("text", coords, options)
+
+    def create_image(self, *coords, **options) -> int:
+        return self._create("image", coords, options)
+
+
+class _SpriteRecorder:
+    """
+    Canvas stand-in that keeps the items a pet sprite draws, for rasterizing.
+
+    Implements the part of the canvas API the form, body and face drawers
+    use, including moving, hiding and restacking persistent items by tag,
+    so ``draw_form`` runs on it unchanged. It reports a zero size, which
+    turns offscreen culling off.
+    """
+
+    __slots__ = ("items", "next_id")
+
+    def __init__(self) -> None:
+        # Item ID -> [kind, coords, options, tags], in stacking order
+        self.items: Dict[int, list] = {}
+        self.next_id = 0
+
+    def shapes(self) -> List[Tuple[str, tuple, dict]]:
+        """Get the visible items as ``(kind, coords, options)``, bottom first."""
+        return [
+            (kind, coords, options)
+            for kind, coords, options, _ in self.items.values()
+            if options.get("state") != tk.HIDDEN
+        ]
+
+    def _find(self, tag_or_id: Any) -> List[int]:
+        if isinstance(tag_or_id, int):
+            return [tag_or_id] if tag_or_id in self.items else []
+        return [item_id for item_id, item in self.items.items() if tag_or_id in item[3]]
+
+    def _create(self, kind: str, coords: tuple, options: dict) -> int:
+        tags = options.pop("tags", ())
+        if isinstance(tags, str):
+            tags = (tags,)
+        if len(coords) == 1:
+            coords = tuple(coords[0])
+        self.next_id += 1
+        self.items[self.next_id] = [kind, coords, options, set(tags)]
+        return self.next_id
+
+    def create_oval(self, *coords, **options) -> int:
+        return self._create("oval", coords, options)
+
+    def create_line(self, *coords, **options) -> int:
+        return self._create("line", coords, options)
+
+    def create_arc(self, *coords, **options) -> int:
+        return self._create("arc", coords, options)
+
+    def create_polygon(self, *coords, **options) -> int:
+        return self._create("polygon", coords, options)
+
+    def coords(self, tag_or_id: Any, *coords) -> None:
+        if len(coords) == 1:
+            coords = tuple(coords[0])
+        for item_id in self._find(tag_or_id):
+            self.items[item_id][1] = coords
+
+    def itemconfigure(self, tag_or_id: Any, **options) -> None:
+        for item_id in self._find(tag_or_id):
+            self.items[item_id][2].update(options)
+
+    def delete(self, *tags_or_ids) -> None:
+        for tag_or_id in tags_or_ids:
+            for item_id in self._find(tag_or_id):
+                del self.items[item_id]
+
+    def type(self, tag_or_id: Any) -> Optional[str]:
+        found = self._find(tag_or_id)
+        return self.items[found[0]][0] if found else None
+
+    def addtag_withtag(self, new_tag: str, tag_or_id: Any) -> None:
+        for item_id in self._find(tag_or_id):
+            self.items[item_id][3].add(new_tag)
+
+    def tag_raise(self, tag_or_id: Any) -> None:
+        for item_id in self._find(tag_or_id):
+            self.items[item_id] = self.items.pop(item_id)
+
+    def bind(self, *args, **kwargs) -> None:
+        pass
+
+    def winfo_width(self) -> int:
+        return 0
+
+    def winfo_height(self) -> int:
+        return 0
+
+
 class BlobRenderer:
     """
     Main renderer for blob pet sprites.
@@ -160,18 +441,73 @@ class BlobRenderer:
     Combines all graphics subsystems to render complete pets
     with animations, expressions, and effects.
 
+    The shadow, effect and thought bubble items persist across frames in
+    render layers and are moved with ``coords`` instead of being
+    recreated; ``clear`` removes everything the renderer has drawn.
+
+    With ``rasterize=True`` (and PIL installed) the pet itself is drawn as
+    a single image item, rendered once per combination of form,
+    expression, squash/stretch and blush/sweat. Such images are drawn at
+    animation phase 0, so form wobble and animated features hold still.
+
     Usage:
         renderer = BlobRenderer()
         state = PetRenderState(form_id="bouncy", x=100, y=100)
         renderer.render(canvas, state)
     """
 
-    def __init__(self) -> None:
-        """Initialize the blob renderer."""
+    def __init__(self, rasterize: bool = False) -> None:
+        """
+        Initialize the blob renderer.
+
+        Args:
+            rasterize: Draw the pet as one pre-rendered image item when PIL
+                is available.
+        """
         self.evolution_renderer = EvolutionSpriteRenderer()
+        # Tag carried by every persistent item the renderer draws
+        self.tag = f"blob_renderer_{id(self)}"
         self._canvas_items: List[int] = []
         self._effect_items: List[int] = []
 
+        # Persistent render layers, and the canvas they live on
+        self._layers: Dict[str, _RenderLayer] = {}
+        self._layer_canvas: Optional[tk.Canvas] = None
+        # Pet body items from the last frame (features and face persist
+        # in the evolution renderer)
+        self._pet_items: List[int] = []
+        # Fingerprint of the last rendered state, to skip unchanged frames
+        self._last_fingerprint: Optional[tuple] = None
+
+        # Render state for each pet state seen so far
+        self._render_states: Dict[Any, RenderState] = {}
+
+        # Params reused by _draw_pet across frames
+        self._animation = AnimationParams()
+        self._eye_key: Optional[tuple] = None
+        self._eye_params = EyeParams()
+        self._mouth_key: Optional[tuple] = None
+        self._mouth_params = MouthParams()
+
+        # Thought bubble position, text and color bucket last drawn
+        self._bubble_key: Optional[tuple] = None
+
+        # Cached canvas viewport size for offscreen culling
+        self._view_canvas: Optional[tk.Canvas] = None
+        self._view_binding: Optional[str] = None
+        self._view_width = 0
+        self._view_height = 0
+        self._culled = False
+
+        # Pre-rendered pet images as (left, top, photo) relative to the
+        # pet's center, and the renderer that draws them
+        self._rasterize = rasterize and ImageTk is not None
+        self._sprite_images: Dict[tuple, Tuple[int, int, Any]] = {}
+        self._sprite_renderer: Optional[EvolutionSpriteRenderer] = None
+
+        # Form appearances and their shadow metrics, keyed by form ID
+        self._appearance_cache: Dict[str, Tuple[FormAppearance, float, float, float]] = {}
+
         # Animation helpers
         self._bounce_phase: float = 0.0
         self._blink_timer: float = 0.0
@@ -185,36 +521,76 @@ class BlobRenderer:
         """
         Render the complete pet sprite.
 
+        Does nothing if the state would draw the same frame as the last
+        call and that frame is still on the canvas, and removes the pet
+        while it lies entirely outside the canvas.
+
         Args:
             canvas: Tkinter canvas to draw on.
             state: Current pet render state.
         """
-        self.clear(canvas)
-
-        items = []
+        fingerprint = _state_fingerprint(state)
+        if canvas is not self._layer_canvas:
+            self._release_layers()
+            self._layer_canvas = canvas
+        elif fingerprint == self._last_fingerprint and self._frame_intact(canvas):
+            return
+        self._last_fingerprint = fingerprint
+
+        # Draw nothing while the pet and its effects are off the canvas
+        if self._offscreen(canvas, state):
+            if not self._culled:
+                self.clear(canvas)
+                self._culled = True
+            return
+        self._culled = False
+
+        # Collect this frame's item IDs in place of the last frame's
+        items = self._canvas_items
+        items.clear()
 
         # 1. Draw shadow
-        shadow_items = self._draw_shadow(canvas, state)
-        items.extend(shadow_items)
+        layer = self._layer(canvas, "shadow")
+        items += self._draw_shadow(layer, state)
+        layer.finish()
 
         # 2. Draw special background effects
-        bg_effect_items = self._draw_background_effects(canvas, state)
-        items.extend(bg_effect_items)
+        layer = self._layer(canvas, "background")
+        items += self._draw_background_effects(layer, state)
+        layer.finish()
 
         # 3. Draw main pet sprite
-        pet_items = self._draw_pet(canvas, state)
-        items.extend(pet_items)
+        if self._rasterize:
+            layer = self._layer(canvas, "sprite")
+            items += self._draw_pet_image(layer, state)
+            layer.finish()
+        else:
+            items += self._draw_pet(canvas, state)
 
         # 4. Draw foreground effects (particles, etc.)
-        fg_effect_items = self._draw_foreground_effects(canvas, state)
-        items.extend(fg_effect_items)
-
-        # 5. Draw thought bubble if present
-        if state.thought_text:
-            bubble_items = self._draw_thought_bubble(canvas, state)
-            items.extend(bubble_items)
-
-        self._canvas_items = items
+        layer = self._layer(canvas, "foreground")
+        items += self._draw_foreground_effects(layer, state)
+        layer.finish()
+
+        # 5. Draw thought bubble if present and not faded out
+        layer = self._layer(canvas, "bubble")
+        opacity = state.thought_opacity
+        if state.thought_text and opacity > _BUBBLE_MIN_OPACITY:
+            # Same position, text and color bucket as last frame: keep it
+            bubble_key = (
+                int(state.x + state.offset_x + 25),
+                int(state.y + state.offset_y - 60),
+                state.thought_text,
+                state.thought_icon,
+                opacity >= 1.0,
+                round(opacity * 20),
+            )
+            if bubble_key == self._bubble_key and layer.items:
+                items += layer.keep()
+            else:
+                self._bubble_key = bubble_key
+                items += self._draw_thought_bubble(layer, state)
+        layer.finish()
 
     def render_with_animation(
         self,
@@ -252,73 +628,96 @@ class BlobRenderer:
         Returns:
             PetRenderState for rendering.
         """
+        # Read the pet's attributes at once, falling back to one at a time
+        # (with defaults) for pets missing some of them
+        try:
+            form_id, name, pet_state, thought, stats = _PET_FIELDS(pet)
+        except AttributeError:
+            form_id = getattr(pet, "form_id", None)
+            name = getattr(pet, "name", "Floob")
+            pet_state = getattr(pet, "state", None)
+            thought = getattr(pet, "thought_bubble", None)
+            stats = getattr(pet, "stats", None)
+
         # Get form ID from pet (handle both old and new pet formats)
-        form_id = getattr(pet, "form_id", None)
         if form_id is None:
             # Fall back to creature_type or default
             form_id = getattr(pet, "creature_type", "bloblet")
 
         # Get mood
         mood = "content"
-        if hasattr(pet, "get_mood"):
-            mood_enum = pet.get_mood()
+        get_mood = getattr(pet, "get_mood", None)
+        if get_mood is not None:
+            mood_enum = get_mood()
             mood = mood_enum.name.lower() if hasattr(mood_enum, "name") else str(mood_enum).lower()
 
         # Get stats
-        stats = getattr(pet, "stats", None)
-        hunger = getattr(stats, "hunger", 80.0) if stats else 80.0
-        happiness = getattr(stats, "happiness", 80.0) if stats else 80.0
-        energy = getattr(stats, "energy", 80.0) if stats else 80.0
+        if stats:
+            try:
+                hunger, happiness, energy = _STATS_FIELDS(stats)
+            except AttributeError:
+                hunger = getattr(stats, "hunger", 80.0)
+                happiness = getattr(stats, "happiness", 80.0)
+                energy = getattr(stats, "energy", 80.0)
+        else:
+            hunger = happiness = energy = 80.0
+
+        # Derived flags, each compared once
+        is_hungry = hunger < 30
+        is_tired = energy < 30
 
         # Determine render state from pet state
-        pet_state = getattr(pet, "state", None)
         render_state = RenderState.IDLE
         if pet_state:
-            state_name = pet_state.name if hasattr(pet_state, "name") else str(pet_state)
-            render_state = self._pet_state_to_render_state(state_name)
+            # Pet states are usually enum members; map each one only once
+            render_state = self._render_states.get(pet_state)
+            if render_state is None:
+                state_name = pet_state.name if hasattr(pet_state, "name") else str(pet_state)
+                render_state = self._pet_state_to_render_state(state_name)
+                self._render_states[pet_state] = render_state
 
         # Get expression based on mood and state
         eye_params, mouth_params = get_expression_for_mood(
             mood,
-            is_hungry=hunger < 30,
-            is_tired=energy < 30,
+            is_hungry=is_hungry,
+            is_tired=is_tired,
         )
 
-        # Override expressions for specific states
-        if render_state == RenderState.SLEEPING:
-            eye_params.emotion = EyeEmotion.BLINK
-            eye_params.openness = 0.0
-            mouth_params.emotion = MouthEmotion.NEUTRAL
-
-        elif render_state == RenderState.EATING:
-            mouth_params.emotion = MouthEmotion.EATING
-            mouth_params.openness = animation_state.get("phase", 0.0)
-
-        elif render_state == RenderState.HAPPY:
-            eye_params.emotion = EyeEmotion.HAPPY
-            mouth_params.emotion = MouthEmotion.HAPPY
-
-        elif render_state == RenderState.PLAYING:
-            eye_params.emotion = EyeEmotion.SPARKLE
-            mouth_params.emotion = MouthEmotion.HAPPY
-
         # Get animation parameters
         bounce = animation_state.get("bounce", 0.0)
         phase = animation_state.get("phase", 0.0)
 
-        # Calculate squash/stretch from state
+        # Override expressions for specific states (the cached params are
+        # shared, so overrides make copies) and squash/stretch from state,
+        # testing the render state once
         squash = 0.0
         stretch = 0.0
-        if render_state == RenderState.WALKING:
-            # Walking bounce creates squash/stretch
-            walk_phase = animation_state.get("phase", 0.0)
-            squash = abs(math.sin(walk_phase * math.pi * 2)) * 0.15
-        elif render_state == RenderState.HAPPY:
+        if render_state is RenderState.SLEEPING:
+            eye_params = replace(eye_params, emotion=EyeEmotion.BLINK, openness=0.0)
+            mouth_params = replace(mouth_params, emotion=MouthEmotion.NEUTRAL)
+
+        elif render_state is RenderState.EATING:
+            mouth_params = replace(
+                mouth_params,
+                emotion=MouthEmotion.EATING,
+                openness=phase,
+            )
+
+        elif render_state is RenderState.HAPPY:
+            eye_params = replace(eye_params, emotion=EyeEmotion.HAPPY)
+            mouth_params = replace(mouth_params, emotion=MouthEmotion.HAPPY)
             # Happy bouncing
             squash = abs(math.sin(phase * 3)) * 0.1
 
+        elif render_state is RenderState.PLAYING:
+            eye_params = replace(eye_params, emotion=EyeEmotion.SPARKLE)
+            mouth_params = replace(mouth_params, emotion=MouthEmotion.HAPPY)
+
+        elif render_state is RenderState.WALKING:
+            # Walking bounce creates squash/stretch
+            squash = abs(math.sin(phase * math.pi * 2)) * 0.15
+
         # Get thought bubble
-        thought = getattr(pet, "thought_bubble", None)
         thought_text = None
         thought_icon = None
         thought_opacity = 1.0
@@ -330,7 +729,7 @@ class BlobRenderer:
 
         return PetRenderState(
             form_id=form_id,
-            name=getattr(pet, "name", "Floob"),
+            name=name,
             x=animation_state.get("new_x", 75),
             y=animation_state.get("new_y", 75),
             render_state=render_state,
@@ -344,33 +743,42 @@ class BlobRenderer:
             mouth_emotion=mouth_params.emotion,
             mouth_openness=mouth_params.openness,
             show_blush=(mood == "ecstatic" or mood == "happy"),
-            show_sweat=(hunger < 30 or energy < 30),
+            show_sweat=(is_hungry or is_tired),
             hunger=hunger,
             happiness=happiness,
             energy=energy,
             mood=mood,
-            is_hungry=hunger < 30,
-            is_tired=energy < 30,
+            is_hungry=is_hungry,
+            is_tired=is_tired,
             thought_text=thought_text,
             thought_icon=thought_icon,
             thought_opacity=thought_opacity,
-            show_hearts=(render_state == RenderState.HAPPY),
-            show_zzz=(render_state == RenderState.SLEEPING),
-            show_sparkles=(render_state == RenderState.PLAYING or render_state == RenderState.TRICK),
+            show_hearts=(render_state is RenderState.HAPPY),
+            show_zzz=(render_state is RenderState.SLEEPING),
+            show_sparkles=(render_state is RenderState.PLAYING or render_state is RenderState.TRICK),
         )
 
     def _pet_state_to_render_state(self, state_name: str) -> RenderState:
         """Convert pet state name to render state."""
-        state_map = {
-            "IDLE": RenderState.IDLE,
-            "WALKING": RenderState.WALKING,
-            "EATING": RenderState.EATING,
-            "PLAYING": RenderState.PLAYING,
-            "SLEEPING": RenderState.SLEEPING,
-            "HAPPY": RenderState.HAPPY,
-            "TRICK": RenderState.TRICK,
-        }
-        return state_map.get(state_name.upper(), RenderState.IDLE)
+        render_state = _PET_STATE_MAP.get(state_name)
+        if render_state is None:
+            render_state = _PET_STATE_MAP.get(state_name.upper(), RenderState.IDLE)
+        return render_state
+
+    def _appearance(self, form_id: str) -> Tuple[FormAppearance, float, float, float]:
+        """
+        Get a form's appearance and derived shadow metrics, cached per form.
+
+        Returns:
+            Tuple of (appearance, shadow_width, shadow_height, shadow_drop).
+        """
+        entry = self._appearance_cache.get(form_id)
+        if entry is None:
+            appearance = self.evolution_renderer.get_form_appearance(form_id)
+            shadow_width = 40 * appearance.scale
+            entry = (appearance, shadow_width, shadow_width * 0.3, 50 * appearance.scale)
+            self._appearance_cache[form_id] = entry
+        return entry
 
     def _draw_shadow(
         self,
@@ -378,14 +786,11 @@ class BlobRenderer:
         state: PetRenderState,
     ) -> List[int]:
         """Draw the shadow beneath the pet."""
-        appearance = self.evolution_renderer.get_form_appearance(state.form_id)
-
-        # Shadow size based on form scale
-        shadow_width = 40 * appearance.scale
-        shadow_height = shadow_width * 0.3
+        # Shadow size and drop below the pet, based on form scale
+        _, shadow_width, shadow_height, shadow_drop = self._appearance(state.form_id)
 
         # Shadow position (below pet, slightly compressed when bouncing)
-        shadow_y = state.y + 50 * appearance.scale - state.offset_y * 0.5
+        shadow_y = state.y + shadow_drop - state.offset_y * 0.5
         shadow_x = state.x + state.offset_x
 
         # Shadow shrinks when pet is higher (bouncing)
@@ -393,9 +798,9 @@ class BlobRenderer:
 
         return draw_shadow(
             canvas, shadow_x, shadow_y,
-            shadow_width * bounce_factor * SpritesConfig.SHADOW_SCALE_X,
+            shadow_width * bounce_factor * _SHADOW_SCALE_X,
             shadow_height,
-            SpritesConfig.SHADOW_OPACITY,
+            _SHADOW_OPACITY,
         )
 
     def _draw_background_effects(
@@ -404,51 +809,61 @@ class BlobRenderer:
         state: PetRenderState,
     ) -> List[int]:
         """Draw effects that appear behind the pet."""
-        items = []
-        appearance = self.evolution_renderer.get_form_appearance(state.form_id)
-
-        x = state.x + state.offset_x
-        y = state.y + state.offset_y
+        # The level up burst is the only background effect
+        if state.level_up_progress <= 0:
+            return []
 
         # Level up glow
-        if state.level_up_progress > 0:
-            radius = 30 + state.level_up_progress * 50
-            items.extend(draw_level_up_burst(
-                canvas, x, y, radius, state.animation_phase,
-                Colors.SOFT_YELLOW
-            ))
-
-        return items
+        radius = 30 + state.level_up_progress * 50
+        return draw_level_up_burst(
+            canvas,
+            state.x + state.offset_x,
+            state.y + state.offset_y,
+            radius, state.animation_phase,
+            _COLOR_LEVEL_UP
+        )
 
     def _draw_pet(
         self,
         canvas: tk.Canvas,
         state: PetRenderState,
     ) -> List[int]:
-        """Draw the main pet sprite."""
-        # Build animation params
-        animation = AnimationParams(
-            squash=state.squash,
-            stretch=state.stretch,
-            rotation=state.rotation,
-            offset_x=state.offset_x,
-            offset_y=state.offset_y,
-            wobble_phase=state.animation_phase,
-        )
-
-        # Build expression params
-        eye_params = EyeParams(
-            emotion=state.eye_emotion,
-            openness=state.eye_openness,
-            direction=state.look_direction,
-        )
-
-        mouth_params = MouthParams(
-            emotion=state.mouth_emotion,
-            openness=state.mouth_openness,
-        )
-
-        return self.evolution_renderer.draw_form(
+        """Draw the main pet sprite, replacing last frame's body items."""
+        if self._pet_items:
+            canvas.delete(*self._pet_items)
+
+        # Reset the pooled animation params (draw_form scales them in place)
+        animation = self._animation
+        animation.squash = state.squash
+        animation.stretch = state.stretch
+        animation.rotation = state.rotation
+        animation.scale = 1.0
+        animation.offset_x = state.offset_x
+        animation.offset_y = state.offset_y
+        animation.wobble = 0.0
+        animation.wobble_phase = state.animation_phase
+
+        # Expression params are immutable, so rebuild them only on change
+        eye_key = (state.eye_emotion, state.eye_openness, state.look_direction)
+        if eye_key != self._eye_key:
+            self._eye_key = eye_key
+            self._eye_params = EyeParams(
+                emotion=state.eye_emotion,
+                openness=state.eye_openness,
+                direction=state.look_direction,
+            )
+        eye_params = self._eye_params
+
+        mouth_key = (state.mouth_emotion, state.mouth_openness)
+        if mouth_key != self._mouth_key:
+            self._mouth_key = mouth_key
+            self._mouth_params = MouthParams(
+                emotion=state.mouth_emotion,
+                openness=state.mouth_openness,
+            )
+        mouth_params = self._mouth_params
+
+        self._pet_items = self.evolution_renderer.draw_form(
             canvas,
             state.x, state.y,
             state.form_id,
@@ -459,6 +874,82 @@ class BlobRenderer:
             show_sweat=state.show_sweat,
             phase=state.animation_phase,
         )
+        return self._pet_items
+
+    def _draw_pet_image(
+        self,
+        canvas: tk.Canvas,
+        state: PetRenderState,
+    ) -> List[int]:
+        """Draw the main pet sprite as one pre-rendered image item."""
+        key = (
+            canvas.tk,
+            state.form_id,
+            state.eye_emotion,
+            state.eye_openness,
+            state.look_direction,
+            state.mouth_emotion,
+            round(state.mouth_openness, 1),
+            round(state.squash, 2),
+            round(state.stretch, 2),
+            state.show_blush,
+            state.show_sweat,
+        )
+        cached = self._sprite_images.get(key)
+        if cached is None:
+            cached = self._rasterize_pet(canvas, key)
+            if len(self._sprite_images) >= _SPRITE_IMAGE_LIMIT:
+                del self._sprite_images[next(iter(self._sprite_images))]
+            self._sprite_images[key] = cached
+
+        left, top, photo = cached
+        return [canvas.create_image(
+            int(state.x + state.offset_x) + left,
+            int(state.y + state.offset_y) + top,
+            image=photo,
+            anchor=tk.NW,
+        )]
+
+    def _rasterize_pet(self, canvas: tk.Canvas, key: tuple) -> Tuple[int, int, Any]:
+        """
+        Render a pet sprite into a PhotoImage.
+
+        Args:
+            canvas: Canvas the image will be shown on.
+            key: Sprite image key built by ``_draw_pet_image``.
+
+        Returns:
+            Tuple of (left, top, photo), offsets relative to the pet's center.
+        """
+        (
+            _, form_id, eye_emotion, eye_openness, look_direction,
+            mouth_emotion, mouth_openness, squash, stretch,
+            show_blush, show_sweat,
+        ) = key
+
+        if self._sprite_renderer is None:
+            self._sprite_renderer = EvolutionSpriteRenderer()
+        recorder = _SpriteRecorder()
+        self._sprite_renderer.draw_form(
+            recorder,
+            0.0, 0.0,
+            form_id,
+            animation=AnimationParams(squash=squash, stretch=stretch),
+            eye_params=EyeParams(
+                emotion=eye_emotion,
+                openness=eye_openness,
+                direction=look_direction,
+            ),
+            mouth_params=MouthParams(emotion=mouth_emotion, openness=mouth_openness),
+            show_blush=show_blush,
+            show_sweat=show_sweat,
+        )
+        shapes = recorder.shapes()
+        # Release the face items the shared expression renderer keeps
+        self._sprite_renderer.clear(recorder)
+
+        left, top, image = rasterize_shapes(shapes)
+        return left, top, ImageTk.PhotoImage(image, master=canvas)
 
     def _draw_foreground_effects(
         self,
@@ -467,33 +958,35 @@ class BlobRenderer:
     ) -> List[int]:
         """Draw effects that appear in front of the pet."""
         items = []
+        extend = items.extend
+        phase = state.animation_phase
 
         x = state.x + state.offset_x
         y = state.y + state.offset_y
 
         # Hearts (happy state)
         if state.show_hearts:
-            items.extend(draw_hearts(canvas, x, y - 40, 3, 50.0, state.animation_phase))
+            extend(draw_hearts(canvas, x, y - 40, 3, 50.0, phase))
 
         # ZZZ (sleeping)
         if state.show_zzz:
-            items.extend(draw_zzz(canvas, x + 35, y - 30, state.animation_phase))
+            extend(draw_zzz(canvas, x + 35, y - 30, phase))
 
         # Sparkles (playing/trick)
         if state.show_sparkles:
-            items.extend(draw_sparkles(canvas, x, y, 5, 55.0, state.animation_phase))
+            extend(draw_sparkles(canvas, x, y, 5, 55.0, phase))
 
         # Music notes (playing)
         if state.show_music:
-            items.extend(draw_music_notes(canvas, x, y - 30, 3, state.animation_phase))
+            extend(draw_music_notes(canvas, x, y - 30, 3, phase))
 
         # Sweat drops (hungry/tired)
         if state.show_sweat and (state.is_hungry or state.is_tired):
-            items.extend(draw_sweat_drops(canvas, x + 25, y - 25, 2, state.animation_phase))
+            extend(draw_sweat_drops(canvas, x + 25, y - 25, 2, phase))
 
         # Food crumbs (eating)
-        if state.render_state == RenderState.EATING:
-            items.extend(draw_food_crumbs(canvas, x, y + 20, 4, state.animation_phase))
+        if state.render_state is RenderState.EATING:
+            extend(draw_food_crumbs(canvas, x, y + 20, 4, phase))
 
         return items
 
@@ -516,15 +1009,83 @@ class BlobRenderer:
             opacity=state.thought_opacity,
         )
 
+    def _layer(self, canvas: tk.Canvas, key: str) -> _RenderLayer:
+        """Get a persistent render layer, ready to draw a frame on ``canvas``."""
+        layer = self._layers.get(key)
+        if layer is None:
+            layer = _RenderLayer(f"{self.tag}_{key}", self.tag)
+            self._layers[key] = layer
+        return layer.begin(canvas)
+
+    def _offscreen(self, canvas: tk.Canvas, state: PetRenderState) -> bool:
+        """Check whether the pet and its effects lie outside the canvas."""
+        if canvas is not self._view_canvas:
+            self._watch_viewport(canvas)
+        if self._view_width <= 1:
+            # Not mapped yet, so the size is unknown
+            return False
+
+        reach = _CULL_RADIUS * self._appearance(state.form_id)[0].scale + _EFFECT_REACH
+        x = state.x + state.offset_x
+        y = state.y + state.offset_y
+        return (
+            x + reach < 0
+            or x - reach > self._view_width
+            or y + reach < 0
+            or y - reach > self._view_height
+        )
+
+    def _watch_viewport(self, canvas: tk.Canvas) -> None:
+        """Cache the canvas size and keep it current on resize."""
+        self._unwatch_viewport()
+        self._view_canvas = canvas
+        self._view_width = canvas.winfo_width()
+        self._view_height = canvas.winfo_height()
+        self._view_binding = canvas.bind("<Configure>", self._on_configure, add="+")
+
+    def _unwatch_viewport(self) -> None:
+        """Stop tracking the size of the watched canvas."""
+        if self._view_binding is not None:
+            unbind_handler(self._view_canvas, "<Configure>", self._view_binding)
+            self._view_binding = None
+        self._view_canvas = None
+        self._view_width = 0
+        self._view_height = 0
+
+    def _on_configure(self, event: tk.Event) -> None:
+        """Track the canvas viewport size for offscreen culling."""
+        if event.widget is self._view_canvas:
+            self._view_width = event.width
+            self._view_height = event.height
+
+    def _frame_intact(self, canvas: tk.Canvas) -> bool:
+        """Check that the last frame was not deleted from the canvas since."""
+        shadow = self._layers.get("shadow")
+        return shadow is not None and bool(shadow.items) and bool(canvas.type(shadow.tag))
+
+    def _release_layers(self) -> None:
+        """Delete the persistent layer items and last frame's pet items."""
+        canvas = self._layer_canvas
+        if canvas is None:
+            return
+        # All layer items carry the renderer's tag
+        canvas.delete(self.tag, *self._pet_items)
+        for layer in self._layers.values():
+            layer.forget()
+        self._pet_items = []
+
     def clear(self, canvas: tk.Canvas) -> None:
-        """Clear all rendered items from canvas."""
-        for item_id in self._canvas_items:
-            canvas.delete(item_id)
+        """Clear all rendered items from canvas, including persistent ones."""
+        self._release_layers()
+        self._last_fingerprint = None
         self._canvas_items.clear()
 
-        for item_id in self._effect_items:
-            canvas.delete(item_id)
-        self._effect_items.clear()
+        if self._effect_items:
+            canvas.delete(*self._effect_items)
+            self._effect_items.clear()
+
+        self.evolution_renderer.clear(canvas)
+        self._unwatch_viewport()
 
     def update_idle_animation(self, delta_time: float) -> Dict[str, float]:
         """
@@ -590,21 +1151,11 @@ def create_simple_render_state(
     eye_params, mouth_params = get_expression_for_mood(mood)
 
     # Convert state string to enum
-    state_map = {
-        "idle": RenderState.IDLE,
-        "walking": RenderState.WALKING,
-        "eating": RenderState.EATING,
-        "playing": RenderState.PLAYING,
-        "sleeping": RenderState.SLEEPING,
-        "happy": RenderState.HAPPY,
-        "trick": RenderState.TRICK,
-    }
-    render_state = state_map.get(state.lower(), RenderState.IDLE)
+    render_state = _PET_STATE_MAP.get(state.upper(), RenderState.IDLE)
 
     # Adjust for state
-    if render_state == RenderState.SLEEPING:
-        eye_params.emotion = EyeEmotion.BLINK
-        eye_params.openness = 0.0
+    if render_state is RenderState.SLEEPING:
+        eye_params = replace(eye_params, emotion=EyeEmotion.BLINK, openness=0.0)
 
     return PetRenderState(
         form_id=form_id,
@@ -616,7 +1167,7 @@ def create_simple_render_state(
         eye_openness=eye_params.openness,
         mouth_emotion=mouth_params.emotion,
         mood=mood,
-        show_hearts=(render_state == RenderState.HAPPY),
-        show_zzz=(render_state == RenderState.SLEEPING),
-        show_sparkles=(render_state == RenderState.PLAYING),
+        show_hearts=(render_state is RenderState.HAPPY),
+        show_zzz=(render_state is RenderState.SLEEPING),
+        show_sparkles=(render_state is RenderState.PLAYING),
     )
@@ -14,10 +14,12 @@ Design Philosophy:
 
 from __future__ import annotations
 
+import functools
 import math
+import sys
 import tkinter as tk
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 # Import colors from core config
 try:
@@ -39,7 +41,103 @@ except ImportError:
     class SpritesConfig:
         OUTLINE_WIDTH = 2
 
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
+# Optional vectorized layout for drawing many blobs at once
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _unit_egg_vertex(angle: float) -> Tuple[float, float, float]:
+    """
+    Get one vertex of the unit egg outline.
+
+    Args:
+        angle: Vertex angle in radians.
+
+    Returns:
+        Tuple of (x offset, x offset for skew, y offset); the egg is
+        wider at the bottom, so both x offsets carry the bulge factor.
+    """
+    egg_factor = 1.0 + 0.2 * math.sin(angle)
+    return math.sin(angle) * egg_factor, math.cos(angle) * egg_factor, math.cos(angle)
+
+
+# Egg polygons only scale and translate this outline, so the trig for its
+# vertices runs once at import
+_EGG_POINTS = 24
+_UNIT_EGG = tuple(_unit_egg_vertex(i / _EGG_POINTS * 2 * math.pi) for i in range(_EGG_POINTS))
+
+
+def _egg_points(
+    x: float,
+    y: float,
+    r_x: float,
+    r_y: float,
+    skew: float = 0.0,
+) -> List[float]:
+    """
+    Scale the unit egg into flat polygon coordinates.
+
+    Args:
+        x: Center X.
+        y: Center Y.
+        r_x: Horizontal radius.
+        r_y: Vertical radius.
+        skew: Rotation skew for wobble effect.
+
+    Returns:
+        Flat list of x, y coordinates.
+    """
+    # Filled in place, without a temporary pair per vertex
+    points = [0.0] * (_EGG_POINTS * 2)
+    i = 0
+    if not skew:
+        for egg_x, _, egg_y in _UNIT_EGG:
+            points[i] = x + r_x * egg_x
+            points[i + 1] = y + r_y * egg_y
+            i += 2
+        return points
+
+    # sin(angle + skew) expands into the cached sin/cos terms
+    skew_cos = math.cos(skew)
+    skew_sin = math.sin(skew)
+    for egg_x, egg_x_skew, egg_y in _UNIT_EGG:
+        points[i] = x + r_x * (egg_x * skew_cos + egg_x_skew * skew_sin)
+        points[i + 1] = y + r_y * egg_y
+        i += 2
+    return points
+
+
+# Half-widths the egg outline reaches left and right of its center, for
+# drawing it as a plain oval
+_EGG_LEFT = 0.8
+_EGG_RIGHT = 1.2
+
+
+# Two-digit hex string for each channel value, for building colors
+_HEX_BYTES = tuple(f"{value:02x}" for value in range(256))
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_hex(hex_color: str) -> Tuple[int, int, int]:
+    """
+    Parse a hex color into its RGB channels.
+
+    Args:
+        hex_color: Color in "#RRGGBB" format.
+
+    Returns:
+        Tuple of (r, g, b) channel values.
+    """
+    hex_color = hex_color.lstrip("#")
+    return int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
+
+
+@functools.lru_cache(maxsize=1024)
 def darken_color(hex_color: str, factor: float = 0.85) -> str:
     """
     Darken a hex color by a factor.
@@ -51,16 +149,14 @@ def darken_color(hex_color: str, factor: float = 0.85) -> str:
     Returns:
         Darkened hex color string.
     """
-    hex_color = hex_color.lstrip("#")
-    r = int(hex_color[0:2], 16)
-    g = int(hex_color[2:4], 16)
-    b = int(hex_color[4:6], 16)
+    r, g, b = _parse_hex(hex_color)
     r = int(r * factor)
     g = int(g * factor)
     b = int(b * factor)
-    return f"#{r:02x}{g:02x}{b:02x}"
+    return "#" + _HEX_BYTES[r] + _HEX_BYTES[g] + _HEX_BYTES[b]
 
 
+@functools.lru_cache(maxsize=1024)
 def lighten_color(hex_color: str, factor: float = 0.3) -> str:
     """
     Lighten a hex color by a factor.
@@ -72,16 +168,32 @@ def lighten_color(hex_color: str, factor: float = 0.3) -> str:
     Returns:
         Lightened hex color string.
     """
-    hex_color = hex_color.lstrip("#")
-    r = int(hex_color[0:2], 16)
-    g = int(hex_color[2:4], 16)
-    b = int(hex_color[4:6], 16)
+    r, g, b = _parse_hex(hex_color)
     r = min(255, int(r + (255 - r) * factor))
     g = min(255, int(g + (255 - g) * factor))
     b = min(255, int(b + (255 - b) * factor))
-    return f"#{r:02x}{g:02x}{b:02x}"
+    return "#" + _HEX_BYTES[r] + _HEX_BYTES[g] + _HEX_BYTES[b]
+
+
+@functools.lru_cache(maxsize=32)
+def _egg_palette(body_color: str) -> Tuple[str, str, str]:
+    """
+    Get the fixed-factor shades an egg draws every frame.
+
+    Args:
+        body_color: Egg body color in "#RRGGBB" format.
 
+    Returns:
+        Tuple of (outline, highlight, crack) hex colors.
+    """
+    return (
+        darken_color(body_color, 0.85),
+        lighten_color(body_color, 0.3),
+        darken_color(body_color, 0.7),
+    )
 
+
+@functools.lru_cache(maxsize=1024)
 def blend_colors(color1: str, color2: str, ratio: float = 0.5) -> str:
     """
     Blend two hex colors together.
@@ -94,21 +206,21 @@ def blend_colors(color1: str, color2: str, ratio: float = 0.5) -> str:
     Returns:
         Blended hex color string.
     """
-    c1 = color1.lstrip("#")
-    c2 = color2.lstrip("#")
-    r1, g1, b1 = int(c1[0:2], 16), int(c1[2:4], 16), int(c1[4:6], 16)
-    r2, g2, b2 = int(c2[0:2], 16), int(c2[2:4], 16), int(c2[4:6], 16)
+    r1, g1, b1 = _parse_hex(color1)
+    r2, g2, b2 = _parse_hex(color2)
     r = int(r1 * (1 - ratio) + r2 * ratio)
     g = int(g1 * (1 - ratio) + g2 * ratio)
     b = int(b1 * (1 - ratio) + b2 * ratio)
-    return f"#{r:02x}{g:02x}{b:02x}"
+    return "#" + _HEX_BYTES[r] + _HEX_BYTES[g] + _HEX_BYTES[b]
 
 
-@dataclass
+@dataclass(frozen=True)
 class BlobColors:
     """
     Color scheme for a blob sprite.
 
+    Schemes are immutable so the derived ones can be cached and shared.
+
     Attributes:
         primary: Main body color.
         secondary: Secondary/accent color.
@@ -123,6 +235,7 @@ class BlobColors:
     outline: str = "#A890B0"
 
     @classmethod
+    @functools.lru_cache(maxsize=64)
     def from_primary(cls, primary: str) -> BlobColors:
         """
         Create a color scheme from a primary color.
@@ -144,6 +257,7 @@ class BlobColors:
         )
 
     @classmethod
+    @functools.lru_cache(maxsize=64)
     def from_form_id(cls, form_id: str) -> BlobColors:
         """
         Create a color scheme from a form ID.
@@ -166,7 +280,12 @@ class BlobColors:
         return cls.from_primary(Colors.SOFT_PURPLE)
 
 
-@dataclass
+# Derive every known form's scheme up front
+for _form_id in FORM_COLORS:
+    BlobColors.from_form_id(_form_id)
+
+
+@dataclass(**_SLOTS)
 class AnimationParams:
     """
     Animation parameters for blob deformation.
@@ -190,6 +309,116 @@ class AnimationParams:
     wobble_phase: float = 0.0
 
 
+class _SpriteItems:
+    """
+    Canvas items a sprite keeps across frames, one per drawing role.
+
+    A draw places its roles bottom to top between ``begin`` and
+    ``finish``: an item drawn on the previous frame is moved with
+    ``coords`` (and reconfigured only when its options changed), a missing
+    one (or one drawn as a different kind of item) is created, and items
+    whose role was not drawn are deleted.
+    """
+
+    __slots__ = ("canvas", "items", "styles", "placed", "created", "drawn")
+
+    def __init__(self) -> None:
+        self.canvas: Optional[tk.Canvas] = None
+        self.items: Dict[str, int] = {}
+        self.styles: Dict[str, Tuple[str, dict]] = {}
+        self.placed: List[str] = []
+        self.created: set = set()
+        self.drawn: List[int] = []
+
+    def begin(self, canvas: tk.Canvas) -> None:
+        """Start placing a frame's items on ``canvas``."""
+        items = self.items
+        if items and canvas is not self.canvas:
+            self.release()
+        elif items and not canvas.type(next(iter(items.values()))):
+            # Deleted behind the sprite's back; nothing left to reuse
+            items.clear()
+            self.styles.clear()
+        self.canvas = canvas
+        self.placed.clear()
+        self.created.clear()
+
+    def place(self, role: str, kind: str, coords: tuple, options: dict) -> int:
+        """
+        Draw the item for a role, reusing last frame's item when there is one.
+
+        Args:
+            role: Name of the part being drawn.
+            kind: Canvas item type ("oval", "polygon", "line").
+            coords: Item coordinates.
+            options: Item options.
+
+        Returns:
+            Canvas item ID for the role.
+        """
+        self.placed.append(role)
+        item_id = self.items.get(role)
+        if item_id is not None:
+            old_kind, old_options = self.styles[role]
+            if kind == old_kind:
+                self.canvas.coords(item_id, *coords)
+                if options != old_options:
+                    self.canvas.itemconfigure(item_id, **options)
+                    self.styles[role] = (kind, options)
+                return item_id
+            # Now drawn as another kind of item (e.g. an egg body switched
+            # between polygon and oval), which can't take its options
+            self.canvas.delete(item_id)
+
+        item_id = getattr(self.canvas, "create_" + kind)(*coords, **options)
+        self.items[role] = item_id
+        self.styles[role] = (kind, options)
+        self.created.add(role)
+        return item_id
+
+    def finish(self) -> List[int]:
+        """
+        Delete the items not drawn this frame.
+
+        Returns:
+            IDs of the items drawn this frame, bottom first.
+        """
+        items = self.items
+        placed = self.placed
+        if len(items) > len(placed):
+            stale = [role for role in items if role not in placed]
+            self.canvas.delete(*[items.pop(role) for role in stale])
+            for role in stale:
+                del self.styles[role]
+
+        drawn = self.drawn = [items[role] for role in placed]
+        created = self.created
+        if created and len(created) < len(placed):
+            # A new item went on top; restack if it belongs below a kept one
+            first_new = min(placed.index(role) for role in created)
+            if any(role not in created for role in placed[first_new:]):
+                for item_id in drawn:
+                    self.canvas.tag_raise(item_id)
+        return list(drawn)
+
+    def keep(self) -> List[int]:
+        """
+        Keep the last frame's items unchanged instead of placing them.
+
+        Returns:
+            IDs of the items drawn last frame, bottom first.
+        """
+        return list(self.drawn)
+
+    def release(self) -> None:
+        """Delete all of the sprite's items."""
+        if self.items:
+            self.canvas.delete(*self.items.values())
+            self.items.clear()
+            self.styles.clear()
+        self.drawn = []
+
+
 class BlobSprite:
     """
     A simple, expressive blob sprite.
@@ -198,10 +427,15 @@ class BlobSprite:
     The blob uses simple shapes (ovals) with gradient-like shading
     achieved through layered ovals.
 
+    By default every draw creates new items that the caller owns. A
+    persistent sprite instead keeps its items and moves them on each draw
+    until ``clear``; it then draws one blob, on one canvas, at a time.
+
     Attributes:
         base_width: Base width of the blob.
         base_height: Base height of the blob.
         colors: Color scheme for the blob.
+        high_quality: Whether eggs are smoothed polygons rather than ovals.
     """
 
     def __init__(
@@ -209,6 +443,8 @@ class BlobSprite:
         base_width: float = 60.0,
         base_height: float = 50.0,
         colors: Optional[BlobColors] = None,
+        persistent: bool = False,
+        high_quality: bool = True,
     ) -> None:
         """
         Initialize the blob sprite.
@@ -217,16 +453,35 @@ class BlobSprite:
             base_width: Base width of the blob in pixels.
             base_height: Base height of the blob in pixels.
             colors: Color scheme for the blob.
+            persistent: Whether to reuse the canvas items across draws.
+            high_quality: Whether to draw eggs as smoothed polygons; if
+                False, each egg body is one plain oval.
         """
         self.base_width = base_width
         self.base_height = base_height
         self.colors = colors or BlobColors()
         self._canvas_items: List[int] = []
+        self._items: Optional[_SpriteItems] = _SpriteItems() if persistent else None
+        self.high_quality = high_quality
+
+        # Last deformation and its size, for idle blobs drawn unchanged
+        self._last_params: Optional[Tuple[float, float, float, float]] = None
+        self._last_dims: Tuple[float, float] = (0.0, 0.0)
+        # Geometry of the last persistent draw, to skip redrawing it
+        self._last_draw: Optional[tuple] = None
+
+    def _place(self, canvas: tk.Canvas, role: str, kind: str, *coords, **options) -> int:
+        """Create an item, or move the persistent one drawn for ``role``."""
+        if self._items is None:
+            return getattr(canvas, "create_" + kind)(*coords, **options)
+        return self._items.place(role, kind, coords, options)
 
     def apply_squash_stretch(
         self,
         squash: float = 0.0,
         stretch: float = 0.0,
+        base_width: Optional[float] = None,
+        base_height: Optional[float] = None,
     ) -> Tuple[float, float]:
         """
         Calculate dimensions with squash/stretch applied.
@@ -237,10 +492,20 @@ class BlobSprite:
         Args:
             squash: Squash amount (0.0-1.0).
             stretch: Stretch amount (0.0-1.0).
+            base_width: Undeformed width, or None for the sprite's own.
+            base_height: Undeformed height, or None for the sprite's own.
 
         Returns:
             Tuple of (width, height) after deformation.
         """
+        if base_width is None:
+            base_width = self.base_width
+        if base_height is None:
+            base_height = self.base_height
+        params = (squash, stretch, base_width, base_height)
+        if params == self._last_params:
+            return self._last_dims
+
         # Squash: compress height, expand width (volume preservation)
         squash_factor = 1.0 - squash * 0.4  # Max 40% height reduction
         stretch_factor = 1.0 - stretch * 0.3  # Max 30% height reduction for stretch
@@ -254,10 +519,12 @@ class BlobSprite:
             height_factor *= (1.0 + stretch * 0.3)
             width_factor *= (1.0 - stretch * 0.15)
 
-        width = self.base_width * width_factor
-        height = self.base_height * height_factor
+        width = base_width * width_factor
+        height = base_height * height_factor
 
-        return width, height
+        self._last_params = params
+        self._last_dims = (width, height)
+        return self._last_dims
 
     def draw(
         self,
@@ -268,10 +535,16 @@ class BlobSprite:
         scale_y: float = 1.0,
         rotation: float = 0.0,
         animation: Optional[AnimationParams] = None,
+        base_width: Optional[float] = None,
+        base_height: Optional[float] = None,
+        colors: Optional[BlobColors] = None,
     ) -> List[int]:
         """
         Draw the blob sprite on a canvas.
 
+        Passing base_width, base_height and colors draws without reading
+        the sprite's own settings, so one sprite can serve many forms.
+
         Args:
             canvas: Tkinter canvas to draw on.
             x: Center X coordinate.
@@ -280,12 +553,16 @@ class BlobSprite:
             scale_y: Vertical scale multiplier.
             rotation: Rotation angle in radians (limited support).
             animation: Animation parameters for deformation.
+            base_width: Undeformed width, or None for the sprite's own.
+            base_height: Undeformed height, or None for the sprite's own.
+            colors: Color scheme, or None for the sprite's own.
 
         Returns:
             List of canvas item IDs created.
         """
         self._canvas_items.clear()
         animation = animation or AnimationParams()
+        colors = colors or self.colors
 
         # Apply animation parameters
         squash = animation.squash
@@ -293,7 +570,7 @@ class BlobSprite:
         total_scale = animation.scale
 
         # Calculate deformed dimensions
-        width, height = self.apply_squash_stretch(squash, stretch)
+        width, height = self.apply_squash_stretch(squash, stretch, base_width, base_height)
         width *= scale_x * total_scale
         height *= scale_y * total_scale
 
@@ -310,33 +587,44 @@ class BlobSprite:
 
         # Draw the blob (bottom to top for proper layering)
         items = []
+        if self._items is not None:
+            self._items.begin(canvas)
+            # An idle blob keeps its items exactly where they are
+            geometry = (x, y, width, height, colors)
+            if geometry == self._last_draw and self._items.items:
+                self._canvas_items = self._items.keep()
+                return self._canvas_items
+            self._last_draw = geometry
 
         # Shadow layer (slightly larger, at bottom)
         shadow_y = y + height * 0.05
-        shadow_id = canvas.create_oval(
+        shadow_id = self._place(
+            canvas, "shadow", "oval",
             x - width * 0.48, shadow_y - height * 0.45,
             x + width * 0.48, shadow_y + height * 0.48,
-            fill=self.colors.shadow,
+            fill=colors.shadow,
             outline="",
         )
         items.append(shadow_id)
 
         # Main body
-        body_id = canvas.create_oval(
+        body_id = self._place(
+            canvas, "body", "oval",
             x - width * 0.5, y - height * 0.5,
             x + width * 0.5, y + height * 0.5,
-            fill=self.colors.primary,
-            outline=self.colors.outline,
+            fill=colors.primary,
+            outline=colors.outline,
             width=SpritesConfig.OUTLINE_WIDTH,
         )
         items.append(body_id)
 
         # Highlight layer (smaller oval at top)
         highlight_y = y - height * 0.15
-        highlight_id = canvas.create_oval(
+        highlight_id = self._place(
+            canvas, "highlight", "oval",
             x - width * 0.35, highlight_y - height * 0.25,
             x + width * 0.35, highlight_y + height * 0.15,
-            fill=self.colors.highlight,
+            fill=colors.highlight,
             outline="",
         )
         items.append(highlight_id)
@@ -345,7 +633,8 @@ class BlobSprite:
         spec_x = x - width * 0.15
         spec_y = y - height * 0.25
         spec_size = min(width, height) * 0.08
-        spec_id = canvas.create_oval(
+        spec_id = self._place(
+            canvas, "specular", "oval",
             spec_x - spec_size, spec_y - spec_size * 0.7,
             spec_x + spec_size, spec_y + spec_size * 0.7,
             fill=Colors.WHITE,
@@ -353,6 +642,98 @@ class BlobSprite:
         )
         items.append(spec_id)
 
+        if self._items is not None:
+            self._items.finish()
+        self._canvas_items = items
+        return items
+
+    def draw_batch(
+        self,
+        canvas: tk.Canvas,
+        xs: Sequence[float],
+        ys: Sequence[float],
+        animations: Sequence[Optional[AnimationParams]],
+    ) -> List[int]:
+        """
+        Draw many blobs at once.
+
+        Equivalent to calling ``draw`` for each blob in order with the
+        sprite's own size and colors. When NumPy is available (and the
+        sprite is not persistent) the deformation, wobble and oval bounds
+        of all blobs are computed in one vectorized pass, leaving only the
+        ``create_oval`` calls per blob.
+
+        Args:
+            canvas: Tkinter canvas to draw on.
+            xs: Center X of each blob.
+            ys: Center Y of each blob.
+            animations: Animation parameters per blob.
+
+        Returns:
+            List of canvas item IDs created.
+        """
+        animations = [a or AnimationParams() for a in animations]
+        if np is None or self._items is not None or not animations:
+            items = []
+            for x, y, animation in zip(xs, ys, animations):
+                items.extend(self.draw(canvas, x, y, animation=animation))
+            self._canvas_items = items
+            return items
+
+        # Animation parameters as one array per field
+        squash = np.array([a.squash for a in animations])
+        stretch = np.array([a.stretch for a in animations])
+        wobble = np.array([a.wobble for a in animations])
+        wobble_phase = np.array([a.wobble_phase for a in animations])
+        total_scale = np.array([a.scale for a in animations])
+
+        # Same deformation as apply_squash_stretch
+        squash_factor = 1.0 - squash * 0.4
+        height_factor = squash_factor * (1.0 + stretch * 0.2)
+        width_factor = (1.0 / squash_factor) * (1.0 - stretch * 0.1)
+        stretched = stretch > 0
+        height_factor = np.where(stretched, height_factor * (1.0 + stretch * 0.3), height_factor)
+        width_factor = np.where(stretched, width_factor * (1.0 - stretch * 0.15), width_factor)
+        width = self.base_width * width_factor * total_scale
+        height = self.base_height * height_factor * total_scale
+
+        # Wobble, then position offsets
+        x = np.asarray(xs, dtype=float)
+        y = np.asarray(ys, dtype=float)
+        wobbling = wobble > 0
+        x = np.where(wobbling, x + np.sin(wobble_phase * 2) * wobble * 3, x)
+        y = np.where(wobbling, y + np.cos(wobble_phase * 3) * wobble * 2, y)
+        x = x + np.array([a.offset_x for a in animations])
+        y = y + np.array([a.offset_y for a in animations])
+
+        # Shadow, body, highlight and specular bounds, one row per blob
+        shadow_y = y + height * 0.05
+        highlight_y = y - height * 0.15
+        spec_x = x - width * 0.15
+        spec_y = y - height * 0.25
+        spec_size = np.minimum(width, height) * 0.08
+        rects = np.stack((
+            np.stack((x - width * 0.48, shadow_y - height * 0.45,
+                      x + width * 0.48, shadow_y + height * 0.48), axis=1),
+            np.stack((x - width * 0.5, y - height * 0.5,
+                      x + width * 0.5, y + height * 0.5), axis=1),
+            np.stack((x - width * 0.35, highlight_y - height * 0.25,
+                      x + width * 0.35, highlight_y + height * 0.15), axis=1),
+            np.stack((spec_x - spec_size, spec_y - spec_size * 0.7,
+                      spec_x + spec_size, spec_y + spec_size * 0.7), axis=1),
+        ), axis=1).tolist()
+
+        colors = self.colors
+        outline_width = SpritesConfig.OUTLINE_WIDTH
+        create_oval = canvas.create_oval
+        items = []
+        for shadow, body, highlight, spec in rects:
+            items.append(create_oval(*shadow, fill=colors.shadow, outline=""))
+            items.append(create_oval(
+                *body, fill=colors.primary, outline=colors.outline, width=outline_width
+            ))
+            items.append(create_oval(*highlight, fill=colors.highlight, outline=""))
+            items.append(create_oval(*spec, fill=Colors.WHITE, outline=""))
         self._canvas_items = items
         return items
 
@@ -363,6 +744,7 @@ class BlobSprite:
         y: float,
         scale: float = 1.0,
         animation: Optional[AnimationParams] = None,
+        colors: Optional[BlobColors] = None,
     ) -> List[int]:
         """
         Draw an egg-shaped blob (taller, narrower at top).
@@ -373,12 +755,14 @@ class BlobSprite:
             y: Center Y coordinate.
             scale: Overall scale multiplier.
             animation: Animation parameters.
+            colors: Color scheme, or None for the sprite's own.
 
         Returns:
             List of canvas item IDs created.
         """
         self._canvas_items.clear()
         animation = animation or AnimationParams()
+        colors = colors or self.colors
 
         # Egg dimensions (taller than wide)
         width = self.base_width * 0.8 * scale * animation.scale
@@ -394,38 +778,42 @@ class BlobSprite:
         y += animation.offset_y
 
         items = []
-
-        # Main egg body (use polygon for egg shape)
-        # Create egg shape using bezier-like points
-        points = []
-        num_points = 24
-        for i in range(num_points):
-            angle = (i / num_points) * 2 * math.pi
-            # Egg shape: narrower at top
-            r_x = width * 0.5
-            r_y = height * 0.5
-            # Modify radius based on angle to create egg shape
-            egg_factor = 1.0 + 0.2 * math.sin(angle)  # Wider at bottom
-            px = x + r_x * math.sin(angle) * egg_factor
-            py = y + r_y * math.cos(angle)
-            points.extend([px, py])
-
-        # Draw egg body
-        egg_id = canvas.create_polygon(
-            points,
-            fill=self.colors.primary,
-            outline=self.colors.outline,
-            width=SpritesConfig.OUTLINE_WIDTH,
-            smooth=True,
-        )
+        if self._items is not None:
+            self._items.begin(canvas)
+            self._last_draw = None
+
+        r_x = width * 0.5
+        r_y = height * 0.5
+        if self.high_quality:
+            # Main egg body (use polygon for egg shape)
+            # Scale the unit egg (narrower at top) into bezier-like points
+            egg_id = self._place(
+                canvas, "egg", "polygon",
+                _egg_points(x, y, r_x, r_y),
+                fill=colors.primary,
+                outline=colors.outline,
+                width=SpritesConfig.OUTLINE_WIDTH,
+                smooth=True,
+            )
+        else:
+            # One oval over the egg outline's bounds
+            egg_id = self._place(
+                canvas, "egg", "oval",
+                x - r_x * _EGG_LEFT, y - r_y,
+                x + r_x * _EGG_RIGHT, y + r_y,
+                fill=colors.primary,
+                outline=colors.outline,
+                width=SpritesConfig.OUTLINE_WIDTH,
+            )
         items.append(egg_id)
 
         # Highlight on egg
         highlight_y = y - height * 0.2
-        highlight_id = canvas.create_oval(
+        highlight_id = self._place(
+            canvas, "egg_highlight", "oval",
             x - width * 0.25, highlight_y - height * 0.15,
             x + width * 0.2, highlight_y + height * 0.1,
-            fill=self.colors.highlight,
+            fill=colors.highlight,
             outline="",
         )
         items.append(highlight_id)
@@ -434,7 +822,8 @@ class BlobSprite:
         spec_x = x - width * 0.1
         spec_y = y - height * 0.3
         spec_size = min(width, height) * 0.06
-        spec_id = canvas.create_oval(
+        spec_id = self._place(
+            canvas, "egg_specular", "oval",
             spec_x - spec_size, spec_y - spec_size * 0.8,
             spec_x + spec_size, spec_y + spec_size * 0.8,
             fill=Colors.WHITE,
@@ -442,6 +831,8 @@ class BlobSprite:
         )
         items.append(spec_id)
 
+        if self._items is not None:
+            self._items.finish()
         self._canvas_items = items
         return items
 
@@ -452,8 +843,12 @@ class BlobSprite:
         Args:
             canvas: Canvas to clear items from.
         """
-        for item_id in self._canvas_items:
-            canvas.delete(item_id)
+        if self._items is not None:
+            self._items.release()
+            self._last_draw = None
+        else:
+            for item_id in self._canvas_items:
+                canvas.delete(item_id)
         self._canvas_items.clear()
 
 
@@ -555,6 +950,24 @@ def draw_nub_limbs(
     return items
 
 
+def unbind_handler(widget: tk.Misc, sequence: str, funcid: str) -> None:
+    """
+    Remove one handler bound with ``add="+"``, keeping the widget's others.
+
+    ``Misc.unbind`` drops every handler for the sequence before Python 3.13.
+
+    Args:
+        widget: Widget the handler was bound on.
+        sequence: Event sequence, e.g. "<Configure>".
+        funcid: Name returned by ``bind``.
+    """
+    if widget.winfo_exists():
+        script = widget.bind(sequence)
+        kept = [line for line in script.split("\n") if f"[{funcid} " not in line]
+        widget.bind(sequence, "\n".join(kept))
+    widget.deletecommand(funcid)
+
+
 class EggSprite:
     """
     Special sprite for egg stage - oval with cracks and inner glow.
@@ -564,6 +977,8 @@ class EggSprite:
     - Optional crack lines that progress as hatching approaches
     - Inner glow that pulses
     - Wobble animation for anticipation
+
+    Its canvas items are kept and moved on each draw until ``clear``.
     """
 
     def __init__(
@@ -572,6 +987,7 @@ class EggSprite:
         body_color: str = "#FFF8F0",
         accent_color: str = "#FFE8D0",
         size: float = 45.0,
+        high_quality: bool = True,
     ) -> None:
         """
         Initialize the egg sprite.
@@ -581,12 +997,16 @@ class EggSprite:
             body_color: Main egg color.
             accent_color: Accent/highlight color.
             size: Base size of the egg.
+            high_quality: Whether to draw the egg as a smoothed polygon;
+                if False, the egg body is one plain oval.
         """
         self.canvas = canvas
         self.body_color = body_color
         self.accent_color = accent_color
         self.size = size
+        self.high_quality = high_quality
         self.items: List[int] = []
+        self._items = _SpriteItems()
 
     def draw(
         self,
@@ -611,9 +1031,10 @@ class EggSprite:
             scale: Size scale multiplier.
 
         Returns:
-            List of canvas item IDs created.
+            List of canvas item IDs drawn, bottom first.
         """
-        self.clear()
+        self._items.begin(self.canvas)
+        place = self._items.place
 
         # Apply wobble
         if wobble > 0:
@@ -632,55 +1053,56 @@ class EggSprite:
             glow_pulse = 1.0 + math.sin(wobble_phase * 3) * 0.1
             glow_size = max(width, height) * 0.6 * glow_pulse
             glow_color = lighten_color(self.body_color, 0.4 * glow)
-            glow_id = self.canvas.create_oval(
+            place("glow", "oval", (
                 x - glow_size, y - glow_size,
                 x + glow_size, y + glow_size,
-                fill=glow_color,
-                outline="",
-            )
-            self.items.append(glow_id)
-
-        # Create egg shape using polygon for proper egg curve
-        points = self._create_egg_points(x, y, width, height, skew)
+            ), {"fill": glow_color, "outline": ""})
 
         # Main egg body
-        egg_id = self.canvas.create_polygon(
-            points,
-            fill=self.body_color,
-            outline=darken_color(self.body_color, 0.85),
-            width=2,
-            smooth=True,
-        )
-        self.items.append(egg_id)
+        if self.high_quality:
+            # Create egg shape using polygon for proper egg curve
+            points = self._create_egg_points(x, y, width, height, skew)
+            place("egg", "polygon", (points,), {
+                "fill": self.body_color,
+                "outline": _egg_palette(self.body_color)[0],
+                "width": 2,
+                "smooth": True,
+            })
+        else:
+            # One oval over the egg outline's bounds (the skew is too
+            # slight to show on it)
+            place("egg", "oval", (
+                x - width * 0.5 * _EGG_LEFT, y - height * 0.5,
+                x + width * 0.5 * _EGG_RIGHT, y + height * 0.5,
+            ), {
+                "fill": self.body_color,
+                "outline": _egg_palette(self.body_color)[0],
+                "width": 2,
+            })
 
         # Highlight at top
         hl_width = width * 0.4
         hl_height = height * 0.25
         hl_y = y - height * 0.25
-        highlight_id = self.canvas.create_oval(
+        place("highlight", "oval", (
             x - hl_width, hl_y - hl_height,
             x + hl_width, hl_y + hl_height * 0.5,
-            fill=lighten_color(self.body_color, 0.3),
-            outline="",
-        )
-        self.items.append(highlight_id)
+        ), {"fill": _egg_palette(self.body_color)[1], "outline": ""})
 
         # Specular highlight (small white dot)
         spec_x = x - width * 0.2
         spec_y = y - height * 0.3
         spec_size = min(width, height) * 0.08
-        spec_id = self.canvas.create_oval(
+        place("specular", "oval", (
             spec_x - spec_size, spec_y - spec_size * 0.7,
             spec_x + spec_size, spec_y + spec_size * 0.7,
-            fill=Colors.WHITE,
-            outline="",
-        )
-        self.items.append(spec_id)
+        ), {"fill": Colors.WHITE, "outline": ""})
 
         # Draw cracks based on progress
         if crack_progress > 0:
             self._draw_cracks(x, y, width, height, crack_progress)
 
+        self.items = self._items.finish()
         return self.items
 
     def _create_egg_points(
@@ -704,18 +1126,7 @@ class EggSprite:
         Returns:
             List of x, y coordinate pairs.
         """
-        points = []
-        num_points = 24
-
-        for i in range(num_points):
-            angle = (i / num_points) * 2 * math.pi
-            # Egg shape: narrower at top, wider at bottom
-            egg_factor = 1.0 + 0.2 * math.sin(angle)  # Wider at bottom
-            px = x + (width * 0.5) * math.sin(angle + skew) * egg_factor
-            py = y + (height * 0.5) * math.cos(angle)
-            points.extend([px, py])
-
-        return points
+        return _egg_points(x, y, width * 0.5, height * 0.5, skew)
 
     def _draw_cracks(
         self,
@@ -735,7 +1146,8 @@ class EggSprite:
             height: Egg height.
             progress: Crack progress (0.0-1.0).
         """
-        crack_color = darken_color(self.body_color, 0.7)
+        place = self._items.place
+        crack_style = {"fill": _egg_palette(self.body_color)[2], "width": 1}
 
         # Main crack (appears first)
         if progress > 0.1:
@@ -745,12 +1157,7 @@ class EggSprite:
                 x - width * 0.2, y + height * 0.15,
                 x - width * 0.05, y + height * 0.25,
             ]
-            crack1_id = self.canvas.create_line(
-                crack1_points,
-                fill=crack_color,
-                width=1,
-            )
-            self.items.append(crack1_id)
+            place("crack1", "line", (crack1_points,), crack_style)
 
         # Secondary crack (appears at 40%)
         if progress > 0.4:
@@ -759,12 +1166,7 @@ class EggSprite:
                 x + width * 0.05, y - height * 0.05,
                 x + width * 0.15, y + height * 0.1,
             ]
-            crack2_id = self.canvas.create_line(
-                crack2_points,
-                fill=crack_color,
-                width=1,
-            )
-            self.items.append(crack2_id)
+            place("crack2", "line", (crack2_points,), crack_style)
 
         # Branching cracks (appear at 70%)
         if progress > 0.7:
@@ -773,12 +1175,7 @@ class EggSprite:
                 x, y + height * 0.05,
                 x + width * 0.05, y - height * 0.05,
             ]
-            crack3_id = self.canvas.create_line(
-                crack3_points,
-                fill=crack_color,
-                width=1,
-            )
-            self.items.append(crack3_id)
+            place("crack3", "line", (crack3_points,), crack_style)
 
         # Full crack pattern (appears at 90%)
         if progress > 0.9:
@@ -787,15 +1184,9 @@ class EggSprite:
                 x + width * 0.1, y + height * 0.2,
                 x, y + height * 0.35,
             ]
-            crack4_id = self.canvas.create_line(
-                crack4_points,
-                fill=crack_color,
-                width=1,
-            )
-            self.items.append(crack4_id)
+            place("crack4", "line", (crack4_points,), crack_style)
 
     def clear(self) -> None:
         """Clear all canvas items created by this sprite."""
-        for item_id in self.items:
-            self.canvas.delete(item_id)
+        self._items.release()
         self.items.clear()
@@ -0,0 +1,197 @@
+"""
+Tests for canvas item reuse in the graphics module.
+
+Runs the renderer and sprites against a fake canvas that records every
+call, so no display is needed.
+"""
+
+import itertools
+import unittest
+
+from graphics import EggSprite, BlobRenderer, create_simple_render_state
+
+
+class FakeCanvas:
+    """
+    Stand-in for tk.Canvas that keeps items in stacking order.
+
+    Items are kept in a dict in display order (bottom first), so
+    ``tag_raise`` moves an item to the end. Every method call is recorded
+    by name in ``calls``.
+    """
+
+    def __init__(self, width: int = 400, height: int = 400) -> None:
+        self.width = width
+        self.height = height
+        self.items = {}
+        self.calls = []
+        self.bindings = {}
+        self.commands = set()
+        self._ids = itertools.count(1)
+
+    def __getattr__(self, name):
+        if name.startswith("create_"):
+            return lambda *coords, **options: self._create(name[7:], coords, options)
+        raise AttributeError(name)
+
+    def _create(self, kind, coords, options):
+        self.calls.append("create_" + kind)
+        if len(coords) == 1:
+            coords = tuple(coords[0])
+        tags = options.pop("tags", ())
+        if isinstance(tags, str):
+            tags = tuple(tags.split())
+        item_id = next(self._ids)
+        self.items[item_id] = {
+            "type": kind, "coords": list(coords), "tags": tuple(tags), **options
+        }
+        return item_id
+
+    def _find(self, tag_or_id):
+        if isinstance(tag_or_id, int):
+            return [tag_or_id] if tag_or_id in self.items else []
+        if tag_or_id == "all":
+            return list(self.items)
+        return [i for i, item in self.items.items() if tag_or_id in item["tags"]]
+
+    def coords(self, item_id, *coords):
+        self.calls.append("coords")
+        if len(coords) == 1:
+            coords = tuple(coords[0])
+        if coords and item_id in self.items:
+            self.items[item_id]["coords"] = list(coords)
+        return self.items.get(item_id, {}).get("coords", [])
+
+    def itemconfigure(self, tag_or_id, **options):
+        self.calls.append("itemconfigure")
+        for item_id in self._find(tag_or_id):
+            self.items[item_id].update(options)
+
+    def delete(self, *tags_or_ids):
+        self.calls.append("delete")
+        for tag_or_id in tags_or_ids:
+            for item_id in self._find(tag_or_id):
+                del self.items[item_id]
+
+    def type(self, tag_or_id):
+        self.calls.append("type")
+        found = self._find(tag_or_id)
+        return self.items[found[0]]["type"] if found else None
+
+    def addtag_withtag(self, new_tag, tag_or_id):
+        self.calls.append("addtag_withtag")
+        for item_id in self._find(tag_or_id):
+            self.items[item_id]["tags"] += (new_tag,)
+
+    def tag_raise(self, tag_or_id):
+        self.calls.append("tag_raise")
+        for item_id in self._find(tag_or_id):
+            self.items[item_id] = self.items.pop(item_id)
+
+    def bind(self, sequence, func=None, add=None):
+        # Same script layout as Tk, one line per handler
+        if func is None:
+            return "\n".join(self.bindings.get(sequence, []))
+        if isinstance(func, str):
+            self.bindings[sequence] = [line for line in func.split("\n") if line]
+            return None
+        funcid = f"fake{next(self._ids)}{func.__name__}"
+        self.commands.add(funcid)
+        line = f'if {{"[{funcid} %#]" == "break"}} break'
+        if add:
+            self.bindings.setdefault(sequence, []).append(line)
+        else:
+            self.bindings[sequence] = [line]
+        return funcid
+
+    def deletecommand(self, name):
+        self.commands.discard(name)
+
+    def winfo_exists(self):
+        return True
+
+    def winfo_width(self):
+        return self.width
+
+    def winfo_height(self):
+        return self.height
+
+    def update_idletasks(self):
+        pass
+
+
+class BlobRendererReuseTest(unittest.TestCase):
+    """BlobRenderer.render skips unchanged frames and cleans up after itself."""
+
+    def setUp(self):
+        self.canvas = FakeCanvas()
+        self.renderer = BlobRenderer()
+        self.state = create_simple_render_state(x=200, y=200, mood="happy", state="happy")
+        self.state.thought_text = "hi"
+        self.state.thought_opacity = 1.0
+        self.renderer.render(self.canvas, self.state)
+        self.canvas.calls.clear()
+
+    def test_identical_frame_draws_nothing(self):
+        self.renderer.render(self.canvas, self.state)
+        # Only the check that the last frame is still on the canvas
+        self.assertEqual(self.canvas.calls, ["type"])
+
+    def test_changed_field_redraws(self):
+        before = {i: list(item["coords"]) for i, item in self.canvas.items.items()}
+        self.state.x += 10
+        self.renderer.render(self.canvas, self.state)
+        after = {i: item["coords"] for i, item in self.canvas.items.items()}
+        self.assertNotEqual(before, after)
+
+    def test_frame_deleted_behind_renderer_is_redrawn(self):
+        count = len(self.canvas.items)
+        self.canvas.delete("all")
+        self.renderer.render(self.canvas, self.state)
+        self.assertEqual(len(self.canvas.items), count)
+
+    def test_clear_leaves_no_items_or_bindings(self):
+        self.assertTrue(self.canvas.bind("<Configure>"))
+        self.renderer.clear(self.canvas)
+        self.assertEqual(self.canvas.items, {})
+        self.assertEqual(self.canvas.bind("<Configure>"), "")
+        self.assertEqual(self.canvas.commands, set())
+
+
+class EggSpriteStackingTest(unittest.TestCase):
+    """EggSprite keeps its items bottom to top as parts come and go."""
+
+    def assert_stacked(self, canvas, items):
+        stacking = [item_id for item_id in canvas.items if item_id in items]
+        self.assertEqual(stacking, items)
+
+    def test_glow_and_cracks_added_later(self):
+        canvas = FakeCanvas()
+        egg = EggSprite(canvas)
+        plain = egg.draw(100, 100)
+
+        glowing = egg.draw(100, 100, glow=0.5)
+        self.assertEqual(glowing[1:], plain)
+        self.assert_stacked(canvas, glowing)
+
+        cracked = egg.draw(100, 100, glow=0.5, crack_progress=0.8)
+        self.assertEqual(cracked[:len(glowing)], glowing)
+        self.assert_stacked(canvas, cracked)
+
+        # The glow going and coming back still sits below the body
+        egg.draw(100, 100, crack_progress=0.8)
+        self.assert_stacked(canvas, egg.draw(100, 100, glow=0.5, crack_progress=0.8))
+
+    def test_body_kind_change_keeps_order(self):
+        canvas = FakeCanvas()
+        egg = EggSprite(canvas)
+        egg.draw(100, 100, glow=0.5, crack_progress=0.8)
+        egg.high_quality = False
+        items = egg.draw(100, 100, glow=0.5, crack_progress=0.8)
+        self.assertEqual(canvas.items[items[1]]["type"], "oval")
+        self.assertNotIn("smooth", canvas.items[items[1]])
+        self.assert_stacked(canvas, items)
+
+
+if __name__ == "__main__":
+    unittest.main()